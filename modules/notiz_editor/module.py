@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from src.core.data_model import (
     DataModelError,
@@ -29,9 +31,9 @@ class ModuleError(ValueError):
 class ModuleConfig:
     data_path: Path
     default_theme: str
-    themes: Dict[str, Dict[str, str]]
-    templates: List[Dict[str, Any]]
-    ui: Dict[str, Any]
+    themes: Mapping[str, Mapping[str, str]]
+    templates: Tuple[Mapping[str, Any], ...]
+    ui: Mapping[str, Any]
     debug: bool
 
 
@@ -120,9 +122,17 @@ def build_response(
 def load_config(context: Optional[Dict[str, Any]] = None) -> ModuleConfig:
     context = context or {}
     config_path = _resolve_path(context.get("config_path", DEFAULT_CONFIG_PATH))
-    if not config_path.exists():
-        raise ModuleError(f"Konfiguration fehlt: {config_path}")
-    raw = _load_json(config_path)
+    try:
+        file_stat = config_path.stat()
+    except OSError:
+        raise ModuleError(f"Konfiguration fehlt: {config_path}") from None
+    return _load_config_cached(str(config_path), file_stat.st_mtime_ns, file_stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_text: str, mtime_ns: int, size: int) -> ModuleConfig:
+    """Geprüfte Notiz-Konfiguration je (Pfad, mtime, Größe); Vorlagen und UI nur lesbar."""
+    raw = _load_json(Path(path_text))
     data_path = _resolve_path(raw.get("data_path", "data/notiz_editor.json"))
     default_theme = _require_text(raw.get("default_theme"), "default_theme")
     themes = raw.get("themes")
@@ -149,13 +159,22 @@ def load_config(context: Optional[Dict[str, Any]] = None) -> ModuleConfig:
     return ModuleConfig(
         data_path=data_path,
         default_theme=default_theme,
-        themes=themes,
-        templates=templates,
-        ui=ui,
+        themes=_freeze(themes),
+        templates=_freeze(templates),
+        ui=_freeze(ui),
         debug=debug,
     )
 
 
+def _freeze(value: Any) -> Any:
+    # Nur lesbare Kopie der JSON-Daten; Antworten reichen sie ohne weitere Kopie weiter.
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 def handle_action(
     action: str,
     input_data: Dict[str, Any],
@@ -234,9 +253,9 @@ def build_ui(config: ModuleConfig) -> Dict[str, Any]:
     return {
         "themes": list(config.themes.keys()),
         "default_theme": config.default_theme,
-        "menus": config.ui.get("menus", []),
-        "actions": config.ui.get("actions", []),
-        "dashboard_cards": config.ui.get("dashboard_cards", []),
+        "menus": config.ui.get("menus", ()),
+        "actions": config.ui.get("actions", ()),
+        "dashboard_cards": config.ui.get("dashboard_cards", ()),
     }
 
 
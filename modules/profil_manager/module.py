@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from system.permission_guard import PermissionGuardError, require_write_access
 
@@ -25,8 +27,8 @@ class ModuleConfig:
     base_dir: Path
     state_path: Path
     default_theme: str
-    themes: Dict[str, Dict[str, str]]
-    ui: Dict[str, Any]
+    themes: Mapping[str, Mapping[str, str]]
+    ui: Mapping[str, Any]
     debug: bool
 
 
@@ -115,9 +117,17 @@ def build_response(
 def load_config(context: Optional[Dict[str, Any]] = None) -> ModuleConfig:
     context = context or {}
     config_path = _resolve_path(context.get("config_path", DEFAULT_CONFIG_PATH))
-    if not config_path.exists():
-        raise ModuleError(f"Konfiguration fehlt: {config_path}")
-    raw = _load_json(config_path)
+    try:
+        file_stat = config_path.stat()
+    except OSError:
+        raise ModuleError(f"Konfiguration fehlt: {config_path}") from None
+    return _load_config_cached(str(config_path), file_stat.st_mtime_ns, file_stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_text: str, mtime_ns: int, size: int) -> ModuleConfig:
+    """Profil-Konfiguration, einmal je Dateistand geprüft; themes und ui als nur lesbare Werte."""
+    raw = _load_json(Path(path_text))
     base_dir = _resolve_path(raw.get("base_dir", "data/profiles"))
     state_path = _resolve_path(raw.get("state_path", "data/profil_state.json"))
     default_theme = _require_text(raw.get("default_theme"), "default_theme")
@@ -140,12 +150,20 @@ def load_config(context: Optional[Dict[str, Any]] = None) -> ModuleConfig:
         base_dir=base_dir,
         state_path=state_path,
         default_theme=default_theme,
-        themes=themes,
-        ui=ui,
+        themes=_freeze(themes),
+        ui=_freeze(ui),
         debug=debug,
     )
 
 
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 def handle_action(
     action: str,
     input_data: Dict[str, Any],
@@ -223,9 +241,9 @@ def build_ui(config: ModuleConfig) -> Dict[str, Any]:
     return {
         "themes": list(config.themes.keys()),
         "default_theme": config.default_theme,
-        "menus": config.ui.get("menus", []),
-        "actions": config.ui.get("actions", []),
-        "hints": config.ui.get("hints", []),
+        "menus": config.ui.get("menus", ()),
+        "actions": config.ui.get("actions", ()),
+        "hints": config.ui.get("hints", ()),
     }
 
 
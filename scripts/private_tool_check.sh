@@ -63,6 +63,16 @@ step "5/8" "Modulverträge prüfen"
 
 step "6/8" "Funktionstests ausführen"
 PYTEST=("${PYTHON}" -m pytest -q -c config/pytest.ini)
+# Optional parallel: PYTEST_WORKERS=auto (oder Zahl) nutzt pytest-xdist, falls installiert.
+# loadscope hält Tests einer Klasse bzw. Datei in einem Worker: setUpClass-Vorlagen entstehen
+# so nur einmal statt je Worker.
+if [[ -n "${PYTEST_WORKERS:-}" ]]; then
+  if "${PYTHON}" -c 'import xdist' >/dev/null 2>&1; then
+    PYTEST+=(-n "${PYTEST_WORKERS}" --dist loadscope)
+  else
+    echo "Hinweis: pytest-xdist fehlt, Tests laufen seriell." | tee -a "${SUMMARY}"
+  fi
+fi
 if [[ -z "${DISPLAY:-}" ]] && command -v xvfb-run >/dev/null 2>&1; then
   PYTEST=(xvfb-run -a "${PYTEST[@]}")
 fi
@@ -103,8 +103,13 @@ def parse_todo_lines(lines: Iterable[str]) -> List[TodoTask]:
     tasks: List[TodoTask] = []
     current_round_date: str | None = None
     round_locked = False
+    # Regex-Methoden lokal binden: spart je Zeile die globalen Lookups.
+    header_match_line = ROUND_HEADER_PATTERN.match
+    dated_match_line = DATED_TASK_PATTERN.match
+    round_match_line = ROUND_TASK_PATTERN.match
     for line in lines:
-        header_match = ROUND_HEADER_PATTERN.match(line.strip())
+        stripped = line.strip()
+        header_match = header_match_line(stripped)
         if header_match:
             if not round_locked:
                 current_round_date = header_match.group("date")
@@ -113,7 +118,7 @@ def parse_todo_lines(lines: Iterable[str]) -> List[TodoTask]:
                 current_round_date = None
             continue
 
-        match = DATED_TASK_PATTERN.match(line)
+        match = dated_match_line(line)
         if match:
             tasks.append(
                 TodoTask(
@@ -127,7 +132,7 @@ def parse_todo_lines(lines: Iterable[str]) -> List[TodoTask]:
             continue
 
         if current_round_date:
-            round_match = ROUND_TASK_PATTERN.match(line.strip())
+            round_match = round_match_line(stripped)
             if round_match:
                 task = _parse_round_task(round_match.group("text"), current_round_date, line)
                 if task:
@@ -155,8 +160,9 @@ def validate_tasks(tasks: Iterable[TodoTask]) -> None:
 
 def parse_done_entries(lines: Iterable[str]) -> set[str]:
     entries: set[str] = set()
+    done_match_line = DONE_ENTRY_PATTERN.match
     for line in lines:
-        match = DONE_ENTRY_PATTERN.match(line)
+        match = done_match_line(line)
         if match:
             identifier = (
                 f"{match.group('date')}|{match.group('area').strip()}|"
@@ -174,9 +180,13 @@ def archive_done_tasks(
     removed_done_lines = 0
     current_round_date: str | None = None
     round_locked = False
+    header_match_line = ROUND_HEADER_PATTERN.match
+    dated_match_line = DATED_TASK_PATTERN.match
+    round_match_line = ROUND_TASK_PATTERN.match
 
     for line in todo_lines:
-        header_match = ROUND_HEADER_PATTERN.match(line.strip())
+        stripped = line.strip()
+        header_match = header_match_line(stripped)
         if header_match:
             if not round_locked:
                 current_round_date = header_match.group("date")
@@ -186,7 +196,7 @@ def archive_done_tasks(
             updated_todo_lines.append(line)
             continue
 
-        match = DATED_TASK_PATTERN.match(line)
+        match = dated_match_line(line)
         if match:
             task = TodoTask(
                 status=match.group("status"),
@@ -198,7 +208,7 @@ def archive_done_tasks(
         else:
             task = None
             if current_round_date:
-                round_match = ROUND_TASK_PATTERN.match(line.strip())
+                round_match = round_match_line(stripped)
                 if round_match:
                     task = _parse_round_task(round_match.group("text"), current_round_date, line)
                     if task:
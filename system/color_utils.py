@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple
 
 
@@ -25,6 +26,10 @@ def _relative_luminance_component(channel: int) -> float:
     return normalized / 12.92 if normalized <= 0.03928 else ((normalized + 0.055) / 1.055) ** 2.4
 
 
+# Kanalwerte 0..255 einmal vorberechnen: spart pow(x, 2.4) je Farbe und Kanal.
+_CHANNEL_LUMINANCE = tuple(_relative_luminance_component(channel) for channel in range(256))
+
+
 def relative_luminance(rgb: Tuple[int, int, int]) -> float:
     """Berechnet die relative Helligkeit einer RGB-Farbe."""
     r, g, b = rgb
@@ -35,10 +40,20 @@ def relative_luminance(rgb: Tuple[int, int, int]) -> float:
     )
 
 
+@lru_cache(maxsize=256)
+def _hex_luminance(value: str) -> float:
+    """Helligkeit einer Hex-Farbe über die Kanaltabelle (Theme-Farben wiederholen sich)."""
+    r, g, b = parse_hex_color(value)
+    table = _CHANNEL_LUMINANCE
+    return 0.2126 * table[r] + 0.7152 * table[g] + 0.0722 * table[b]
+
+
 def contrast_ratio(color_a: str, color_b: str) -> float:
     """Berechnet den Kontrast zwischen zwei Hex-Farben."""
-    lum_a = relative_luminance(parse_hex_color(color_a))
-    lum_b = relative_luminance(parse_hex_color(color_b))
+    if not isinstance(color_a, str) or not isinstance(color_b, str):
+        raise ValueError("Farbwert ist kein Text.")
+    lum_a = _hex_luminance(color_a)
+    lum_b = _hex_luminance(color_b)
     high = max(lum_a, lum_b)
     low = min(lum_a, lum_b)
     return (high + 0.05) / (low + 0.05)
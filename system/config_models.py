@@ -25,21 +25,21 @@ class ModulesConfigModel:
     modules: List[ModuleEntryModel]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThemeConfig:
     name: str
     label: str
     colors: Dict[str, str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GuiTextSpacingConfig:
     before: int
     line: int
     after: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GuiLayoutConfig:
     gap_xs: int
     gap_sm: int
@@ -56,7 +56,7 @@ class GuiLayoutConfig:
     focus_thickness: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GuiConfigModel:
     default_theme: str
     themes: Dict[str, ThemeConfig]
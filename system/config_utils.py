@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Type
+from typing import List, Type
 
 
 def ensure_path(path: Path, label: str, error_cls: Type[Exception]) -> None:
@@ -14,6 +14,34 @@ def ensure_path(path: Path, label: str, error_cls: Type[Exception]) -> None:
         raise error_cls(f"{label} ist kein Pfad (Path).")
 
 
+def require_text(value: object, label: str, error_cls: Type[Exception]) -> str:
+    """Gibt nicht-leeren Text ohne Randleerzeichen zurück."""
+    if not isinstance(value, str) or not value.strip():
+        raise error_cls(f"{label} ist leer oder ungültig.")
+    return value.strip()
+
+
+def require_text_list(value: object, label: str, error_cls: Type[Exception]) -> List[str]:
+    """Gibt eine Liste nicht-leerer Texte (ohne Randleerzeichen) zurück."""
+    if not isinstance(value, list):
+        raise error_cls(f"{label} ist keine Liste.")
+    items: List[str] = []
+    for entry in value:
+        if not isinstance(entry, str) or not entry.strip():
+            raise error_cls(f"{label} enthält ungültige Einträge.")
+        items.append(entry.strip())
+    return items
+
+
+def require_int_min(value: object, label: str, minimum: int, error_cls: Type[Exception]) -> int:
+    """Gibt eine ganze Zahl >= minimum zurück (bool zählt nicht als Zahl)."""
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise error_cls(f"{label} ist keine Zahl.")
+    if value < minimum:
+        raise error_cls(f"{label} muss mindestens {minimum} sein.")
+    return value
+
+
 def load_json(
     path: Path,
     error_cls: Type[Exception],
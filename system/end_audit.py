@@ -48,8 +48,8 @@ def run_end_audit(root: Path) -> AuditReport:
         issues.append(AuditIssue(message=issue.message, severity=issue.severity))
 
     config = todo_manager.load_config(root_dir / "config" / "todo_config.json")
-    lines = todo_manager.read_todo_lines(root_dir / config.todo_path)
-    progress = todo_manager.calculate_progress(lines)
+    blob = todo_manager.read_todo_bytes(root_dir / config.todo_path)
+    progress = todo_manager.progress_from_bytes(blob)
     open_tasks = max(progress.total - progress.done, 0)
     if open_tasks > 0:
         issues.append(
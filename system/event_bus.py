@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from logging_center import get_logger
 
@@ -14,6 +14,8 @@ class EventBusError(ValueError):
 
 
 Subscriber = Callable[["Event"], None]
+# Abonnement auf diesen Namen erhält jedes Event.
+WILDCARD = "*"
 
 
 @dataclass(frozen=True)
@@ -44,23 +46,27 @@ def _utc_now() -> str:
 
 class EventBus:
     def __init__(self) -> None:
-        self._subscribers: Dict[str, List[Subscriber]] = {}
+        # Tupel werden beim (Ab-)Melden ersetzt; emit liest sie ohne Kopie.
+        self._subscribers: Dict[str, Tuple[Subscriber, ...]] = {}
         self._logger = get_logger("event_bus")
 
     def subscribe(self, event_name: str, handler: Subscriber) -> None:
         clean_name = _require_text(event_name, "event_name")
         if not callable(handler):
             raise EventBusError("handler ist nicht aufrufbar.")
-        self._subscribers.setdefault(clean_name, []).append(handler)
+        self._subscribers[clean_name] = self._subscribers.get(clean_name, ()) + (handler,)
 
     def unsubscribe(self, event_name: str, handler: Subscriber) -> None:
         clean_name = _require_text(event_name, "event_name")
         if not callable(handler):
             raise EventBusError("handler ist nicht aufrufbar.")
-        handlers = self._subscribers.get(clean_name, [])
+        handlers = self._subscribers.get(clean_name, ())
         if handler in handlers:
-            handlers.remove(handler)
-        if not handlers and clean_name in self._subscribers:
+            index = handlers.index(handler)
+            handlers = handlers[:index] + handlers[index + 1 :]
+            if handlers:
+                self._subscribers[clean_name] = handlers
+        if not handlers:
             self._subscribers.pop(clean_name, None)
 
     def emit(
@@ -78,8 +84,10 @@ class EventBus:
             source=clean_source,
             created_at=_utc_now(),
         )
-        handlers = list(self._subscribers.get(clean_name, []))
-        handlers.extend(self._subscribers.get("*", []))
+        handlers = self._subscribers.get(clean_name, ())
+        wildcard = self._subscribers.get(WILDCARD)
+        if wildcard:
+            handlers += wildcard
         for handler in handlers:
             try:
                 handler(event)
@@ -211,19 +211,22 @@ def _build_simple_pdf(text: str) -> bytes:
         f"{stream}\nendstream\nendobj"
     )
     objects.append("5 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\nendobj")
+    # Teile sammeln und einmal verbinden (kein wiederholtes bytes +=); offset für die xref.
+    parts = [b"%PDF-1.4\n"]
+    offset = len(parts[0])
     xref_positions = []
-    output = "%PDF-1.4\n".encode("utf-8")
     for obj in objects:
-        xref_positions.append(len(output))
-        output += (obj + "\n").encode("utf-8")
-    xref_start = len(output)
-    output += f"xref\n0 {len(objects)+1}\n0000000000 65535 f \n".encode("utf-8")
-    for pos in xref_positions:
-        output += f"{pos:010d} 00000 n \n".encode("utf-8")
-    output += (
-        f"trailer\n<< /Size {len(objects)+1} /Root 1 0 R >>\n" f"startxref\n{xref_start}\n%%EOF\n"
-    ).encode("utf-8")
-    return output
+        xref_positions.append(offset)
+        chunk = (obj + "\n").encode("utf-8")
+        parts.append(chunk)
+        offset += len(chunk)
+    xref_lines = [f"xref\n0 {len(objects)+1}\n0000000000 65535 f \n"]
+    xref_lines.extend(f"{pos:010d} 00000 n \n" for pos in xref_positions)
+    xref_lines.append(
+        f"trailer\n<< /Size {len(objects)+1} /Root 1 0 R >>\nstartxref\n{offset}\n%%EOF\n"
+    )
+    parts.append("".join(xref_lines).encode("utf-8"))
+    return b"".join(parts)
 
 
 def export_zip(files: Iterable[Path], output_dir: Path, base_name: str) -> Path:
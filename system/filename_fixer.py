@@ -5,10 +5,11 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
 from config_utils import ensure_path, load_json
 
@@ -24,6 +25,10 @@ class RenameAction:
 
 
 VALID_NAME = re.compile(r"^[a-z0-9_]+$")
+# Werkzeug- und Cache-Ordner werden nie umbenannt und nicht durchlaufen.
+SKIP_DIRS = frozenset(
+    {".git", "__pycache__", ".venv", "node_modules", ".mypy_cache", ".ruff_cache"}
+)
 
 
 def _require_text(value: object, label: str) -> str:
@@ -70,12 +75,27 @@ def collect_targets(root: Path, folders: Iterable[Path]) -> List[Path]:
         ensure_path(folder, "folder", FilenameFixerError)
         if not folder.exists():
             continue
-        for path in sorted(folder.rglob("*")):
-            if path.is_file():
-                targets.append(path)
+        targets.extend(sorted(map(Path, _iter_file_paths(folder))))
     return targets
 
 
+def _iter_file_paths(folder: Path) -> Iterator[str]:
+    """Liefert Dateipfade unter folder; DirEntry nutzt den d_type-Cache statt je Datei stat."""
+    stack = [os.fspath(folder)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # Wie os.walk: Ordner-Symlinks werden nicht durchlaufen.
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
 def _load_suffix_rules(config_path: Path) -> dict[str, str]:
     try:
         data = load_json(
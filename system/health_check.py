@@ -38,13 +38,22 @@ def _ensure_items(items: Iterable[CheckItem], label: str) -> List[CheckItem]:
     return items_list
 
 
+def _probe(path: Path) -> os.stat_result | None:
+    """Ein stat je Pfad statt exists + is_file/is_dir; None, wenn der Pfad fehlt."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 def _check_dir(
     item: CheckItem,
     issues: List[str],
     repairs: List[str],
     self_repair: bool,
 ) -> None:
-    if not item.path.exists():
+    path_stat = _probe(item.path)
+    if path_stat is None:
         if self_repair:
             try:
                 item.path.mkdir(parents=True, exist_ok=True)
@@ -58,7 +67,7 @@ def _check_dir(
                 return
         issues.append(f"Ordner fehlt: {item.label} ({item.path}).")
         return
-    if not item.path.is_dir():
+    if not stat.S_ISDIR(path_stat.st_mode):
         issues.append(f"Pfad ist kein Ordner: {item.label} ({item.path}).")
 
 
@@ -67,9 +76,10 @@ def _check_file(
     issues: List[str],
     repairs: List[str],
     self_repair: bool,
-    defaults: dict[Path, str],
+    defaults: dict[Path, bytes],
 ) -> None:
-    if not item.path.exists():
+    file_stat = _probe(item.path)
+    if file_stat is None:
         if self_repair:
             default_content = defaults.get(item.path)
             if default_content is None:
@@ -77,7 +87,7 @@ def _check_file(
                 return
             try:
                 item.path.parent.mkdir(parents=True, exist_ok=True)
-                item.path.write_text(default_content, encoding="utf-8")
+                item.path.write_bytes(default_content)
                 logging.info("Self-Repair: Datei erstellt: %s (%s).", item.label, item.path)
                 repairs.append(f"Datei erstellt: {item.label} ({item.path}).")
                 return
@@ -88,14 +98,13 @@ def _check_file(
                 return
         issues.append(f"Datei fehlt: {item.label} ({item.path}).")
         return
-    if not item.path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         issues.append(f"Pfad ist keine Datei: {item.label} ({item.path}).")
         return
     if not os.access(item.path, os.R_OK):
         if self_repair:
             try:
-                mode = item.path.stat().st_mode
-                item.path.chmod(mode | stat.S_IRUSR)
+                item.path.chmod(file_stat.st_mode | stat.S_IRUSR)
                 logging.info("Self-Repair: Leserechte gesetzt: %s (%s).", item.label, item.path)
                 repairs.append(f"Leserechte repariert: {item.label} ({item.path}).")
                 return
@@ -127,14 +136,14 @@ def _check_executable(
     repairs: List[str],
     self_repair: bool,
 ) -> None:
-    if not item.path.exists():
+    file_stat = _probe(item.path)
+    if file_stat is None:
         issues.append(f"Skript fehlt: {item.label} ({item.path}).")
         return
     if not os.access(item.path, os.X_OK):
         if self_repair:
             try:
-                mode = item.path.stat().st_mode
-                item.path.chmod(mode | stat.S_IXUSR)
+                item.path.chmod(file_stat.st_mode | stat.S_IXUSR)
                 logging.info(
                     "Self-Repair: Ausführrechte gesetzt: %s (%s).",
                     item.label,
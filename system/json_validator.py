@@ -25,6 +25,41 @@ class ValidationResult:
     issues: List[str]
 
 
+# Prüfregeln einmal beim Import aufbauen (Muster kompiliert, Labels fertig formatiert).
+MODULE_ID_RE = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+THEME_COLOR_KEYS = (
+    "background",
+    "foreground",
+    "accent",
+    "button_background",
+    "button_foreground",
+    "status_success",
+    "status_error",
+    "status_busy",
+    "status_foreground",
+)
+_LAYOUT_MINIMUMS = tuple(
+    (key, f"layout.{key}", minimum)
+    for key, minimum in (
+        ("gap_xs", 0),
+        ("gap_sm", 0),
+        ("gap_md", 0),
+        ("gap_lg", 0),
+        ("gap_xl", 0),
+        ("button_padx", 0),
+        ("button_pady", 0),
+        ("button_min_width", 0),
+        ("button_font_size", 8),
+        ("field_padx", 0),
+        ("field_pady", 0),
+        ("focus_thickness", 0),
+    )
+)
+_TEXT_SPACING_MINIMUMS = tuple(
+    (key, f"layout.text_spacing.{key}", 0) for key in ("before", "line", "after")
+)
+
+
 def _require_text(value: object, label: str) -> str:
     if not isinstance(value, str) or not value.strip():
         raise JsonValidationError(f"{label} fehlt oder ist leer.")
@@ -50,11 +85,16 @@ def _require_dict(value: object, label: str) -> dict:
 
 
 def _load_json(path: Path) -> dict:
+    """Liest streng als UTF-8-Text wie config_utils.load_json (BOM und UTF-16 gelten als Fehler).
+
+    Bytes lesen und einmal dekodieren spart den Textdatei-Wrapper; json.loads(bytes) würde
+    UTF-16/32 still akzeptieren.
+    """
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(path.read_bytes().decode("utf-8"))
     except OSError as exc:
         raise JsonValidationError(f"JSON ist nicht lesbar: {path}") from exc
-    except json.JSONDecodeError as exc:
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise JsonValidationError(f"JSON ist ungültig: {path}") from exc
 
 
@@ -89,17 +129,7 @@ def validate_launcher_gui_config(data: dict) -> None:
         entry_obj = _require_dict(entry, f"themes.{theme_name}")
         _require_text(entry_obj.get("label"), f"themes.{theme_name}.label")
         colors = _require_dict(entry_obj.get("colors"), f"themes.{theme_name}.colors")
-        for key in (
-            "background",
-            "foreground",
-            "accent",
-            "button_background",
-            "button_foreground",
-            "status_success",
-            "status_error",
-            "status_busy",
-            "status_foreground",
-        ):
+        for key in THEME_COLOR_KEYS:
             _require_text(colors.get(key), f"themes.{theme_name}.colors.{key}")
 
 
@@ -155,7 +185,7 @@ def validate_manifest(data: dict, path: Path) -> None:
 
 def _require_module_id(value: object, label: str) -> str:
     module_id = _require_text(value, label)
-    if not re.fullmatch(r"[a-z0-9]+(?:_[a-z0-9]+)*", module_id):
+    if not MODULE_ID_RE.fullmatch(module_id):
         raise JsonValidationError(f"{label} muss snake_case sein (z. B. modul_name_1).")
     return module_id
 
@@ -177,22 +207,11 @@ def _require_int_min(value: object, label: str, minimum: int) -> int:
 
 
 def _validate_layout(layout: dict) -> None:
-    _require_int_min(layout.get("gap_xs"), "layout.gap_xs", 0)
-    _require_int_min(layout.get("gap_sm"), "layout.gap_sm", 0)
-    _require_int_min(layout.get("gap_md"), "layout.gap_md", 0)
-    _require_int_min(layout.get("gap_lg"), "layout.gap_lg", 0)
-    _require_int_min(layout.get("gap_xl"), "layout.gap_xl", 0)
-    _require_int_min(layout.get("button_padx"), "layout.button_padx", 0)
-    _require_int_min(layout.get("button_pady"), "layout.button_pady", 0)
-    _require_int_min(layout.get("button_min_width"), "layout.button_min_width", 0)
-    _require_int_min(layout.get("button_font_size"), "layout.button_font_size", 8)
-    _require_int_min(layout.get("field_padx"), "layout.field_padx", 0)
-    _require_int_min(layout.get("field_pady"), "layout.field_pady", 0)
-    _require_int_min(layout.get("focus_thickness"), "layout.focus_thickness", 0)
+    for key, label, minimum in _LAYOUT_MINIMUMS:
+        _require_int_min(layout.get(key), label, minimum)
     text_spacing = _require_dict(layout.get("text_spacing"), "layout.text_spacing")
-    _require_int_min(text_spacing.get("before"), "layout.text_spacing.before", 0)
-    _require_int_min(text_spacing.get("line"), "layout.text_spacing.line", 0)
-    _require_int_min(text_spacing.get("after"), "layout.text_spacing.after", 0)
+    for key, label, minimum in _TEXT_SPACING_MINIMUMS:
+        _require_int_min(text_spacing.get(key), label, minimum)
 
 
 VALIDATORS: Dict[str, Callable[[dict], None]] = {
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 import autosave_manager
 import backup_center
@@ -212,24 +212,27 @@ def build_module_lines(
     modules: Iterable[object],
     root: Path,
     debug: bool,
-) -> List[str]:
+) -> Iterator[str]:
+    """Prüft root sofort und liefert die Zeilen danach lazy (any() darf früh abbrechen)."""
     if not isinstance(root, Path):
         raise GuiLauncherError("root ist kein Pfad (Path).")
+    return _iter_module_lines(modules, debug)
 
-    lines: List[str] = []
+
+def _iter_module_lines(modules: Iterable[object], debug: bool) -> Iterator[str]:
+    found = False
     for index, module in enumerate(modules, start=1):
         if not hasattr(module, "name") or not hasattr(module, "module_id"):
             raise GuiLauncherError("Modul-Eintrag ist ungültig.")
+        found = True
         status = "aktiv" if getattr(module, "enabled", False) else "deaktiviert"
-        lines.append(f"{index}. {module.name} ({module.module_id}) – {status}")
-        lines.append(f"   Beschreibung: {module.description}")
+        yield f"{index}. {module.name} ({module.module_id}) – {status}"
+        yield f"   Beschreibung: {module.description}"
         if debug:
-            lines.append(f"   Pfad: {module.path}")
-        lines.append("")
-
-    if not lines:
-        return ["Keine Module gefunden."]
-    return _require_list_of_strings(lines, "module_lines")
+            yield f"   Pfad: {module.path}"
+        yield ""
+    if not found:
+        yield "Keine Module gefunden."
 
 
 def render_module_text(modules: Iterable[object], root: Path, debug: bool) -> str:
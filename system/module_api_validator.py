@@ -4,8 +4,9 @@
 from __future__ import annotations
 
 import ast
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from config_utils import ensure_path
 
@@ -34,10 +35,18 @@ def _assigned_names(node: ast.Assign | ast.AnnAssign) -> set[str]:
     return names
 
 
-def _exported_names(tree: ast.Module) -> set[str]:
+def _scan_body(
+    tree: ast.Module,
+) -> Tuple[set[str], ast.FunctionDef | ast.AsyncFunctionDef | None]:
+    """Ein Durchlauf über die Modulebene: Exporte sammeln und die letzte run-Funktion merken."""
     exports: set[str] = set()
+    run_func = None
     for node in tree.body:
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            exports.add(node.name)
+            if node.name == "run":
+                run_func = node
+        elif isinstance(node, ast.ClassDef):
             exports.add(node.name)
         elif isinstance(node, (ast.Assign, ast.AnnAssign)):
             exports.update(_assigned_names(node))
@@ -45,42 +54,51 @@ def _exported_names(tree: ast.Module) -> set[str]:
             exports.update(alias.asname or alias.name for alias in node.names)
         elif isinstance(node, ast.Import):
             exports.update(alias.asname or alias.name.split(".", 1)[0] for alias in node.names)
-    return exports
+    return exports, run_func
 
 
-def validate_module_api(entry_path: Path) -> List[str]:
+def validate_module_api(entry_path: Path, source: str | bytes | None = None) -> List[str]:
+    """Prüft die Pflicht-Exports; mit source (Quelltext) wird die Datei nicht gelesen."""
     ensure_path(entry_path, "entry_path", ModuleApiError)
+    if source is not None and not isinstance(source, (str, bytes)):
+        raise ModuleApiError("source ist kein Text (str/bytes).")
 
-    if not entry_path.exists():
+    if source is None and not entry_path.exists():
         return [f"Modul-API-Check: Modul-Datei fehlt: {entry_path}."]
     if entry_path.suffix.lower() != ".py":
         return [
             "Modul-API-Check: Entry-Datei ist keine Python-Datei: "
             f"{entry_path.name}."
         ]
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    elif source is None:
+        try:
+            source = entry_path.read_bytes()
+        except OSError:
+            return [
+                f"Modul-API-Check: Modul-Datei kann nicht gelesen werden: {entry_path}."
+            ]
+    issues = _analyze_source(source)
+    if issues is None:
+        return [f"Modul-API-Check: Syntaxfehler in {entry_path}. Bitte Datei prüfen."]
+    return list(issues)
+
+
+@lru_cache(maxsize=256)
+def _analyze_source(source: bytes) -> Tuple[str, ...] | None:
+    """Prüft den Quelltext; gleicher Inhalt wird nur einmal geparst (None = Syntaxfehler)."""
     try:
-        source = entry_path.read_text(encoding="utf-8")
-    except OSError:
-        return [
-            f"Modul-API-Check: Modul-Datei kann nicht gelesen werden: {entry_path}."
-        ]
-    try:
-        tree = ast.parse(source, filename=str(entry_path))
+        tree = ast.parse(source.decode("utf-8"))
     except SyntaxError:
-        return [f"Modul-API-Check: Syntaxfehler in {entry_path}. Bitte Datei prüfen."]
+        return None
 
-    functions = {
-        node.name: node
-        for node in tree.body
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-    }
-    exports = _exported_names(tree)
+    exports, run_func = _scan_body(tree)
     issues: List[str] = []
     for name, message in REQUIRED_FUNCTIONS.items():
         if name not in exports:
             issues.append(f"Modul-API-Check: {message}")
 
-    run_func = functions.get("run")
     if run_func is not None:
         has_args = bool(run_func.args.args)
         has_varargs = run_func.args.vararg is not None
@@ -90,4 +108,4 @@ def validate_module_api(entry_path: Path) -> List[str]:
                 "(input_data = Eingabe)."
             )
 
-    return issues
+    return tuple(issues)
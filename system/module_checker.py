@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List
@@ -25,6 +27,7 @@ from module_registry import (
 from module_registry import (
     resolve_entry_path as registry_resolve_entry_path,
 )
+from store import STORE
 
 CONFIG_DEFAULT = Path(__file__).resolve().parents[1] / "config" / "modules.json"
 STRUCTURE_CONFIG_DEFAULT = Path(__file__).resolve().parents[1] / "config" / "module_structure.json"
@@ -93,13 +96,35 @@ def load_structure_config(
     )
 
 
-def load_modules(config_path: Path) -> List[ModuleEntry]:
-    ensure_path(config_path, "config_path", ModuleCheckError)
+def _read_entries(config_path: Path) -> tuple[ModuleEntry, ...]:
     try:
         registry = load_registry(config_path)
     except ModuleRegistryError as exc:
         raise ModuleCheckError(str(exc)) from exc
-    return registry.entries
+    return tuple(registry.entries)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_entries_cached(
+    config_path: Path, resolved: str, mtime_ns: int, size: int
+) -> tuple[ModuleEntry, ...]:
+    """mtime und Größe im Schlüssel erzwingen Neulesen nach einer Änderung."""
+    return _read_entries(config_path)
+
+
+def load_modules(config_path: Path) -> List[ModuleEntry]:
+    ensure_path(config_path, "config_path", ModuleCheckError)
+    try:
+        file_stat = config_path.stat()
+    except OSError:
+        # Ohne Stempel nicht cachen; die Registry meldet den passenden Fehler.
+        return list(_read_entries(config_path))
+    entries = _read_entries_cached(
+        config_path, os.fspath(config_path.resolve()), file_stat.st_mtime_ns, file_stat.st_size
+    )
+    # Treffer überspringen load_registry; den Store trotzdem auf diese Liste setzen.
+    STORE.set_modules(entries)
+    return list(entries)
 
 
 def load_manifest(module_dir: Path) -> ModuleManifest:
@@ -6,7 +6,7 @@ from __future__ import annotations
 import argparse
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List
 
 import module_checker
 import module_selftests
@@ -35,16 +35,12 @@ def _render_issues(issues: Iterable[str]) -> str:
 
 
 def _append_selftest_issues(
-    modules_config: Path,
-    selftests_config: Path,
+    entries: List[module_checker.ModuleEntry],
+    testcases: Dict[str, Any],
     issues: List[str],
 ) -> None:
-    try:
-        results = module_selftests.run_selftests(modules_config, selftests_config)
-    except module_selftests.ModuleSelftestError as exc:
-        issues.append(f"Selftests konnten nicht ausgeführt werden: {exc}")
-        return
-    for result in results:
+    # Module und Testfälle sind schon geladen; die Selftests lesen die Configs nicht erneut.
+    for result in module_selftests.run_loaded_selftests(entries, testcases):
         if result.status == "fehler":
             issues.append(
                 "Selftest fehlgeschlagen: "
@@ -54,11 +50,13 @@ def _append_selftest_issues(
 
 def run_integration_checks(
     modules_config: Path,
-    selftests_config: Path,
+    selftests_config: Path | Dict[str, Any],
     run_selftests: bool = True,
 ) -> IntegrationResult:
+    """selftests_config: Pfad zur JSON-Datei oder bereits geladene Daten (dict)."""
     ensure_path(modules_config, "modules_config", ModuleIntegrationError)
-    ensure_path(selftests_config, "selftests_config", ModuleIntegrationError)
+    if not isinstance(selftests_config, dict):
+        ensure_path(selftests_config, "selftests_config", ModuleIntegrationError)
 
     try:
         entries = module_checker.load_modules(modules_config)
@@ -66,7 +64,10 @@ def run_integration_checks(
         raise ModuleIntegrationError(str(exc)) from exc
 
     try:
-        testcases = module_selftests.load_test_inputs(selftests_config)
+        if isinstance(selftests_config, dict):
+            testcases = module_selftests.parse_test_inputs(selftests_config)
+        else:
+            testcases = module_selftests.load_test_inputs(selftests_config)
     except module_selftests.ModuleSelftestError as exc:
         raise ModuleIntegrationError(str(exc)) from exc
 
@@ -116,7 +117,7 @@ def run_integration_checks(
 
     issues.extend(module_checker.check_modules(entries))
     if run_selftests:
-        _append_selftest_issues(modules_config, selftests_config, issues)
+        _append_selftest_issues(entries, testcases, issues)
     return IntegrationResult(issues=issues)
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
@@ -17,6 +18,7 @@ from module_loader import MODULE_LOADER, ModuleLoaderError
 
 CONFIG_DEFAULT = Path(__file__).resolve().parents[1] / "config" / "modules.json"
 SELFTEST_DEFAULT = Path(__file__).resolve().parents[1] / "config" / "module_selftests.json"
+SELFTEST_WORKERS = 8
 
 
 class ModuleSelftestError(Exception):
@@ -31,20 +33,24 @@ class SelftestResult:
     message: str
 
 
-def _load_json(path: Path) -> Dict[str, Any]:
+def _load_json(path: Path) -> Any:
     if not path.exists():
         raise ModuleSelftestError(f"Selbsttest-Konfiguration fehlt: {path}")
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
         raise ModuleSelftestError(f"Selbsttest-Konfiguration ist ungültig: {path}") from exc
-    if not isinstance(data, dict):
-        raise ModuleSelftestError("Selbsttest-Konfiguration ist kein Objekt (dict).")
     return data
 
 
 def load_test_inputs(path: Path) -> Dict[str, Any]:
-    data = _load_json(path)
+    return parse_test_inputs(_load_json(path))
+
+
+def parse_test_inputs(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Prüft bereits geladene Selbsttest-Daten (ohne Datei) und liefert die testcases."""
+    if not isinstance(data, dict):
+        raise ModuleSelftestError("Selbsttest-Konfiguration ist kein Objekt (dict).")
     testcases = data.get("testcases")
     if not isinstance(testcases, dict):
         raise ModuleSelftestError("testcases fehlen oder sind ungültig.")
@@ -77,6 +83,38 @@ def run_selftests(
 ) -> List[SelftestResult]:
     testcases = load_test_inputs(selftest_config)
     entries = module_checker.load_modules(modules_config)
+    return run_loaded_selftests(entries, testcases)
+
+
+def _resolve_test_entry(entry: module_checker.ModuleEntry) -> Path | Exception:
+    """Manifest lesen und Entry-Pfad bestimmen; Fehler werden zurückgegeben, nicht geworfen."""
+    try:
+        manifest = module_checker.load_manifest(entry.path)
+        return module_checker.resolve_entry_path(entry.path, manifest.entry)
+    except Exception as exc:
+        return exc
+
+
+def _resolve_test_entries(
+    entries: List[module_checker.ModuleEntry],
+) -> Dict[module_checker.ModuleEntry, Path | Exception]:
+    if len(entries) < 2:
+        return {entry: _resolve_test_entry(entry) for entry in entries}
+    # IO-gebunden (Manifeste lesen): parallel auflösen. Die Module selbst laufen danach
+    # nacheinander, weil Loader, sys.modules und Event-Bus prozessweit geteilt sind.
+    with ThreadPoolExecutor(max_workers=min(SELFTEST_WORKERS, len(entries))) as executor:
+        return dict(zip(entries, executor.map(_resolve_test_entry, entries)))
+
+
+def run_loaded_selftests(
+    entries: Iterable[module_checker.ModuleEntry],
+    testcases: Dict[str, Any],
+) -> List[SelftestResult]:
+    """Führt Selbsttests für bereits geladene Module und Testfälle aus (ohne erneutes Lesen)."""
+    entries = list(entries)
+    entry_paths = _resolve_test_entries(
+        [entry for entry in entries if entry.enabled and testcases.get(entry.module_id) is not None]
+    )
     results: List[SelftestResult] = []
     for entry in entries:
         EVENT_BUS.emit("module_selftest_start", {"module_id": entry.module_id})
@@ -101,9 +139,10 @@ def run_selftests(
                 )
             )
             continue
+        entry_path = entry_paths[entry]
         try:
-            manifest = module_checker.load_manifest(entry.path)
-            entry_path = module_checker.resolve_entry_path(entry.path, manifest.entry)
+            if isinstance(entry_path, Exception):
+                raise entry_path
             _run_module_test(entry_path, entry.module_id, testcase)
         except Exception as exc:
             results.append(
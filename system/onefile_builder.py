@@ -6,7 +6,6 @@ from __future__ import annotations
 import argparse
 import json
 import logging
-import os
 import shutil
 import subprocess
 from dataclasses import dataclass
@@ -93,15 +92,51 @@ def _resolve_repo_path(repo_root: Path, relative: Path) -> Path:
     return repo_root / relative
 
 
-def _build_add_data_args(repo_root: Path, items: Iterable[OnefileDataItem]) -> List[str]:
-    args: List[str] = []
+def _collect_datas(repo_root: Path, items: Iterable[OnefileDataItem]) -> List[tuple[str, str]]:
+    datas: List[tuple[str, str]] = []
     for item in items:
         source_path = _resolve_repo_path(repo_root, Path(item.source))
         if not source_path.exists():
             raise OnefileBuildError(f"add_data-Quelle fehlt: {source_path}")
-        payload = f"{source_path}{os.pathsep}{item.target}"
-        args.extend(["--add-data", payload])
-    return args
+        datas.append((str(source_path), item.target))
+    return datas
+
+
+def build_spec_content(repo_root: Path, config: OnefileConfig) -> str:
+    """Erzeugt die PyInstaller-Spec (ersetzt die lange --add-data/--hidden-import-Liste)."""
+    entry_script = _resolve_repo_path(repo_root, config.entry_script)
+    if not entry_script.exists():
+        raise OnefileBuildError(f"Entry-Script fehlt: {entry_script}")
+    icon = None
+    if config.icon is not None:
+        icon_path = _resolve_repo_path(repo_root, config.icon)
+        if not icon_path.exists():
+            raise OnefileBuildError(f"Icon fehlt: {icon_path}")
+        icon = str(icon_path)
+    datas = _collect_datas(repo_root, config.add_data)
+    return (
+        "# -*- mode: python ; coding: utf-8 -*-\n"
+        "# Automatisch erzeugt von system/onefile_builder.py – nicht von Hand ändern.\n"
+        f"a = Analysis([{str(entry_script)!r}], datas={datas!r}, "
+        f"hiddenimports={list(config.hidden_imports)!r})\n"
+        "pyz = PYZ(a.pure)\n"
+        "exe = EXE(pyz, a.scripts, a.binaries, a.datas, [], "
+        f"name={config.name!r}, console=True, icon={icon!r})\n"
+    )
+
+
+def write_spec(repo_root: Path, config: OnefileConfig, output_dir: Path) -> Path:
+    """Schreibt die Spec nur bei geändertem Inhalt, damit PyInstaller sie wiedererkennt."""
+    content = build_spec_content(repo_root, config)
+    spec_path = output_dir / f"{config.name}.spec"
+    try:
+        if spec_path.read_text(encoding="utf-8") == content:
+            return spec_path
+    except OSError:
+        pass
+    output_dir.mkdir(parents=True, exist_ok=True)
+    spec_path.write_text(content, encoding="utf-8")
+    return spec_path
 
 
 def build_onefile(repo_root: Path, config: OnefileConfig, logger: logging.Logger) -> Path:
@@ -109,38 +144,18 @@ def build_onefile(repo_root: Path, config: OnefileConfig, logger: logging.Logger
     if not pyinstaller:
         raise OnefileBuildError("PyInstaller fehlt. Bitte 'pyinstaller' installieren.")
 
-    entry_script = _resolve_repo_path(repo_root, config.entry_script)
-    if not entry_script.exists():
-        raise OnefileBuildError(f"Entry-Script fehlt: {entry_script}")
-
     output_dir = repo_root / config.output_dir
-    output_dir.mkdir(parents=True, exist_ok=True)
+    spec_path = write_spec(repo_root, config, output_dir)
 
     args = [
         pyinstaller,
         "--noconfirm",
         "--clean",
-        "--onefile",
-        "--name",
-        config.name,
         "--distpath",
         str(output_dir),
+        str(spec_path),
     ]
 
-    args.extend(_build_add_data_args(repo_root, config.add_data))
-
-    for hidden in config.hidden_imports:
-        args.extend(["--hidden-import", hidden])
-
-    if config.icon is not None:
-        icon_path = _resolve_repo_path(repo_root, config.icon)
-        if icon_path.exists():
-            args.extend(["--icon", str(icon_path)])
-        else:
-            raise OnefileBuildError(f"Icon fehlt: {icon_path}")
-
-    args.append(str(entry_script))
-
     logger.info("One-File-Build startet: %s", " ".join(args))
     result = subprocess.run(args, check=False)
     if result.returncode != 0:
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Set
 
+from config_utils import ensure_path, require_text
 from module_registry import load_manifest
 
+_PERMISSION_RE = re.compile(r"(?:read|write)(?::[a-z0-9_]+)?")
+
 
 class PermissionGuardError(ValueError):
     """Fehler im Rechte- und Schreibschutzsystem."""
@@ -22,68 +26,89 @@ class PermissionContext:
     write_mode: str
 
 
-def _require_path(value: object, label: str) -> Path:
-    if not isinstance(value, Path):
-        raise PermissionGuardError(f"{label} ist kein Pfad (Path).")
-    return value
+@functools.lru_cache(maxsize=64)
+def _find_repo_root(start_dir: str) -> Path:
+    start = Path(start_dir)
+    for parent in (start, *start.parents):
+        if (parent / "config").exists() and (parent / "modules").exists():
+            return parent
+    return start.parents[1]
 
 
-def _require_text(value: object, label: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise PermissionGuardError(f"{label} ist leer oder ungültig.")
-    return value.strip()
+def _dir_prefix(path: Path) -> str:
+    text = str(path)
+    return text if text.endswith(os.sep) else text + os.sep
 
 
-def _find_repo_root(start: Path) -> Path:
-    for parent in start.resolve().parents:
-        if (parent / "config").exists() and (parent / "modules").exists():
-            return parent
-    return start.resolve().parents[2]
+@functools.lru_cache(maxsize=64)
+def _category_prefixes(root: Path) -> tuple[str, tuple[tuple[str, str], ...]]:
+    root = root.resolve()
+    categories = tuple((name, _dir_prefix(root / name)) for name in ("data", "config", "logs"))
+    return _dir_prefix(root), categories
+
+
+def _is_within(target: str, prefix: str) -> bool:
+    return target.startswith(prefix) or target + os.sep == prefix
 
 
 def _normalize_permissions(entries: Iterable[str]) -> tuple[str, ...]:
+    seen: Set[str] = set()
     cleaned: List[str] = []
     for entry in entries:
-        text = _require_text(entry, "permission_entry").lower()
-        if not re.fullmatch(r"(read|write)(:[a-z0-9_]+)?", text):
+        text = require_text(entry, "permission_entry", PermissionGuardError).lower()
+        if text in seen:
+            continue
+        if not _PERMISSION_RE.fullmatch(text):
             raise PermissionGuardError(f"permission_entry ist ungültig: {text}")
+        seen.add(text)
         cleaned.append(text)
-    return tuple(dict.fromkeys(cleaned))
+    return tuple(cleaned)
 
 
-def load_permission_context(module_file: Path) -> PermissionContext:
-    module_file = _require_path(module_file, "module_file")
-    module_dir = module_file.resolve().parent
+@functools.lru_cache(maxsize=64)
+def _manifest_permissions_cached(
+    module_dir: Path, mtime_ns: int, size: int
+) -> tuple[str, tuple[str, ...]]:
+    """Modul-ID und Rechte aus manifest.json; ein geänderter Dateistand ist ein neuer Schlüssel."""
     manifest = load_manifest(module_dir)
-    permissions = _normalize_permissions(manifest.permissions)
+    return manifest.module_id, _normalize_permissions(manifest.permissions)
+
+
+def _load_manifest_permissions(module_dir: Path) -> tuple[str, tuple[str, ...]]:
+    try:
+        manifest_stat = (module_dir / "manifest.json").stat()
+    except OSError:
+        manifest = load_manifest(module_dir)
+        return manifest.module_id, _normalize_permissions(manifest.permissions)
+    return _manifest_permissions_cached(
+        module_dir, manifest_stat.st_mtime_ns, manifest_stat.st_size
+    )
+
+
+def load_permission_context(module_file: Path) -> PermissionContext:
+    ensure_path(module_file, "module_file", PermissionGuardError)
+    return _context_for_dir(module_file.resolve().parent)
+
+
+def _context_for_dir(module_dir: Path) -> PermissionContext:
+    module_id, permissions = _load_manifest_permissions(module_dir)
     write_mode = os.environ.get("GENREARCHIV_WRITE_MODE", "normal").strip().lower() or "normal"
     if write_mode not in {"normal", "read-only"}:
         raise PermissionGuardError("GENREARCHIV_WRITE_MODE ist ungültig.")
     return PermissionContext(
-        module_id=manifest.module_id,
+        module_id=module_id,
         permissions=permissions,
         write_mode=write_mode,
     )
 
 
 def _path_category(root: Path, target: Path) -> Optional[str]:
-    root = root.resolve()
-    target = target.resolve()
-    categories = {
-        "data": root / "data",
-        "config": root / "config",
-        "logs": root / "logs",
-    }
-    for name, base in categories.items():
-        try:
-            target.relative_to(base)
-        except ValueError:
-            continue
-        else:
+    root_prefix, categories = _category_prefixes(root)
+    target_text = str(target.resolve())
+    for name, prefix in categories:
+        if _is_within(target_text, prefix):
             return name
-    try:
-        target.relative_to(root)
-    except ValueError:
+    if not _is_within(target_text, root_prefix):
         return "external"
     return None
 
@@ -97,16 +122,18 @@ def _required_permission(category: Optional[str]) -> str:
 
 
 def require_write_access(module_file: Path, target_path: Path, action: str) -> None:
-    module_file = _require_path(module_file, "module_file")
-    target_path = _require_path(target_path, "target_path")
-    action = _require_text(action, "action")
-    context = load_permission_context(module_file)
+    ensure_path(module_file, "module_file", PermissionGuardError)
+    ensure_path(target_path, "target_path", PermissionGuardError)
+    action = require_text(action, "action", PermissionGuardError)
+    # Modulpfad nur einmal auflösen: für Manifest-Kontext und Projektwurzel.
+    module_dir = module_file.resolve().parent
+    context = _context_for_dir(module_dir)
     if context.write_mode == "read-only":
         raise PermissionGuardError(
             "Schreibschutz aktiv: Schreibzugriff ist im Safe-Mode deaktiviert. "
             f"Aktion '{action}' wurde blockiert."
         )
-    repo_root = _find_repo_root(module_file)
+    repo_root = _find_repo_root(str(module_dir))
     category = _path_category(repo_root, target_path)
     needed = _required_permission(category)
     if needed not in context.permissions and "write" not in context.permissions:
@@ -5,19 +5,34 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import hmac
 import json
 import logging
-import random
+import secrets
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
-from config_utils import ensure_path, load_json
+from config_utils import ensure_path, load_json, require_int_min, require_text
 from logging_center import setup_logging as setup_logging_center
 
 DEFAULT_CONFIG = Path(__file__).resolve().parents[1] / "config" / "pin.json"
 DEFAULT_STATE = Path(__file__).resolve().parents[1] / "data" / "pin_state.json"
+SCRYPT_PREFIX = "scrypt"
+# Speichergrenze von hashlib.scrypt (OpenSSL-Standard bei maxmem=0).
+SCRYPT_MAXMEM = 32 << 20
+_TEXT_FIELDS = ("pin_hint", "pin_hash", "salt")
+# (Feld, Standardwert, Minimum)
+_INT_FIELDS = (
+    ("max_attempts", 3, 1),
+    ("lock_min_seconds", 2, 1),
+    ("lock_max_seconds", 7, 1),
+    ("scrypt_n", 2**14, 2),
+    ("scrypt_r", 8, 1),
+    ("scrypt_p", 1, 1),
+)
 
 
 class PinAuthError(Exception):
@@ -33,28 +48,86 @@ class PinConfig:
     max_attempts: int
     lock_min_seconds: int
     lock_max_seconds: int
+    scrypt_n: int = 2**14
+    scrypt_r: int = 8
+    scrypt_p: int = 1
 
 
-def _require_text(value: object, label: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise PinAuthError(f"{label} fehlt oder ist leer.")
-    return value.strip()
-
-
-def _require_int_min(value: object, label: str, minimum: int) -> int:
-    if not isinstance(value, int):
-        raise PinAuthError(f"{label} ist keine Zahl.")
-    if value < minimum:
-        raise PinAuthError(f"{label} muss mindestens {minimum} sein.")
-    return value
-
-
-def _hash_pin(pin: str, salt: str) -> str:
+def _require_pin_and_salt(pin: str, salt: str) -> None:
     if not isinstance(pin, str) or not pin:
         raise PinAuthError("PIN fehlt oder ist leer.")
     if not isinstance(salt, str) or not salt:
         raise PinAuthError("Salt fehlt oder ist leer.")
-    return hashlib.sha256(f"{salt}{pin}".encode("utf-8")).hexdigest()
+
+
+def _legacy_hash_pin(pin: str, salt: str) -> str:
+    """Alter SHA-256-Hash, nur noch zum Prüfen und Migrieren bestehender Konfigurationen."""
+    _require_pin_and_salt(pin, salt)
+    return hashlib.sha256(salt.encode("utf-8") + pin.encode("utf-8")).hexdigest()
+
+
+def _hash_pin(pin: str, salt: str, n: int = 2**14, r: int = 8, p: int = 1) -> str:
+    """scrypt-Hash im Format scrypt$n$r$p$hex (Parameter stehen im Hash selbst)."""
+    _require_pin_and_salt(pin, salt)
+    digest = hashlib.scrypt(
+        pin.encode("utf-8"),
+        salt=salt.encode("utf-8"),
+        n=n,
+        r=r,
+        p=p,
+        maxmem=SCRYPT_MAXMEM,
+        dklen=32,
+    )
+    return f"{SCRYPT_PREFIX}${n}${r}${p}${digest.hex()}"
+
+
+def _verify_pin(pin: str, config: PinConfig) -> tuple[bool, bool]:
+    """Prüft die PIN in konstanter Zeit. Rückgabe: (gültig, Hash sollte erneuert werden)."""
+    if config.pin_hash.startswith(f"{SCRYPT_PREFIX}$"):
+        try:
+            _, n_text, r_text, p_text, _digest = config.pin_hash.split("$")
+            n, r, p = int(n_text), int(r_text), int(p_text)
+            computed = _hash_pin(pin, config.salt, n, r, p)
+        except ValueError as exc:
+            raise PinAuthError("pin_hash hat ein ungültiges scrypt-Format.") from exc
+        valid = hmac.compare_digest(computed.encode("utf-8"), config.pin_hash.encode("utf-8"))
+        outdated = (n, r, p) != (config.scrypt_n, config.scrypt_r, config.scrypt_p)
+        return valid, valid and outdated
+    # Als Bytes vergleichen: compare_digest lehnt str mit Nicht-ASCII-Zeichen per TypeError ab.
+    valid = hmac.compare_digest(
+        _legacy_hash_pin(pin, config.salt).encode("utf-8"), config.pin_hash.encode("utf-8")
+    )
+    return valid, valid
+
+
+def _upgrade_pin_hash(config_path: Path, pin: str, config: PinConfig) -> None:
+    """Schreibt nach erfolgreichem Login einen aktuellen scrypt-Hash in die Konfiguration."""
+    try:
+        data = json.loads(config_path.read_text(encoding="utf-8"))
+        data["pin_hash"] = _hash_pin(
+            pin, config.salt, config.scrypt_n, config.scrypt_r, config.scrypt_p
+        )
+        payload = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+        temporary = config_path.with_suffix(config_path.suffix + ".tmp")
+        temporary.write_text(payload, encoding="utf-8")
+        temporary.replace(config_path)
+    except (OSError, ValueError) as exc:
+        logging.warning("PIN-Hash konnte nicht aktualisiert werden: %s", exc)
+        return
+    logging.info("PIN-Hash auf scrypt aktualisiert: %s", config_path)
+
+
+def _check_scrypt_limits(n: int, r: int, p: int) -> None:
+    """Lehnt Parameter ab, die hashlib.scrypt erst beim Login mit ValueError abweisen würde."""
+    if n >= 2 ** (16 * r):
+        raise PinAuthError("scrypt_n ist für scrypt_r zu groß (Grenze: 2 hoch 16·scrypt_r).")
+    # Speicherbedarf wie in OpenSSL: Block 128·r·p plus Tabelle 128·r·(n + 2) Byte.
+    needed = 128 * r * (n + p + 2)
+    if needed > SCRYPT_MAXMEM:
+        raise PinAuthError(
+            f"scrypt_n/scrypt_r/scrypt_p brauchen {needed} Byte Speicher; "
+            f"erlaubt sind höchstens {SCRYPT_MAXMEM} Byte (32 MiB)."
+        )
 
 
 def load_pin_config(path: Path) -> PinConfig:
@@ -63,67 +136,70 @@ def load_pin_config(path: Path) -> PinConfig:
     enabled = data.get("enabled", False)
     if not isinstance(enabled, bool):
         raise PinAuthError("enabled ist kein Wahrheitswert (bool).")
-    pin_hint = _require_text(data.get("pin_hint", ""), "pin_hint")
-    pin_hash = _require_text(data.get("pin_hash", ""), "pin_hash")
-    salt = _require_text(data.get("salt", ""), "salt")
-    max_attempts = _require_int_min(data.get("max_attempts", 3), "max_attempts", 1)
-    lock_min_seconds = _require_int_min(data.get("lock_min_seconds", 2), "lock_min_seconds", 1)
-    lock_max_seconds = _require_int_min(data.get("lock_max_seconds", 7), "lock_max_seconds", 1)
-    if lock_min_seconds > lock_max_seconds:
+    values: Dict[str, Any] = {
+        name: require_text(data.get(name, ""), name, PinAuthError) for name in _TEXT_FIELDS
+    }
+    for name, default, minimum in _INT_FIELDS:
+        values[name] = require_int_min(data.get(name, default), name, minimum, PinAuthError)
+    if values["lock_min_seconds"] > values["lock_max_seconds"]:
         raise PinAuthError("lock_min_seconds darf nicht größer als lock_max_seconds sein.")
-    return PinConfig(
-        enabled=enabled,
-        pin_hint=pin_hint,
-        pin_hash=pin_hash,
-        salt=salt,
-        max_attempts=max_attempts,
-        lock_min_seconds=lock_min_seconds,
-        lock_max_seconds=lock_max_seconds,
-    )
+    if values["scrypt_n"] & (values["scrypt_n"] - 1):
+        raise PinAuthError("scrypt_n muss eine Zweierpotenz sein.")
+    _check_scrypt_limits(values["scrypt_n"], values["scrypt_r"], values["scrypt_p"])
+    return PinConfig(enabled=enabled, **values)
 
 
 def load_state(path: Path) -> Dict[str, Any]:
     ensure_path(path, "state_path", PinAuthError)
     if not path.exists():
-        return {"failed_attempts": 0, "locked_until": None}
+        return {"failed_attempts": 0, "locked_until_epoch": None}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        return json.loads(path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise PinAuthError(f"PIN-Statusdatei ungültig: {path}") from exc
 
 
 def save_state(path: Path, state: Dict[str, Any]) -> None:
     ensure_path(path, "state_path", PinAuthError)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(state, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-
-
-def _parse_locked_until(value: object) -> datetime | None:
-    if value is None:
-        return None
-    if not isinstance(value, str) or not value:
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    temporary.write_text(json.dumps(state, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    temporary.replace(path)
+
+
+def _parse_locked_until(state: Dict[str, Any]) -> int | None:
+    """Sperrzeit als UTC-Epoch-Sekunden; liest auch das alte ISO-Feld locked_until."""
+    value = state.get("locked_until_epoch")
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    legacy = state.get("locked_until")
+    if not isinstance(legacy, str) or not legacy:
         return None
     try:
-        return datetime.fromisoformat(value)
+        return int(datetime.fromisoformat(legacy).timestamp())
     except ValueError:
         return None
 
 
-def _format_time(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+def _format_time(epoch_seconds: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime(epoch_seconds))
 
 
-def check_pin(config: PinConfig, state_path: Path) -> int:
+def check_pin(config: PinConfig, state_path: Path, config_path: Path | None = None) -> int:
     if not config.enabled:
         print("PIN-Check: deaktiviert.")
         return 0
 
     state = load_state(state_path)
     failed_attempts = int(state.get("failed_attempts", 0))
-    locked_until = _parse_locked_until(state.get("locked_until"))
-    now = datetime.now(timezone.utc)
+    locked_until = _parse_locked_until(state)
+    if "locked_until" in state:
+        save_state(
+            state_path, {"failed_attempts": failed_attempts, "locked_until_epoch": locked_until}
+        )
+    now = int(time.time())
     if locked_until and locked_until > now:
-        wait_seconds = int((locked_until - now).total_seconds())
+        wait_seconds = locked_until - now
         print(
             "PIN-Check: Gesperrt wegen Fehlversuchen. "
             f"Bitte {wait_seconds} Sekunden warten (bis {_format_time(locked_until)})."
@@ -135,17 +211,22 @@ def check_pin(config: PinConfig, state_path: Path) -> int:
         print("PIN-Check: Keine Eingabe. Bitte erneut starten.")
         return 1
 
-    if _hash_pin(pin, config.salt) == config.pin_hash:
-        save_state(state_path, {"failed_attempts": 0, "locked_until": None})
+    valid, needs_upgrade = _verify_pin(pin, config)
+    if valid:
+        save_state(state_path, {"failed_attempts": 0, "locked_until_epoch": None})
+        if needs_upgrade and config_path is not None:
+            _upgrade_pin_hash(config_path, pin, config)
         print("PIN-Check: Zugriff erlaubt.")
         return 0
 
     failed_attempts += 1
-    lock_seconds = random.randint(config.lock_min_seconds, config.lock_max_seconds)
-    locked_until = now + timedelta(seconds=lock_seconds)
+    # secrets statt random: Sperrdauern sollen von außen nicht vorhersagbar sein.
+    lock_span = config.lock_max_seconds - config.lock_min_seconds + 1
+    lock_seconds = config.lock_min_seconds + secrets.randbelow(lock_span)
+    locked_until = now + lock_seconds
     save_state(
         state_path,
-        {"failed_attempts": failed_attempts, "locked_until": locked_until.isoformat()},
+        {"failed_attempts": failed_attempts, "locked_until_epoch": locked_until},
     )
     remaining = max(config.max_attempts - failed_attempts, 0)
     print("PIN-Check: Falsche PIN.")
@@ -200,7 +281,7 @@ def main() -> int:
         return 2
 
     try:
-        return check_pin(config, args.state)
+        return check_pin(config, args.state, args.config)
     except PinAuthError as exc:
         logging.error("PIN-Check fehlgeschlagen: %s", exc)
         return 2
@@ -3,10 +3,13 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List
 
 
 class QualityCheckError(Exception):
@@ -15,6 +18,11 @@ class QualityCheckError(Exception):
 
 Severity = str
 
+SEVERE_MARKERS = ("fehlt", "ungültig", "nicht lesbar", "kein gültiges json", "kein json")
+MILD_MARKERS = ("hinweis", "optional", "deaktiviert")
+_SEVERE_RE = re.compile("|".join(map(re.escape, SEVERE_MARKERS)), re.IGNORECASE)
+_MILD_RE = re.compile("|".join(map(re.escape, MILD_MARKERS)), re.IGNORECASE)
+
 
 @dataclass(frozen=True)
 class FileIssue:
@@ -33,12 +41,9 @@ class FileStatusReport:
 def classify_issue(message: str) -> Severity:
     if not isinstance(message, str) or not message.strip():
         raise QualityCheckError("Fehlertext ist leer oder ungültig.")
-    lowered = message.lower()
-    severe_markers = ["fehlt", "ungültig", "nicht lesbar", "kein gültiges json", "kein json"]
-    mild_markers = ["hinweis", "optional", "deaktiviert"]
-    if any(marker in lowered for marker in severe_markers):
+    if _SEVERE_RE.search(message):
         return "schwer"
-    if any(marker in lowered for marker in mild_markers):
+    if _MILD_RE.search(message):
         return "leicht"
     return "mittel"
 
@@ -52,36 +57,77 @@ def traffic_light(issues: Iterable[FileIssue]) -> str:
     return "grün"
 
 
-def _read_json(path: Path) -> None:
+@functools.lru_cache(maxsize=32)
+def _json_is_valid(path_text: str, mtime_ns: int, size: int) -> bool:
+    """Merkt nur das Prüfergebnis; mtime und Größe im Schlüssel erzwingen Neulesen nach Änderung."""
     try:
-        json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise QualityCheckError(f"JSON ist ungültig: {path}") from exc
+        with open(path_text, "rb") as handle:
+            json.loads(handle.read())
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return False
+    return True
+
+
+def _read_json(path: Path, file_stat: os.stat_result | None = None) -> None:
+    file_stat = file_stat or path.stat()
+    if not _json_is_valid(str(path), file_stat.st_mtime_ns, file_stat.st_size):
+        raise QualityCheckError(f"JSON ist ungültig: {path}")
+
+
+# (relativer Pfad, Label, Pflicht, Prüfart); Ordner werden je einmal gelesen (os.scandir).
+RELEASE_CHECKS = (
+    ("config/modules.json", "Modul-Konfiguration", True, "json"),
+    ("config/launcher_gui.json", "GUI-Konfiguration", True, "json"),
+    ("config/pytest.ini", "Pytest-Konfiguration", True, "file"),
+    ("config/ruff.toml", "Ruff-Konfiguration", True, "file"),
+    ("config/black.toml", "Black-Konfiguration", True, "file"),
+    ("config/module_selftests.json", "Modul-Selbsttests", True, "json"),
+    ("config/selective_export.json", "Selektive Exporte", True, "json"),
+    ("config/export_center.json", "Export-Center", True, "json"),
+    ("config/backup.json", "Backup-System", True, "json"),
+    ("todo.txt", "Kurzliste (todo.txt)", True, "file"),
+    ("scripts/start.sh", "Startskript", True, "file"),
+    ("scripts/run_tests.sh", "Tests-Skript", True, "file"),
+)
+_RELEASE_DIRS = tuple(dict.fromkeys(rel.rpartition("/")[0] for rel, *_ in RELEASE_CHECKS))
+
+
+def _scan_entries(root: Path, folders: Iterable[str]) -> Dict[str, os.DirEntry]:
+    """Ein os.scandir je Ordner; Schlüssel ist der relative POSIX-Pfad wie in RELEASE_CHECKS."""
+    entries: Dict[str, os.DirEntry] = {}
+    for folder in folders:
+        prefix = f"{folder}/" if folder else ""
+        try:
+            with os.scandir(root / folder) as scanned:
+                entries.update((prefix + entry.name, entry) for entry in scanned)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return entries
+
+
+def _entry_kind(entry: os.DirEntry | None) -> str:
+    """Typ aus dem Verzeichniseintrag: "missing", "file" oder "other"."""
+    if entry is None:
+        return "missing"
+    if entry.is_file():
+        return "file"
+    # Symlink ohne Ziel zählt wie bisher als fehlend.
+    if entry.is_symlink() and not os.path.exists(entry.path):
+        return "missing"
+    return "other"
 
 
 def check_release_files(root: Path) -> FileStatusReport:
     if not isinstance(root, Path):
         raise QualityCheckError("root ist kein Pfad (Path).")
 
-    checks = [
-        ("config/modules.json", "Modul-Konfiguration", True, "json"),
-        ("config/launcher_gui.json", "GUI-Konfiguration", True, "json"),
-        ("config/pytest.ini", "Pytest-Konfiguration", True, "file"),
-        ("config/ruff.toml", "Ruff-Konfiguration", True, "file"),
-        ("config/black.toml", "Black-Konfiguration", True, "file"),
-        ("config/module_selftests.json", "Modul-Selbsttests", True, "json"),
-        ("config/selective_export.json", "Selektive Exporte", True, "json"),
-        ("config/export_center.json", "Export-Center", True, "json"),
-        ("config/backup.json", "Backup-System", True, "json"),
-        ("todo.txt", "Kurzliste (todo.txt)", True, "file"),
-        ("scripts/start.sh", "Startskript", True, "file"),
-        ("scripts/run_tests.sh", "Tests-Skript", True, "file"),
-    ]
-
+    entries = _scan_entries(root, _RELEASE_DIRS)
     issues: List[FileIssue] = []
-    for rel_path, label, required, check_type in checks:
+    for rel_path, label, required, check_type in RELEASE_CHECKS:
         path = root / rel_path
-        if not path.exists():
+        entry = entries.get(rel_path)
+        kind = _entry_kind(entry)
+        if kind == "missing":
             severity = "schwer" if required else "mittel"
             issues.append(
                 FileIssue(
@@ -92,9 +138,20 @@ def check_release_files(root: Path) -> FileStatusReport:
                 )
             )
             continue
+        if kind == "other":
+            issues.append(
+                FileIssue(
+                    label=label,
+                    path=path,
+                    message=f"Pfad ist keine Datei: {label} ({path}).",
+                    severity="schwer",
+                )
+            )
+            continue
         if check_type == "json":
             try:
-                _read_json(path)
+                # stat nur für JSON (Cache-Schlüssel); DirEntry speichert es zwischen.
+                _read_json(path, entry.stat())
             except QualityCheckError as exc:
                 issues.append(
                     FileIssue(
@@ -104,14 +161,5 @@ def check_release_files(root: Path) -> FileStatusReport:
                         severity="schwer",
                     )
                 )
-        if not path.is_file():
-            issues.append(
-                FileIssue(
-                    label=label,
-                    path=path,
-                    message=f"Pfad ist keine Datei: {label} ({path}).",
-                    severity="schwer",
-                )
-            )
 
     return FileStatusReport(issues=issues, traffic_light=traffic_light(issues))
@@ -5,16 +5,36 @@ from __future__ import annotations
 
 import argparse
 import fnmatch
+import functools
+import os
+import re
+import shutil
+import stat
+import time
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
-from config_utils import ensure_path, load_json
+from config_utils import ensure_path, load_json, require_text, require_text_list
 
 DEFAULT_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_CONFIG = DEFAULT_ROOT / "config" / "selective_export.json"
+COPY_BUFFER_SIZE = 1 << 20
+# Dateien bis zu dieser Größe werden parallel im Speicher komprimiert,
+# größere laufen gestreamt über ZipFile.open.
+PARALLEL_MAX_BYTES = 16 << 20
+# Obergrenze für die Summe der Dateigrößen, die gleichzeitig im Pool warten;
+# jede wartende Datei liegt roh und komprimiert im Speicher.
+PENDING_MAX_BYTES = 64 << 20
+# Exporte bis zu dieser Gesamtgröße werden unkomprimiert gespeichert (zlib lohnt dort kaum);
+# größere nutzen die schnelle Deflate-Stufe.
+STORED_MAX_TOTAL_BYTES = 512 << 10
+COMPRESS_LEVEL = 1
 
 
 class SelectiveExportError(ValueError):
@@ -28,6 +48,11 @@ class ExportPreset:
     includes: List[str]
     excludes: List[str]
 
+    @functools.cached_property
+    def _exclude_re(self) -> re.Pattern[str] | None:
+        """Alle Ausschlüsse als ein Regex, einmal je Preset kompiliert."""
+        return _compile_excludes(self.excludes)
+
 
 @dataclass(frozen=True)
 class ExportConfig:
@@ -37,23 +62,6 @@ class ExportConfig:
     base_name: str
 
 
-def _require_text(value: object, label: str) -> str:
-    if not isinstance(value, str) or not value.strip():
-        raise SelectiveExportError(f"{label} ist leer oder ungültig.")
-    return value.strip()
-
-
-def _require_list(value: object, label: str) -> List[str]:
-    if not isinstance(value, list):
-        raise SelectiveExportError(f"{label} ist keine Liste.")
-    items: List[str] = []
-    for entry in value:
-        if not isinstance(entry, str) or not entry.strip():
-            raise SelectiveExportError(f"{label} enthält ungültige Einträge.")
-        items.append(entry.strip())
-    return items
-
-
 def load_config(config_path: Path) -> ExportConfig:
     data = load_json(
         config_path,
@@ -66,20 +74,32 @@ def load_config(config_path: Path) -> ExportConfig:
         raise SelectiveExportError("presets fehlen oder sind leer.")
     presets: List[ExportPreset] = []
     for name, payload in presets_raw.items():
-        preset_name = _require_text(name, "preset_name")
+        preset_name = require_text(name, "preset_name", SelectiveExportError)
         if not isinstance(payload, dict):
             raise SelectiveExportError(f"Preset {preset_name} ist kein Objekt.")
         presets.append(
             ExportPreset(
                 name=preset_name,
-                label=_require_text(payload.get("label", preset_name), "preset.label"),
-                includes=_require_list(payload.get("includes", []), "preset.includes"),
-                excludes=_require_list(payload.get("excludes", []), "preset.excludes"),
+                label=require_text(
+                    payload.get("label", preset_name), "preset.label", SelectiveExportError
+                ),
+                includes=require_text_list(
+                    payload.get("includes", []), "preset.includes", SelectiveExportError
+                ),
+                excludes=require_text_list(
+                    payload.get("excludes", []), "preset.excludes", SelectiveExportError
+                ),
             )
         )
-    default_preset = _require_text(data.get("default_preset", presets[0].name), "default_preset")
-    output_dir = Path(_require_text(data.get("output_dir", "data/exports"), "output_dir"))
-    base_name = _require_text(data.get("base_name", "selective_export"), "base_name")
+    default_preset = require_text(
+        data.get("default_preset", presets[0].name), "default_preset", SelectiveExportError
+    )
+    output_dir = Path(
+        require_text(data.get("output_dir", "data/exports"), "output_dir", SelectiveExportError)
+    )
+    base_name = require_text(
+        data.get("base_name", "selective_export"), "base_name", SelectiveExportError
+    )
     return ExportConfig(
         presets=presets,
         default_preset=default_preset,
@@ -88,45 +108,175 @@ def load_config(config_path: Path) -> ExportConfig:
     )
 
 
-def _matches_exclude(relative_path: Path, excludes: Iterable[str]) -> bool:
-    rel_posix = relative_path.as_posix()
+def _compile_excludes(excludes: Iterable[str]) -> re.Pattern[str] | None:
+    """Glob-Muster wie fnmatch.fnmatch, jeder Eintrag zusätzlich als Pfad samt Unterpfaden."""
+    # fnmatch vergleicht über os.path.normcase (Windows: ohne Groß-/Kleinschreibung).
+    glob_flags = "(?i:" if os.path.normcase("A") == "a" else "(?:"
+    parts: List[str] = []
     for exclude in excludes:
         if not exclude:
             continue
         if "*" in exclude or "?" in exclude:
-            if fnmatch.fnmatch(rel_posix, exclude):
-                return True
-        if rel_posix == exclude or rel_posix.startswith(f"{exclude}/"):
-            return True
-    return False
+            parts.append(f"{glob_flags}{fnmatch.translate(exclude)})")
+        parts.append(f"{re.escape(exclude)}(?:/.*)?\\Z")
+    return re.compile("|".join(parts), re.DOTALL) if parts else None
 
 
-def _iter_files(root: Path, includes: Iterable[Path], excludes: Iterable[str]) -> Iterable[Path]:
-    for include_path in includes:
-        if include_path.is_dir():
-            for path in include_path.rglob("*"):
-                rel = path.relative_to(root)
-                if _matches_exclude(rel, excludes):
-                    continue
-                if path.is_file():
-                    yield path
-        elif include_path.is_file():
-            rel = include_path.relative_to(root)
-            if not _matches_exclude(rel, excludes):
-                yield include_path
+def _never(_rel_posix: str) -> None:
+    return None
 
 
-def _unique_path(output_dir: Path, filename: str) -> Path:
-    candidate = output_dir / filename
+def _relative_posix(path: str, root_prefix_len: int) -> str:
+    relative = path[root_prefix_len:]
+    return relative if os.sep == "/" else relative.replace(os.sep, "/")
+
+
+def _iter_entries(
+    root: Path, includes: Iterable[Path], exclude_re: re.Pattern[str] | None
+) -> Iterable[tuple[str, str, os.stat_result]]:
+    excluded = exclude_re.match if exclude_re is not None else _never
+    root_text = os.fspath(root)
+    root_prefix_len = len(root_text) if root_text.endswith(os.sep) else len(root_text) + 1
+    for include_path in includes:
+        include_text = os.fspath(include_path)
+        include_stat = os.stat(include_text)
+        if stat.S_ISDIR(include_stat.st_mode):
+            stack = [include_text]
+            while stack:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        rel_posix = _relative_posix(entry.path, root_prefix_len)
+                        if excluded(rel_posix):
+                            continue
+                        if entry.is_file():
+                            yield entry.path, rel_posix, entry.stat()
+        elif stat.S_ISREG(include_stat.st_mode):
+            rel_posix = _relative_posix(include_text, root_prefix_len)
+            if not excluded(rel_posix):
+                yield include_text, rel_posix, include_stat
+
+
+def _zip_info(arcname: str, stat_result: os.stat_result, compress_type: int) -> zipfile.ZipInfo:
+    """ZipInfo aus vorhandenem stat bauen (ZipFile.write würde erneut stat aufrufen)."""
+    info = zipfile.ZipInfo(arcname, date_time=time.localtime(stat_result.st_mtime)[:6])
+    info.external_attr = (stat_result.st_mode & 0xFFFF) << 16
+    info.compress_type = compress_type
+    # Gilt für den gestreamten Weg über ZipFile.open (große Dateien).
+    info._compresslevel = COMPRESS_LEVEL
+    info.file_size = stat_result.st_size
+    return info
+
+
+def _compress_file(path: str, info: zipfile.ZipInfo) -> tuple[zipfile.ZipInfo, bytes]:
+    """Liest eine Datei und komprimiert sie je nach compress_type (zlib gibt den GIL frei)."""
+    with open(path, "rb") as source:
+        data = source.read()
+    if info.compress_type == zipfile.ZIP_STORED:
+        payload = data
+    else:
+        compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+    info.CRC = zlib.crc32(data)
+    info.file_size = len(data)
+    info.compress_size = len(payload)
+    return info, payload
+
+
+def _write_compressed(archive: zipfile.ZipFile, info: zipfile.ZipInfo, payload: bytes) -> None:
+    """Schreibt bereits kodierte Daten samt Local-Header (wie ZipFile._open_to_write)."""
+    info.flag_bits = 0x00
+    archive.fp.seek(archive.start_dir)
+    info.header_offset = archive.fp.tell()
+    archive._writecheck(info)
+    archive._didModify = True
+    archive.fp.write(info.FileHeader(False))
+    archive.fp.write(payload)
+    archive.start_dir = archive.fp.tell()
+    archive.filelist.append(info)
+    archive.NameToInfo[info.filename] = info
+
+
+def _write_entries(
+    archive: zipfile.ZipFile,
+    entries: Iterable[tuple[str, str, os.stat_result]],
+    compress_type: int = zipfile.ZIP_DEFLATED,
+) -> None:
+    if compress_type == zipfile.ZIP_STORED:
+        # Ohne zlib bleibt nur Lesen und CRC: kein Thread-Pool nötig.
+        for file_path, rel_posix, stat_result in entries:
+            info = _zip_info(rel_posix, stat_result, compress_type)
+            _write_compressed(archive, *_compress_file(file_path, info))
+        return
+    workers = min(32, os.cpu_count() or 1)
+    pending: deque[tuple[Future[tuple[zipfile.ZipInfo, bytes]], int]] = deque()
+    pending_bytes = 0
+
+    def write_oldest() -> None:
+        nonlocal pending_bytes
+        future, size = pending.popleft()
+        pending_bytes -= size
+        _write_compressed(archive, *future.result())
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for file_path, rel_posix, stat_result in entries:
+            info = _zip_info(rel_posix, stat_result, compress_type)
+            size = stat_result.st_size
+            if size > PARALLEL_MAX_BYTES:
+                while pending:
+                    write_oldest()
+                with open(file_path, "rb") as source, archive.open(info, "w") as target:
+                    shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+                continue
+            # Vor dem Einreihen leeren: Anzahl und Bytes im Pool bleiben begrenzt.
+            while pending and (
+                len(pending) >= workers * 2 or pending_bytes + size > PENDING_MAX_BYTES
+            ):
+                write_oldest()
+            pending.append((executor.submit(_compress_file, file_path, info), size))
+            pending_bytes += size
+        while pending:
+            write_oldest()
+
+
+def _candidate_names(filename: str) -> Iterator[str]:
+    stem, dot, suffix = filename.rpartition(".")
+    if not dot:
+        stem, suffix = filename, ""
+    else:
+        suffix = f".{suffix}"
+    yield filename
     counter = 1
-    while candidate.exists():
-        candidate = output_dir / f"{candidate.stem}_{counter}{candidate.suffix}"
+    while True:
+        yield f"{stem}_{counter}{suffix}"
         counter += 1
-    return candidate
+
+
+def _unique_path(output_dir: Path, filename: str) -> Path:
+    for name in _candidate_names(filename):
+        candidate = output_dir / name
+        if not candidate.exists():
+            return candidate
+    raise SelectiveExportError("Kein freier Dateiname gefunden.")
+
+
+def _reserve_path(output_dir: Path, filename: str) -> Path:
+    """Legt den Zieldateinamen atomar an (O_EXCL), damit parallele Exporte nichts überschreiben."""
+    for name in _candidate_names(filename):
+        candidate = output_dir / name
+        try:
+            handle = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            continue
+        os.close(handle)
+        return candidate
+    raise SelectiveExportError("Kein freier Dateiname gefunden.")
 
 
 def resolve_preset(config: ExportConfig, preset_name: str) -> ExportPreset:
-    clean_name = _require_text(preset_name, "preset_name")
+    clean_name = require_text(preset_name, "preset_name", SelectiveExportError)
     for preset in config.presets:
         if preset.name == clean_name:
             return preset
@@ -156,13 +306,22 @@ def build_export(
     output_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{base_name}_{preset.name}_{timestamp}.zip"
-    output_path = _unique_path(output_dir, filename)
     if dry_run:
-        return output_path
-    with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for file_path in _iter_files(root_dir, include_paths, preset.excludes):
-            rel_path = file_path.relative_to(root_dir)
-            archive.write(file_path, rel_path.as_posix())
+        return _unique_path(output_dir, filename)
+    output_path = _reserve_path(output_dir, filename)
+    try:
+        entries = list(_iter_entries(root_dir, include_paths, preset._exclude_re))
+        total_bytes = sum(stat_result.st_size for _, _, stat_result in entries)
+        compress_type = (
+            zipfile.ZIP_STORED if total_bytes < STORED_MAX_TOTAL_BYTES else zipfile.ZIP_DEFLATED
+        )
+        with zipfile.ZipFile(
+            output_path, "w", compression=compress_type, compresslevel=COMPRESS_LEVEL
+        ) as archive:
+            _write_entries(archive, entries, compress_type)
+    except BaseException:
+        output_path.unlink(missing_ok=True)
+        raise
     if not output_path.exists():
         raise SelectiveExportError("Export konnte nicht geschrieben werden.")
     return output_path
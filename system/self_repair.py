@@ -4,33 +4,92 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
+import io
 import json
 import logging
 import os
 import stat
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Mapping, Sequence, TypeVar
 
 from config_utils import ensure_path
 from filename_fixer import run_fix as run_filename_fix
 from logging_center import setup_logging as setup_logging_center
 
 DEFAULT_ROOT = Path(__file__).resolve().parents[1]
+K = TypeVar("K")
+# Effektive Benutzer-ID, einmal beim Import ermittelt (None ohne os.geteuid, z. B. Windows).
+_EUID = os.geteuid() if hasattr(os, "geteuid") else None
+# Kleine JSON-Dateien: mehrere Lesezugriffe gleichzeitig, Ergebnis bleibt in Listenreihenfolge.
+JSON_CHECK_WORKERS = 4
 
 
 class SelfRepairError(Exception):
     """Allgemeiner Fehler für die Self-Repair-Routine."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepairItem:
-    path: Path
+    path: str
     label: str
 
 
+def _interned(*entries: tuple[str, str]) -> tuple[tuple[str, str], ...]:
+    """Pfade und Labels einmal internieren; alle Läufe teilen dieselben String-Objekte."""
+    return tuple((sys.intern(relative), sys.intern(label)) for relative, label in entries)
+
+
+_DIRS = _interned(
+    ("config", "Konfiguration"),
+    ("system", "System"),
+    ("scripts", "Skripte"),
+    ("modules", "Module"),
+    ("data", "Daten"),
+    ("logs", "Logs"),
+    ("tests", "Tests"),
+    ("src", "Quellcode"),
+)
+_JSON_FILES = _interned(
+    ("config/modules.json", "Modul-Liste"),
+    ("config/launcher_gui.json", "GUI-Konfiguration"),
+    ("config/test_gate.json", "Test-Sperre"),
+    ("config/module_selftests.json", "Modul-Selbsttests"),
+    ("config/module_structure.json", "Modul-Struktur"),
+    ("config/todo_config.json", "To-Do-Konfig"),
+    ("config/filename_suffixes.json", "Suffix-Standards"),
+    ("config/global_settings.json", "Global-Settings"),
+    ("config/pin.json", "PIN-Konfiguration"),
+    ("data/pin_state.json", "PIN-Status"),
+)
+_CONFIG_FILES = (
+    _JSON_FILES[:2]
+    + _interned(("config/requirements.txt", "Abhängigkeiten"))
+    + _JSON_FILES[2:]
+    + _interned(
+        ("todo.txt", "To-Do-Liste"),
+        ("CHANGELOG.md", "Changelog"),
+        ("DEV_DOKU.md", "Entwickler-Dokumentation"),
+        ("DONE.md", "Done-Liste"),
+        ("PROGRESS.md", "Fortschritt"),
+    )
+)
+_SCRIPTS = _interned(
+    ("scripts/start.sh", "Start-Routine"),
+    ("scripts/run_tests.sh", "Testskript"),
+    ("klick_start.sh", "Klick&Start"),
+)
+
+
+def _build_items(root_text: str, entries: Iterable[tuple[str, str]]) -> List[RepairItem]:
+    return [RepairItem(os.path.join(root_text, relative), label) for relative, label in entries]
+
+
 def _ensure_items(items: Iterable[RepairItem], label: str) -> List[RepairItem]:
     if not isinstance(items, Iterable):
         raise SelfRepairError(f"{label} ist keine Liste.")
@@ -45,11 +104,59 @@ def _hash_pin(pin: str, salt: str) -> str:
         raise SelfRepairError("pin fehlt oder ist leer.")
     if not isinstance(salt, str) or not salt:
         raise SelfRepairError("salt fehlt oder ist leer.")
-    return hashlib.sha256(f"{salt}{pin}".encode("utf-8")).hexdigest()
+    return hashlib.sha256(salt.encode("utf-8") + pin.encode("utf-8")).hexdigest()
+
+
+_DEFAULT_PIN_SALT = "provoware_default"
+# Standard-PIN "0000": der Hash ist konstant und wird nur einmal beim Import berechnet.
+_DEFAULT_PIN_HASH = _hash_pin("0000", _DEFAULT_PIN_SALT)
+
+
+def _dumps(payload: object) -> bytes:
+    """Einheitliche JSON-Ausgabe für Standarddateien (2 Einrückungen, UTF-8, Zeilenende)."""
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class _LazyDefaults(Mapping[K, bytes]):
+    """Standardinhalte je Zielpfad; serialisiert wird erst beim ersten Zugriff."""
+
+    __slots__ = ("_today", "_relative")
+
+    def __init__(self, today: str, relative: dict[K, str]) -> None:
+        self._today = today
+        self._relative = relative
 
+    def __getitem__(self, key: K) -> bytes:
+        return _serialize_default(self._today, self._relative[key])
 
-def build_default_files(root: Path) -> dict[Path, str]:
-    today = datetime.now(timezone.utc).date().isoformat()
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._relative)
+
+    def __len__(self) -> int:
+        return len(self._relative)
+
+
+def build_default_files(root: Path | str) -> Mapping[Path, bytes] | Mapping[str, bytes]:
+    """Standardinhalte je Zielpfad; die Schlüssel haben den Typ von root (Path oder str)."""
+    today = time.strftime("%Y-%m-%d", time.gmtime())
+    sources = _default_sources(today)
+    if isinstance(root, Path):
+        return _LazyDefaults(today, {root / relative: relative for relative in sources})
+    return _LazyDefaults(today, {os.path.join(root, relative): relative for relative in sources})
+
+
+@functools.lru_cache(maxsize=64)
+def _serialize_default(today: str, relative: str) -> bytes:
+    source = _default_sources(today)[relative]
+    return source if isinstance(source, bytes) else _dumps(source)
+
+
+@functools.lru_cache(maxsize=2)
+def _default_sources(today: str) -> dict[str, object]:
+    """Standardinhalte je relativem Pfad (JSON-Objekt oder fertige Bytes); nur vom Datum abhängig.
+
+    Die Objekte werden geteilt und dürfen nicht verändert werden.
+    """
     modules_payload = {
         "modules": [
             {
@@ -132,12 +239,11 @@ def build_default_files(root: Path) -> dict[Path, str]:
             "logs": ".log",
         }
     }
-    pin_salt = "provoware_default"
     pin_payload = {
         "enabled": False,
         "pin_hint": "Standard-PIN: 0000 (bitte ändern).",
-        "pin_hash": _hash_pin("0000", pin_salt),
-        "salt": pin_salt,
+        "pin_hash": _DEFAULT_PIN_HASH,
+        "salt": _DEFAULT_PIN_SALT,
         "max_attempts": 3,
         "lock_min_seconds": 2,
         "lock_max_seconds": 7,
@@ -166,86 +272,50 @@ def build_default_files(root: Path) -> dict[Path, str]:
     }
 
     return {
-        root / "config" / "modules.json": json.dumps(modules_payload, indent=2, ensure_ascii=False)
-        + "\n",
-        root / "config" / "launcher_gui.json": json.dumps(gui_payload, indent=2, ensure_ascii=False)
-        + "\n",
-        root
-        / "config"
-        / "requirements.txt": (
+        "config/modules.json": modules_payload,
+        "config/launcher_gui.json": gui_payload,
+        "config/requirements.txt": (
             "# Python-Abhängigkeiten (pip-Pakete)\n"
             "# Beispiel: requests>=2.32.0\n"
             "# Hinweis: Leere Datei bedeutet, dass aktuell keine externen Pakete nötig sind.\n"
             "pytest>=8.0.0\n"
             "ruff>=0.5.0\n"
             "black>=24.0.0\n"
-        ),
-        root
-        / "config"
-        / "test_gate.json": json.dumps(test_gate_payload, indent=2, ensure_ascii=False)
-        + "\n",
-        root
-        / "config"
-        / "module_selftests.json": json.dumps(selftest_payload, indent=2, ensure_ascii=False)
-        + "\n",
-        root
-        / "config"
-        / "module_structure.json": json.dumps(structure_payload, indent=2, ensure_ascii=False)
-        + "\n",
-        root
-        / "config"
-        / "todo_config.json": json.dumps(
-            {"todo_path": "todo.txt", "archive_path": "data/todo_archive.txt"},
-            indent=2,
-            ensure_ascii=False,
-        )
-        + "\n",
-        root
-        / "config"
-        / "filename_suffixes.json": json.dumps(suffix_payload, indent=2, ensure_ascii=False)
-        + "\n",
-        root
-        / "config"
-        / "global_settings.json": json.dumps(global_settings_payload, indent=2, ensure_ascii=False)
-        + "\n",
-        root
-        / "config"
-        / "selective_export.json": json.dumps(
-            selective_export_payload, indent=2, ensure_ascii=False
-        )
-        + "\n",
-        root / "config" / "pin.json": json.dumps(pin_payload, indent=2, ensure_ascii=False) + "\n",
-        root
-        / "data"
-        / "pin_state.json": json.dumps(
-            {"failed_attempts": 0, "locked_until": None}, indent=2, ensure_ascii=False
-        )
-        + "\n",
-        root
-        / "todo.txt": (
+        ).encode("utf-8"),
+        "config/test_gate.json": test_gate_payload,
+        "config/module_selftests.json": selftest_payload,
+        "config/module_structure.json": structure_payload,
+        "config/todo_config.json": {
+            "todo_path": "todo.txt",
+            "archive_path": "data/todo_archive.txt",
+        },
+        "config/filename_suffixes.json": suffix_payload,
+        "config/global_settings.json": global_settings_payload,
+        "config/selective_export.json": selective_export_payload,
+        "config/pin.json": pin_payload,
+        "data/pin_state.json": {"failed_attempts": 0, "locked_until_epoch": None},
+        "todo.txt": (
             "# To-Do-Liste\n"
             "# Format: [ ] JJJJ-MM-TT | Bereich | Titel | prüfen: ... | fertig wenn: ...\n"
-        ),
-        root / "CHANGELOG.md": "# Changelog\n\n## [Unreleased]\n- Platzhalter.\n",
-        root
-        / "DEV_DOKU.md": (
+        ).encode("utf-8"),
+        "CHANGELOG.md": b"# Changelog\n\n## [Unreleased]\n- Platzhalter.\n",
+        "DEV_DOKU.md": (
             "# DEV_DOKU\n\n## Zweck\nPlatzhalter für die Entwickler-Dokumentation.\n"
-        ),
-        root / "DONE.md": f"# DONE\n\n## {today}\n- Platzhalter.\n",
-        root
-        / "PROGRESS.md": (
+        ).encode("utf-8"),
+        "DONE.md": f"# DONE\n\n## {today}\n- Platzhalter.\n".encode("utf-8"),
+        "PROGRESS.md": (
             "# PROGRESS\n\n"
             f"Stand: {today}\n\n"
             "- Gesamt: 0 Tasks\n"
             "- Erledigt: 0 Tasks\n"
             "- Offen: 0 Tasks\n"
             "- Fortschritt: 0,00 %\n"
-        ),
+        ).encode("utf-8"),
     }
 
 
 def _backup_file(path: Path, dry_run: bool, repairs: List[str]) -> None:
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
     backup = path.with_name(f"{path.name}.bak_{timestamp}")
     if dry_run:
         repairs.append(f"Geplant: Backup anlegen: {backup}")
@@ -260,12 +330,12 @@ def _check_dir(
     repairs: List[str],
     dry_run: bool,
 ) -> None:
-    if not item.path.exists():
+    if not os.path.exists(item.path):
         if dry_run:
             repairs.append(f"Geplant: Ordner erstellen: {item.label} ({item.path}).")
             return
         try:
-            item.path.mkdir(parents=True, exist_ok=True)
+            os.makedirs(item.path, exist_ok=True)
             logging.info("Self-Repair: Ordner erstellt: %s (%s).", item.label, item.path)
             repairs.append(f"Ordner erstellt: {item.label} ({item.path}).")
             return
@@ -274,18 +344,50 @@ def _check_dir(
                 f"Self-Repair fehlgeschlagen: Ordner {item.label} ({item.path}). Grund: {exc}"
             )
             return
-    if not item.path.is_dir():
+    if not os.path.isdir(item.path):
         issues.append(f"Pfad ist kein Ordner: {item.label} ({item.path}).")
 
 
+def _create_parents(items: Iterable[RepairItem], known_dirs: set[str]) -> None:
+    """Legt fehlende Elternordner einmal vorab an statt je Datei (bekannte Ordner entfallen)."""
+    for parent in sorted({os.path.dirname(item.path) for item in items} - known_dirs):
+        try:
+            os.makedirs(parent, exist_ok=True)
+        except OSError as exc:
+            logging.warning("Self-Repair: Ordner nicht anlegbar: %s (%s).", parent, exc)
+
+
+def _scan_entries(folders: Iterable[str]) -> dict[str, os.DirEntry]:
+    """Ein os.scandir je Ordner; Schlüssel ist der volle Pfad (wie RepairItem.path)."""
+    entries: dict[str, os.DirEntry] = {}
+    for folder in folders:
+        try:
+            with os.scandir(folder) as scanned:
+                entries.update((entry.path, entry) for entry in scanned)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return entries
+
+
+def _has_permission(path: str, file_stat: os.stat_result, owner_bit: int, mode: int) -> bool:
+    """Eigene Datei: Rechte-Bit aus dem vorhandenen stat lesen; sonst (und für root) os.access."""
+    if _EUID and file_stat.st_uid == _EUID:
+        return bool(file_stat.st_mode & owner_bit)
+    return os.access(path, mode)
+
+
 def _check_file(
     item: RepairItem,
     issues: List[str],
     repairs: List[str],
     dry_run: bool,
-    defaults: dict[Path, str],
+    defaults: Mapping[str, bytes],
+    entries: dict[str, os.DirEntry],
 ) -> None:
-    if not item.path.exists():
+    entry = entries.get(item.path)
+    if entry is not None and entry.is_symlink() and not os.path.exists(item.path):
+        entry = None
+    if entry is None:
         default_content = defaults.get(item.path)
         if default_content is None:
             issues.append(f"Self-Repair: Keine Standarddaten für {item.label} ({item.path}).")
@@ -294,8 +396,7 @@ def _check_file(
             repairs.append(f"Geplant: Datei erstellen: {item.label} ({item.path}).")
             return
         try:
-            item.path.parent.mkdir(parents=True, exist_ok=True)
-            item.path.write_text(default_content, encoding="utf-8")
+            Path(item.path).write_bytes(default_content)
             logging.info("Self-Repair: Datei erstellt: %s (%s).", item.label, item.path)
             repairs.append(f"Datei erstellt: {item.label} ({item.path}).")
             return
@@ -304,16 +405,16 @@ def _check_file(
                 f"Self-Repair fehlgeschlagen: Datei {item.label} ({item.path}). Grund: {exc}"
             )
             return
-    if not item.path.is_file():
+    if not entry.is_file():
         issues.append(f"Pfad ist keine Datei: {item.label} ({item.path}).")
         return
-    if not os.access(item.path, os.R_OK):
+    file_stat = entry.stat()
+    if not _has_permission(item.path, file_stat, stat.S_IRUSR, os.R_OK):
         if dry_run:
             repairs.append(f"Geplant: Leserechte setzen: {item.label} ({item.path}).")
             return
         try:
-            mode = item.path.stat().st_mode
-            item.path.chmod(mode | stat.S_IRUSR)
+            os.chmod(item.path, file_stat.st_mode | stat.S_IRUSR)
             logging.info("Self-Repair: Leserechte gesetzt: %s (%s).", item.label, item.path)
             repairs.append(f"Leserechte repariert: {item.label} ({item.path}).")
             return
@@ -330,16 +431,17 @@ def _check_executable(
     repairs: List[str],
     dry_run: bool,
 ) -> None:
-    if not item.path.exists():
+    try:
+        file_stat = os.stat(item.path)
+    except (FileNotFoundError, NotADirectoryError):
         issues.append(f"Skript fehlt: {item.label} ({item.path}).")
         return
-    if not os.access(item.path, os.X_OK):
+    if not _has_permission(item.path, file_stat, stat.S_IXUSR, os.X_OK):
         if dry_run:
             repairs.append(f"Geplant: Ausführrechte setzen: {item.label} ({item.path}).")
             return
         try:
-            mode = item.path.stat().st_mode
-            item.path.chmod(mode | stat.S_IXUSR)
+            os.chmod(item.path, file_stat.st_mode | stat.S_IXUSR)
             logging.info(
                 "Self-Repair: Ausführrechte gesetzt: %s (%s).",
                 item.label,
@@ -360,25 +462,24 @@ def _check_json(
     issues: List[str],
     repairs: List[str],
     dry_run: bool,
-    defaults: dict[Path, str],
+    defaults: Mapping[str, bytes],
 ) -> None:
-    if not item.path.exists():
-        return
-    if not item.path.is_file():
+    if not os.path.isfile(item.path):
         return
     try:
-        json.loads(item.path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        with open(item.path, "rb") as handle:
+            json.loads(handle.read())
+    except (json.JSONDecodeError, UnicodeDecodeError):
         default_content = defaults.get(item.path)
         if default_content is None:
             issues.append(f"JSON ungültig: {item.label} ({item.path}).")
             return
         try:
-            _backup_file(item.path, dry_run, repairs)
+            _backup_file(Path(item.path), dry_run, repairs)
             if dry_run:
                 repairs.append(f"Geplant: JSON neu schreiben: {item.label} ({item.path}).")
                 return
-            item.path.write_text(default_content, encoding="utf-8")
+            Path(item.path).write_bytes(default_content)
             repairs.append(f"JSON repariert: {item.label} ({item.path}).")
         except OSError as exc:
             issues.append(
@@ -388,6 +489,16 @@ def _check_json(
         issues.append(f"JSON nicht lesbar: {item.label} ({item.path}). Grund: {exc}")
 
 
+def _check_json_local(
+    item: RepairItem, dry_run: bool, defaults: Mapping[str, bytes]
+) -> tuple[List[str], List[str]]:
+    """Thread-Variante von _check_json: eigene Listen, Zusammenführen in fester Reihenfolge."""
+    issues: List[str] = []
+    repairs: List[str] = []
+    _check_json(item, issues, repairs, dry_run, defaults)
+    return issues, repairs
+
+
 def run_self_repair(root: Path, dry_run: bool) -> tuple[List[str], List[str]]:
     ensure_path(root, "root", SelfRepairError)
     if not root.exists():
@@ -397,75 +508,25 @@ def run_self_repair(root: Path, dry_run: bool) -> tuple[List[str], List[str]]:
 
     issues: List[str] = []
     repairs: List[str] = []
-    defaults = build_default_files(root)
-
-    dir_items = _ensure_items(
-        [
-            RepairItem(root / "config", "Konfiguration"),
-            RepairItem(root / "system", "System"),
-            RepairItem(root / "scripts", "Skripte"),
-            RepairItem(root / "modules", "Module"),
-            RepairItem(root / "data", "Daten"),
-            RepairItem(root / "logs", "Logs"),
-            RepairItem(root / "tests", "Tests"),
-            RepairItem(root / "src", "Quellcode"),
-        ],
-        "Ordnerliste",
-    )
+    root_text = os.fspath(root)
+    defaults = build_default_files(root_text)
+
+    dir_items = _ensure_items(_build_items(root_text, _DIRS), "Ordnerliste")
     for item in dir_items:
         _check_dir(item, issues, repairs, dry_run)
-
-    file_items = _ensure_items(
-        [
-            RepairItem(root / "config" / "modules.json", "Modul-Liste"),
-            RepairItem(root / "config" / "launcher_gui.json", "GUI-Konfiguration"),
-            RepairItem(root / "config" / "requirements.txt", "Abhängigkeiten"),
-            RepairItem(root / "config" / "test_gate.json", "Test-Sperre"),
-            RepairItem(root / "config" / "module_selftests.json", "Modul-Selbsttests"),
-            RepairItem(root / "config" / "module_structure.json", "Modul-Struktur"),
-            RepairItem(root / "config" / "todo_config.json", "To-Do-Konfig"),
-            RepairItem(root / "config" / "filename_suffixes.json", "Suffix-Standards"),
-            RepairItem(root / "config" / "global_settings.json", "Global-Settings"),
-            RepairItem(root / "config" / "pin.json", "PIN-Konfiguration"),
-            RepairItem(root / "data" / "pin_state.json", "PIN-Status"),
-            RepairItem(root / "todo.txt", "To-Do-Liste"),
-            RepairItem(root / "CHANGELOG.md", "Changelog"),
-            RepairItem(root / "DEV_DOKU.md", "Entwickler-Dokumentation"),
-            RepairItem(root / "DONE.md", "Done-Liste"),
-            RepairItem(root / "PROGRESS.md", "Fortschritt"),
-        ],
-        "Dateiliste",
-    )
+    file_items = _ensure_items(_build_items(root_text, _CONFIG_FILES), "Dateiliste")
+    if not dry_run:
+        _create_parents(file_items, {root_text, *(item.path for item in dir_items)})
+    entries = _scan_entries(dict.fromkeys(os.path.dirname(item.path) for item in file_items))
     for item in file_items:
-        _check_file(item, issues, repairs, dry_run, defaults)
-
-    json_items = _ensure_items(
-        [
-            RepairItem(root / "config" / "modules.json", "Modul-Liste"),
-            RepairItem(root / "config" / "launcher_gui.json", "GUI-Konfiguration"),
-            RepairItem(root / "config" / "test_gate.json", "Test-Sperre"),
-            RepairItem(root / "config" / "module_selftests.json", "Modul-Selbsttests"),
-            RepairItem(root / "config" / "module_structure.json", "Modul-Struktur"),
-            RepairItem(root / "config" / "todo_config.json", "To-Do-Konfig"),
-            RepairItem(root / "config" / "filename_suffixes.json", "Suffix-Standards"),
-            RepairItem(root / "config" / "global_settings.json", "Global-Settings"),
-            RepairItem(root / "config" / "pin.json", "PIN-Konfiguration"),
-            RepairItem(root / "data" / "pin_state.json", "PIN-Status"),
-        ],
-        "JSON-Liste",
-    )
-    for item in json_items:
-        _check_json(item, issues, repairs, dry_run, defaults)
-
-    script_items = _ensure_items(
-        [
-            RepairItem(root / "scripts" / "start.sh", "Start-Routine"),
-            RepairItem(root / "scripts" / "run_tests.sh", "Testskript"),
-            RepairItem(root / "klick_start.sh", "Klick&Start"),
-        ],
-        "Skriptliste",
-    )
-    for item in script_items:
+        _check_file(item, issues, repairs, dry_run, defaults, entries)
+    json_items = _ensure_items(_build_items(root_text, _JSON_FILES), "JSON-Liste")
+    with ThreadPoolExecutor(max_workers=JSON_CHECK_WORKERS) as executor:
+        results = executor.map(lambda item: _check_json_local(item, dry_run, defaults), json_items)
+        for item_issues, item_repairs in results:
+            issues.extend(item_issues)
+            repairs.extend(item_repairs)
+    for item in _ensure_items(_build_items(root_text, _SCRIPTS), "Skriptliste"):
         _check_executable(item, issues, repairs, dry_run)
 
     filename_fixes = run_filename_fix(root, dry_run)
@@ -502,34 +563,33 @@ def setup_logging(debug: bool) -> None:
     setup_logging_center(debug)
 
 
-def _render_output(issues: Iterable[str], repairs: Iterable[str], dry_run: bool) -> str:
-    issues_list = list(issues)
-    repairs_list = list(repairs)
-    if not issues_list:
-        if repairs_list:
-            lines = [
-                "Self-Repair: Ausgeführt.",
-                "",
-            ]
-            lines.extend([f"- {repair}" for repair in repairs_list])
-            lines.append("")
-            lines.append("Self-Repair: Alle wichtigen Dateien und Ordner sind vorhanden.")
-            return "\n".join(lines)
+def _write_items(buffer: io.StringIO, items: Iterable[str]) -> None:
+    for item in items:
+        buffer.write(f"- {item}\n")
+
+
+def _render_output(issues: Sequence[str], repairs: Sequence[str], dry_run: bool) -> str:
+    if not issues and not repairs:
         return "Self-Repair: Keine Probleme gefunden."
 
-    lines = ["Self-Repair: Probleme gefunden:", ""]
-    lines.extend([f"- {issue}" for issue in issues_list])
-    if repairs_list:
-        lines.append("")
-        lines.append(
-            "Hinweis: Reparaturen wurden ausgeführt."
+    buffer = io.StringIO()
+    if not issues:
+        buffer.write("Self-Repair: Ausgeführt.\n\n")
+        _write_items(buffer, repairs)
+        buffer.write("\nSelf-Repair: Alle wichtigen Dateien und Ordner sind vorhanden.")
+        return buffer.getvalue()
+
+    buffer.write("Self-Repair: Probleme gefunden:\n\n")
+    _write_items(buffer, issues)
+    if repairs:
+        buffer.write(
+            "\nHinweis: Reparaturen wurden ausgeführt.\n"
             if not dry_run
-            else "Hinweis: Reparaturen sind geplant (dry-run)."
+            else "\nHinweis: Reparaturen sind geplant (dry-run).\n"
         )
-        lines.extend([f"- {repair}" for repair in repairs_list])
-    lines.append("")
-    lines.append("Bitte die Hinweise prüfen und erneut starten.")
-    return "\n".join(lines)
+        _write_items(buffer, repairs)
+    buffer.write("\nBitte die Hinweise prüfen und erneut starten.")
+    return buffer.getvalue()
 
 
 def main() -> int:
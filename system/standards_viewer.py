@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List
@@ -15,7 +17,7 @@ class StandardsViewerError(Exception):
     """Allgemeiner Fehler für die Standards-Anzeige."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StandardsSection:
     key: str
     title: str
@@ -37,10 +39,20 @@ def _build_sections(root: Path) -> List[StandardsSection]:
     ]
 
 
+@functools.lru_cache(maxsize=8)
+def _read_cached(path_text: str, mtime_ns: int, size: int) -> str:
+    """Liest eine Standards-Datei; mtime und Größe im Schlüssel erzwingen Neulesen nach Änderung."""
+    with open(path_text, "rb") as handle:
+        return handle.read().decode("utf-8").strip()
+
+
 def _load_section(section: StandardsSection) -> str:
-    if not section.path.exists():
-        raise StandardsViewerError(f"Datei fehlt: {section.path}")
-    content = section.path.read_text(encoding="utf-8").strip()
+    path_text = os.fspath(section.path)
+    try:
+        file_stat = os.stat(path_text)
+    except FileNotFoundError as exc:
+        raise StandardsViewerError(f"Datei fehlt: {section.path}") from exc
+    content = _read_cached(path_text, file_stat.st_mtime_ns, file_stat.st_size)
     if not content:
         raise StandardsViewerError(f"Datei ist leer: {section.path}")
     return content
@@ -48,13 +60,12 @@ def _load_section(section: StandardsSection) -> str:
 
 def _render_section(section: StandardsSection) -> str:
     body = _load_section(section)
-    header = f"{section.title}\n" + ("=" * len(section.title))
-    return "\n".join([header, "", body, ""])
+    return f"{section.title}\n{'=' * len(section.title)}\n\n{body}\n"
 
 
 def list_sections(sections: Iterable[StandardsSection]) -> str:
-    items = [f"- {section.key}: {section.title}" for section in sections]
-    return "Verfügbare Bereiche:\n" + "\n".join(items)
+    items = "\n".join(f"- {section.key}: {section.title}" for section in sections)
+    return f"Verfügbare Bereiche:\n{items}"
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -1,23 +1,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 if TYPE_CHECKING:
     from module_registry import ModuleEntry
 
+_MODULE_ID = attrgetter("module_id")
 
-@dataclass
+
+@dataclass(slots=True)
 class AppStore:
     _modules: Dict[str, "ModuleEntry"] = field(default_factory=dict)
     _settings: Dict[str, Any] = field(default_factory=dict)
     _logging: Dict[str, Any] = field(default_factory=dict)
+    # Unveränderliche Sicht auf _modules; wird nur in set_modules neu gebaut.
+    _modules_cache: tuple["ModuleEntry", ...] = ()
 
     def set_modules(self, entries: Iterable["ModuleEntry"]) -> None:
-        self._modules = {entry.module_id: entry for entry in entries}
+        entries_list = list(entries)
+        self._modules = dict(zip(map(_MODULE_ID, entries_list), entries_list))
+        self._modules_cache = tuple(self._modules.values())
 
-    def get_modules(self) -> List["ModuleEntry"]:
-        return list(self._modules.values())
+    def get_modules(self) -> tuple["ModuleEntry", ...]:
+        return self._modules_cache
 
     def get_module(self, module_id: str) -> Optional["ModuleEntry"]:
         return self._modules.get(module_id)
@@ -4,9 +4,10 @@
 from __future__ import annotations
 
 import argparse
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, Iterator
 
 from config_utils import ensure_path
 from logging_center import get_logger
@@ -17,7 +18,7 @@ class StructureCheckError(Exception):
     """Fehler im Struktur-Check."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StructureIssue:
     path: Path
     message: str
@@ -34,69 +35,93 @@ REQUIRED_DIRS = (
     "tests",
 )
 
-CONFIG_DISALLOWED_SUFFIXES = {".py", ".sh", ".bat", ".ps1", ".exe"}
-DATA_DISALLOWED_SUFFIXES = {".py", ".sh", ".bat", ".ps1", ".exe", ".toml", ".ini", ".yml", ".yaml"}
-SYSTEM_DISALLOWED_SUFFIXES = {".log", ".csv", ".tsv"}
+CONFIG_DISALLOWED_SUFFIXES: frozenset[str] = frozenset({".py", ".sh", ".bat", ".ps1", ".exe"})
+DATA_DISALLOWED_SUFFIXES: frozenset[str] = frozenset(
+    {".py", ".sh", ".bat", ".ps1", ".exe", ".toml", ".ini", ".yml", ".yaml"}
+)
+SYSTEM_DISALLOWED_SUFFIXES: frozenset[str] = frozenset({".log", ".csv", ".tsv"})
+# Werkzeug- und Cache-Ordner werden beim Durchlaufen übersprungen.
+SKIP_DIRS: frozenset[str] = frozenset(
+    {".git", "__pycache__", ".venv", "node_modules", ".mypy_cache", ".ruff_cache"}
+)
 
 
-def _iter_files(folder: Path) -> Iterable[Path]:
-    if not folder.exists():
-        return []
-    return (path for path in folder.rglob("*") if path.is_file())
+def _iter_files(folder: Path) -> Iterable[tuple[str, str]]:
+    """Liefert (Pfad, Name) aller Dateien; nutzt den d_type-Cache von os.scandir."""
+    stack = [os.fspath(folder)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path, entry.name
+        except (FileNotFoundError, NotADirectoryError):
+            continue
 
 
 def _collect_disallowed(
-    folder: Path, disallowed_suffixes: set[str], label: str
-) -> List[StructureIssue]:
-    issues: List[StructureIssue] = []
-    for path in _iter_files(folder):
-        if path.suffix.lower() in disallowed_suffixes:
-            issues.append(
-                StructureIssue(
-                    path=path,
-                    message=(
-                        f"{label}: Datei-Typ nicht erlaubt ({path.suffix}). "
-                        "Bitte in den passenden Ordner verschieben."
-                    ),
-                )
+    folder: Path, disallowed_suffixes: frozenset[str], label: str
+) -> Iterator[StructureIssue]:
+    for path, name in _iter_files(folder):
+        # Endung wie Path.suffix: ".bashrc" und "datei." zählen nicht.
+        dot = name.rfind(".")
+        if dot <= 0 or dot == len(name) - 1:
+            continue
+        suffix = name[dot:]
+        if suffix.lower() in disallowed_suffixes:
+            yield StructureIssue(
+                path=Path(path),
+                message=(
+                    f"{label}: Datei-Typ nicht erlaubt ({suffix}). "
+                    "Bitte in den passenden Ordner verschieben."
+                ),
             )
-    return issues
 
 
-def _check_required_dirs(root: Path) -> List[StructureIssue]:
-    issues: List[StructureIssue] = []
+def _scan_names(folder: Path) -> Dict[str, os.DirEntry]:
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _check_required_dirs(root: Path) -> Iterator[StructureIssue]:
+    existing = _scan_names(root)
     for entry in REQUIRED_DIRS:
         path = root / entry
-        if not path.exists():
-            issues.append(
-                StructureIssue(
-                    path=path,
-                    message=(
-                        "Pflichtordner fehlt. "
-                        "Bitte bootstrap.sh ausführen oder Ordner manuell anlegen."
-                    ),
-                )
+        dir_entry = existing.get(entry)
+        if dir_entry is None:
+            yield StructureIssue(
+                path=path,
+                message=(
+                    "Pflichtordner fehlt. "
+                    "Bitte bootstrap.sh ausführen oder Ordner manuell anlegen."
+                ),
             )
-        elif not path.is_dir():
-            issues.append(
-                StructureIssue(
-                    path=path,
-                    message="Pfad ist kein Ordner. Bitte Struktur korrigieren.",
-                )
+        elif not dir_entry.is_dir():
+            yield StructureIssue(
+                path=path,
+                message="Pfad ist kein Ordner. Bitte Struktur korrigieren.",
             )
-    return issues
 
 
-def run_check(root: Path) -> List[StructureIssue]:
+def run_check(root: Path) -> Iterator[StructureIssue]:
+    """Prüft root sofort und liefert Hinweise danach lazy (erlaubt Abbruch beim ersten Fund)."""
     ensure_path(root, "root", StructureCheckError)
-    issues: List[StructureIssue] = []
-    issues.extend(_check_required_dirs(root))
-    issues.extend(_collect_disallowed(root / "config", CONFIG_DISALLOWED_SUFFIXES, "Config"))
-    issues.extend(_collect_disallowed(root / "data", DATA_DISALLOWED_SUFFIXES, "Daten"))
-    issues.extend(_collect_disallowed(root / "logs", DATA_DISALLOWED_SUFFIXES, "Logs"))
-    issues.extend(_collect_disallowed(root / "system", SYSTEM_DISALLOWED_SUFFIXES, "Systemlogik"))
-    issues.extend(_collect_disallowed(root / "src", SYSTEM_DISALLOWED_SUFFIXES, "Systemlogik"))
-    return issues
+    return _iter_issues(root)
+
+
+def _iter_issues(root: Path) -> Iterator[StructureIssue]:
+    yield from _check_required_dirs(root)
+    yield from _collect_disallowed(root / "config", CONFIG_DISALLOWED_SUFFIXES, "Config")
+    yield from _collect_disallowed(root / "data", DATA_DISALLOWED_SUFFIXES, "Daten")
+    yield from _collect_disallowed(root / "logs", DATA_DISALLOWED_SUFFIXES, "Logs")
+    yield from _collect_disallowed(root / "system", SYSTEM_DISALLOWED_SUFFIXES, "Systemlogik")
+    yield from _collect_disallowed(root / "src", SYSTEM_DISALLOWED_SUFFIXES, "Systemlogik")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -118,7 +143,7 @@ def main() -> int:
     args = parser.parse_args()
     setup_logging_center(args.debug)
     logger = get_logger("structure_checker")
-    issues = run_check(args.root)
+    issues = list(run_check(args.root))
     if issues:
         logger.error("Struktur-Check: %s Hinweis(e) gefunden.", len(issues))
         for issue in issues:
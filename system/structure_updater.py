@@ -4,18 +4,38 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
 import logging
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Sequence
 
-from config_models import ConfigModelError, load_modules_config
+from config_models import (
+    ConfigModelError,
+    ModuleEntryModel,
+    ModulesConfigModel,
+    load_modules_config,
+)
 from config_utils import ensure_path
-from module_registry import ModuleRegistryError, load_manifest, resolve_entry_path
+from module_registry import (
+    ModuleManifest,
+    ModuleRegistryError,
+    load_manifest,
+    resolve_entry_path,
+)
 
 DEFAULT_ROOT = Path(__file__).resolve().parents[1]
+# Baumstruktur wird zeilenweise in 64-KiB-Blöcken geschrieben (kein zusammengesetzter Gesamttext).
+TREE_WRITE_BUFFER = 1 << 16
+# Versteckt, damit die Datei nicht selbst in der Baumstruktur auftaucht.
+FINGERPRINT_NAME = ".structure_fingerprint"
+_UTC = timezone.utc
 DEFAULT_SKIP = {
     ".git",
     ".venv",
@@ -31,7 +51,7 @@ class StructureUpdaterError(ValueError):
     """Fehler beim Struktur-Update."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModuleSnapshot:
     module_id: str
     name: str
@@ -42,7 +62,7 @@ class ModuleSnapshot:
     description: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateResult:
     tree_lines: List[str]
     manifest_payload: Dict[str, object]
@@ -50,83 +70,155 @@ class UpdateResult:
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
-
-
-def _sorted_entries(path: Path, skip: Sequence[str]) -> List[Path]:
-    entries = []
-    for entry in path.iterdir():
-        if entry.name in skip:
-            continue
-        if entry.name.startswith(".") and entry.name not in {".well-known"}:
-            continue
-        entries.append(entry)
-    return sorted(entries, key=lambda p: (not p.is_dir(), p.name.lower()))
-
-
-def _build_tree_lines(path: Path, skip: Sequence[str], prefix: str = "") -> List[str]:
+    return datetime.now(_UTC).isoformat(timespec="seconds")
+
+
+def _sorted_entries(path: str, skip: Sequence[str]) -> List[os.DirEntry]:
+    with os.scandir(path) as scanned:
+        entries = [
+            entry
+            for entry in scanned
+            if entry.name not in skip
+            and (not entry.name.startswith(".") or entry.name in {".well-known"})
+        ]
+    entries.sort(key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
+    return entries
+
+
+def _scan_listing(path: str, skip: Sequence[str]) -> Dict[str, List[os.DirEntry]]:
+    """Ein scandir je sichtbarem Ordner: Ordnerpfad -> sortierte Einträge (wie im Baum)."""
+    listing: Dict[str, List[os.DirEntry]] = {}
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        entries = listing[current] = _sorted_entries(current, skip)
+        stack.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+    return listing
+
+
+def _build_tree_lines(path: str, listing: Dict[str, List[os.DirEntry]]) -> List[str]:
+    """Iterativ mit eigenem Stapel (Einträge, Index, Präfix): keine Rekursionsgrenze."""
     lines: List[str] = []
-    entries = _sorted_entries(path, skip)
-    for index, entry in enumerate(entries):
-        connector = "└──" if index == len(entries) - 1 else "├──"
-        label = f"{entry.name}/" if entry.is_dir() else entry.name
-        lines.append(f"{prefix}{connector} {label}")
-        if entry.is_dir():
-            extension = "    " if index == len(entries) - 1 else "│   "
-            lines.extend(_build_tree_lines(entry, skip, prefix + extension))
+    stack = [(listing[path], 0, "")]
+    while stack:
+        entries, index, prefix = stack.pop()
+        if index >= len(entries):
+            continue
+        stack.append((entries, index + 1, prefix))
+        entry = entries[index]
+        is_last = index == len(entries) - 1
+        is_dir = entry.is_dir(follow_symlinks=False)
+        label = f"{entry.name}/" if is_dir else entry.name
+        lines.append(f"{prefix}{'└──' if is_last else '├──'} {label}")
+        if is_dir:
+            extension = "    " if is_last else "│   "
+            stack.append((listing[entry.path], 0, prefix + extension))
     return lines
 
 
-def build_tree(root: Path, skip: Sequence[str]) -> List[str]:
-    ensure_path(root, "root", StructureUpdaterError)
-    if not root.exists():
+def build_tree(
+    root: Path,
+    skip: Sequence[str],
+    now_iso: str | None = None,
+    listing: Dict[str, List[os.DirEntry]] | None = None,
+) -> List[str]:
+    """listing: bereits gelesene Ordner (_scan_listing); ohne Angabe wird der Baum gelesen."""
+    if __debug__:
+        ensure_path(root, "root", StructureUpdaterError)
+    root_stat = _stat_or_none(root)
+    if root_stat is None:
         raise StructureUpdaterError(f"Root-Pfad existiert nicht: {root}")
+    if not stat.S_ISDIR(root_stat.st_mode):
+        raise StructureUpdaterError(f"Root-Pfad ist kein Ordner: {root}")
+    root_text = os.fspath(root)
+    if listing is None:
+        listing = _scan_listing(root_text, frozenset(skip))
     tree = [f"Projektstruktur ({root.name})", ""]
-    tree.extend(_build_tree_lines(root, skip))
+    tree.extend(_build_tree_lines(root_text, listing))
     tree.append("")
-    tree.append(f"Stand: {_utc_now_iso()}")
+    tree.append(f"Stand: {now_iso or _utc_now_iso()}")
     return tree
 
 
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """Ein stat statt exists() + is_dir(); None, wenn der Pfad fehlt oder nicht lesbar ist."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _stamp(file_stat: os.stat_result) -> tuple[int, int]:
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+@functools.lru_cache(maxsize=8)
+def _load_modules_config_cached(path: Path, stamp: tuple[int, int]) -> ModulesConfigModel:
+    """Geparste Modul-Liste; ein neuer Stempel (mtime_ns, Größe) lädt neu, LRU begrenzt alte."""
+    return load_modules_config(path)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_manifest_cached(module_dir: Path, stamp: tuple[int, int]) -> ModuleManifest:
+    return load_manifest(module_dir)
+
+
+def _load_manifest(module_dir: Path) -> ModuleManifest:
+    manifest_stat = _stat_or_none(module_dir / "manifest.json")
+    if manifest_stat is None:
+        return load_manifest(module_dir)
+    return _load_manifest_cached(module_dir, _stamp(manifest_stat))
+
+
+def _load_snapshot(root: Path, entry: ModuleEntryModel) -> ModuleSnapshot:
+    module_dir = (root / entry.path).resolve()
+    module_stat = _stat_or_none(module_dir)
+    if module_stat is None:
+        raise StructureUpdaterError(f"Modulordner fehlt: {module_dir}")
+    if not stat.S_ISDIR(module_stat.st_mode):
+        raise StructureUpdaterError(f"Modulpfad ist kein Ordner: {module_dir}")
+    try:
+        manifest = _load_manifest(module_dir)
+    except ModuleRegistryError as exc:
+        raise StructureUpdaterError(str(exc)) from exc
+    try:
+        resolved_entry = resolve_entry_path(module_dir, manifest.entry)
+    except ModuleRegistryError as exc:
+        raise StructureUpdaterError(str(exc)) from exc
+    if _stat_or_none(resolved_entry) is None:
+        raise StructureUpdaterError(f"Entry-Datei fehlt: {resolved_entry}")
+    return ModuleSnapshot(
+        module_id=manifest.module_id,
+        name=manifest.name,
+        version=manifest.version,
+        entry=manifest.entry,
+        path=str(Path(entry.path).as_posix()),
+        enabled=entry.enabled,
+        description=entry.description,
+    )
+
+
 def _load_module_snapshots(root: Path) -> List[ModuleSnapshot]:
     config_path = root / "config" / "modules.json"
-    if not config_path.exists():
+    config_stat = _stat_or_none(config_path)
+    if config_stat is None:
         raise StructureUpdaterError(f"Module-Konfiguration fehlt: {config_path}")
     try:
-        config = load_modules_config(config_path)
+        config = _load_modules_config_cached(config_path, _stamp(config_stat))
     except ConfigModelError as exc:
         raise StructureUpdaterError(str(exc)) from exc
 
-    snapshots: List[ModuleSnapshot] = []
-    for entry in config.modules:
-        module_dir = (root / entry.path).resolve()
-        if not module_dir.exists():
-            raise StructureUpdaterError(f"Modulordner fehlt: {module_dir}")
-        try:
-            manifest = load_manifest(module_dir)
-        except ModuleRegistryError as exc:
-            raise StructureUpdaterError(str(exc)) from exc
-        try:
-            resolved_entry = resolve_entry_path(module_dir, manifest.entry)
-        except ModuleRegistryError as exc:
-            raise StructureUpdaterError(str(exc)) from exc
-        if not resolved_entry.exists():
-            raise StructureUpdaterError(f"Entry-Datei fehlt: {resolved_entry}")
-        snapshots.append(
-            ModuleSnapshot(
-                module_id=manifest.module_id,
-                name=manifest.name,
-                version=manifest.version,
-                entry=manifest.entry,
-                path=str(Path(entry.path).as_posix()),
-                enabled=entry.enabled,
-                description=entry.description,
-            )
-        )
-    return snapshots
+    modules = config.modules
+    if len(modules) < 2:
+        return [_load_snapshot(root, entry) for entry in modules]
+    # IO-gebunden (stat + Lesen je Manifest): parallel laden, map erhält die Reihenfolge.
+    with ThreadPoolExecutor(max_workers=min(32, len(modules))) as executor:
+        return list(executor.map(functools.partial(_load_snapshot, root), modules))
 
 
-def _build_manifest_payload(modules: Iterable[ModuleSnapshot]) -> Dict[str, object]:
+def _build_manifest_payload(
+    modules: Iterable[ModuleSnapshot], now_iso: str | None = None
+) -> Dict[str, object]:
     module_list = [
         {
             "id": module.module_id,
@@ -138,12 +230,14 @@ def _build_manifest_payload(modules: Iterable[ModuleSnapshot]) -> Dict[str, obje
         for module in modules
     ]
     return {
-        "generated_at": _utc_now_iso(),
+        "generated_at": now_iso or _utc_now_iso(),
         "modules": module_list,
     }
 
 
-def _build_register_payload(modules: Iterable[ModuleSnapshot]) -> Dict[str, object]:
+def _build_register_payload(
+    modules: Iterable[ModuleSnapshot], now_iso: str | None = None
+) -> Dict[str, object]:
     entries = [
         {
             "id": module.module_id,
@@ -157,16 +251,73 @@ def _build_register_payload(modules: Iterable[ModuleSnapshot]) -> Dict[str, obje
     ]
     return {
         "_hinweis": "Automatisch gepflegt. Bitte nicht manuell bearbeiten.",
-        "generated_at": _utc_now_iso(),
+        "generated_at": now_iso or _utc_now_iso(),
         "entries": entries,
     }
 
 
+def _input_stamps(root: Path) -> Iterable[str]:
+    """Stempel der Modul-Konfiguration und aller Modul-Manifeste (ein stat je Datei)."""
+    config_path = root / "config" / "modules.json"
+    config_stat = _stat_or_none(config_path)
+    if config_stat is None:
+        raise StructureUpdaterError(f"Module-Konfiguration fehlt: {config_path}")
+    yield f"{config_path}:{_stamp(config_stat)}"
+    try:
+        config = _load_modules_config_cached(config_path, _stamp(config_stat))
+    except ConfigModelError as exc:
+        raise StructureUpdaterError(str(exc)) from exc
+    for entry in config.modules:
+        manifest_path = root / entry.path / "manifest.json"
+        manifest_stat = _stat_or_none(manifest_path)
+        yield f"{manifest_path}:{_stamp(manifest_stat) if manifest_stat else None}"
+
+
+def _fingerprint(
+    root: Path,
+    skip: Sequence[str],
+    listing: Dict[str, List[os.DirEntry]],
+    added: Iterable[str] = (),
+) -> str:
+    """Hash über alle sichtbaren Namen (wie in der Baumstruktur) und die Modul-Stempel.
+
+    added: Dateipfade, die seit dem Lesen von listing neu angelegt wurden.
+    """
+    names = {
+        f"{entry.path}{'/' if entry.is_dir(follow_symlinks=False) else ''}"
+        for entries in listing.values()
+        for entry in entries
+    }
+    names.update(added)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\0".join(sorted(skip)).encode("utf-8"))
+    for name in sorted(names):
+        digest.update(f"\0{name}".encode("utf-8", "surrogateescape"))
+    for stamp in _input_stamps(root):
+        digest.update(f"\0{stamp}".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def _load_unchanged_result(data_dir: Path, fingerprint: str) -> UpdateResult | None:
+    """Vorheriges Ergebnis von der Platte, wenn der gespeicherte Fingerabdruck passt."""
+    try:
+        if (data_dir / FINGERPRINT_NAME).read_text(encoding="utf-8").strip() != fingerprint:
+            return None
+        tree_lines = (data_dir / "baumstruktur.txt").read_text(encoding="utf-8").splitlines()
+        manifest_payload = json.loads((data_dir / "manifest.json").read_bytes())
+        register_payload = json.loads((data_dir / "dummy_register.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+    return UpdateResult(
+        tree_lines=tree_lines,
+        manifest_payload=manifest_payload,
+        register_payload=register_payload,
+    )
+
+
 def _write_json(path: Path, payload: Dict[str, object], write: bool) -> None:
-    ensure_path(path, "path", StructureUpdaterError)
-    content = json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
     if write:
-        path.write_text(content, encoding="utf-8")
+        path.write_bytes(json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8") + b"\n")
 
 
 def run_update(
@@ -174,25 +325,56 @@ def run_update(
     write: bool,
     skip: Sequence[str],
     logger: logging.Logger,
+    force: bool = False,
+    need_payloads: bool = False,
 ) -> UpdateResult:
-    ensure_path(root, "root", StructureUpdaterError)
-    tree_lines = build_tree(root, skip)
+    """Im Testlauf (write=False) werden Module nur geprüft; Payloads nur mit need_payloads."""
+    if __debug__:
+        ensure_path(root, "root", StructureUpdaterError)
+    data_dir = root / "data"
+    skip_set = frozenset(skip)
+    listing = None
+    if write and _stat_or_none(root) is not None:
+        # Ein Durchlauf über den Baum für Fingerabdruck und Baumstruktur.
+        listing = _scan_listing(os.fspath(root), skip_set)
+        if not force:
+            unchanged = _load_unchanged_result(data_dir, _fingerprint(root, skip_set, listing))
+            if unchanged is not None:
+                logger.info("Struktur unverändert: Dateien werden nicht neu geschrieben.")
+                return unchanged
+    # Ein Zeitstempel für Baum, Manifest und Register desselben Laufs.
+    now_iso = _utc_now_iso()
+    tree_lines = build_tree(root, skip_set, now_iso, listing)
     module_snapshots = _load_module_snapshots(root)
-    manifest_payload = _build_manifest_payload(module_snapshots)
-    register_payload = _build_register_payload(module_snapshots)
+    if write or need_payloads:
+        manifest_payload = _build_manifest_payload(module_snapshots, now_iso)
+        register_payload = _build_register_payload(module_snapshots, now_iso)
+    else:
+        manifest_payload = {}
+        register_payload = {}
 
     if write:
-        tree_path = root / "data" / "baumstruktur.txt"
-        tree_path.write_text("\n".join(tree_lines) + "\n", encoding="utf-8")
+        tree_path = data_dir / "baumstruktur.txt"
+        with tree_path.open("w", encoding="utf-8", buffering=TREE_WRITE_BUFFER) as handle:
+            handle.writelines(f"{line}\n" for line in tree_lines)
         logger.info("Baumstruktur aktualisiert: %s", tree_path)
 
-        manifest_path = root / "data" / "manifest.json"
+        manifest_path = data_dir / "manifest.json"
         _write_json(manifest_path, manifest_payload, write=True)
         logger.info("Manifest aktualisiert: %s", manifest_path)
 
-        register_path = root / "data" / "dummy_register.json"
+        register_path = data_dir / "dummy_register.json"
         _write_json(register_path, register_payload, write=True)
         logger.info("Register aktualisiert: %s", register_path)
+
+        # Ausgabedateien, die der nächste Lauf im Baum sieht, kommen zum gelesenen Stand dazu.
+        outputs = (
+            os.fspath(path)
+            for path in (tree_path, manifest_path, register_path)
+            if os.fspath(data_dir) in listing and path.name not in skip_set
+        )
+        fingerprint = _fingerprint(root, skip_set, listing, outputs)
+        (data_dir / FINGERPRINT_NAME).write_text(fingerprint + "\n", encoding="utf-8")
     else:
         logger.info("Testlauf aktiv: Dateien werden nicht geschrieben.")
 
@@ -220,6 +402,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Änderungen schreiben (sonst nur prüfen).",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Auch ohne Änderungen neu schreiben (Fingerabdruck ignorieren).",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -238,7 +425,7 @@ def main() -> int:
     logger = logging.getLogger("structure-updater")
 
     try:
-        run_update(args.root, args.write, sorted(DEFAULT_SKIP), logger)
+        run_update(args.root, args.write, sorted(DEFAULT_SKIP), logger, force=args.force)
     except StructureUpdaterError as exc:
         logger.error("Struktur-Update fehlgeschlagen: %s", exc)
         return 2
@@ -16,17 +16,21 @@ from typing import Iterable, List
 from config_utils import ensure_path
 from logging_center import get_logger
 from logging_center import setup_logging as setup_logging_center
+from todo_manager import LINE_BREAKS, TASK_RE, iter_todo_lines
 
 CONFIG_DEFAULT = Path(__file__).resolve().parents[1] / "config" / "test_gate.json"
 TASK_PATTERN = re.compile(r"^\[(x|X| )\]\s+")
 DONE_PATTERN = re.compile(r"^\[(x|X)\]\s+")
+# TASK_RE aus todo_manager, wie TASK_PATTERN zusätzlich mit Leerraum und Text nach "]".
+TASK_TEXT_RE = re.compile(rf"{TASK_RE.pattern}[^\S{LINE_BREAKS}]+\S")
+_UTC = timezone.utc
 
 
 class TestGateError(Exception):
     """Allgemeiner Fehler für die Test-Sperre."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TestGateConfig:
     threshold: int
     todo_path: Path
@@ -34,7 +38,7 @@ class TestGateConfig:
     tests_command: List[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TestState:
     last_done: int
     last_run: str | None
@@ -42,10 +46,12 @@ class TestState:
 
 
 def _load_json(path: Path) -> dict:
-    if not path.exists():
-        raise TestGateError(f"Konfiguration fehlt: {path}")
+    """Liest binär; der JSON-Parser dekodiert UTF-8 selbst (kein Zwischen-String)."""
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        with path.open("rb") as handle:
+            return json.load(handle)
+    except FileNotFoundError as exc:
+        raise TestGateError(f"Konfiguration fehlt: {path}") from exc
     except json.JSONDecodeError as exc:
         raise TestGateError(f"Konfiguration ist kein gültiges JSON: {path}") from exc
 
@@ -85,7 +91,8 @@ def load_config(config_path: Path | None = None) -> TestGateConfig:
 
 
 def load_state(state_path: Path) -> TestState:
-    ensure_path(state_path, "state_path", TestGateError)
+    if __debug__:
+        ensure_path(state_path, "state_path", TestGateError)
     if not state_path.exists():
         return TestState(last_done=0, last_run=None, last_result=None)
     try:
@@ -105,29 +112,29 @@ def load_state(state_path: Path) -> TestState:
 
 
 def save_state(state_path: Path, last_done: int, result: str) -> None:
-    ensure_path(state_path, "state_path", TestGateError)
+    if __debug__:
+        ensure_path(state_path, "state_path", TestGateError)
     state_path.parent.mkdir(parents=True, exist_ok=True)
     payload = {
         "last_done": last_done,
-        "last_run": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "last_run": datetime.now(_UTC).isoformat(timespec="seconds"),
         "last_result": result,
     }
-    state_path.write_text(
-        json.dumps(payload, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    temporary = state_path.with_suffix(state_path.suffix + ".tmp")
+    temporary.write_bytes(json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8") + b"\n")
+    temporary.replace(state_path)
 
 
 def count_tasks(lines: Iterable[str]) -> tuple[int, int]:
+    """Zählt (gesamt, erledigt); lines darf auch ein Datei-Iterator sein."""
     total = 0
     done = 0
-    for line in lines:
-        stripped = line.strip()
-        if not TASK_PATTERN.match(stripped):
-            continue
-        total += 1
-        if DONE_PATTERN.match(stripped):
-            done += 1
+    finditer = TASK_TEXT_RE.finditer
+    for text in lines:
+        for match in finditer(text):
+            total += 1
+            if match.group(1) != " ":
+                done += 1
     return total, done
 
 
@@ -145,8 +152,8 @@ def evaluate_gate(done_count: int, last_done: int, threshold: int) -> tuple[bool
 
 def run_tests(command: List[str]) -> int:
     logging.info("Tests werden gestartet: %s", " ".join(command))
-    result = subprocess.run(command, check=False)
-    return result.returncode
+    # call statt run: nur der Rückgabewert wird gebraucht, Ausgabe geht direkt ans Terminal.
+    return subprocess.call(command, close_fds=True)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -175,8 +182,7 @@ def main() -> int:
         logger.error("To-Do-Datei nicht gefunden: %s", config.todo_path)
         return 2
 
-    todo_lines = config.todo_path.read_text(encoding="utf-8").splitlines()
-    total, done = count_tasks(todo_lines)
+    total, done = count_tasks(iter_todo_lines(config.todo_path))
     should_run, diff = evaluate_gate(done, state.last_done, config.threshold)
 
     logger.info("Stand: %s erledigt von %s Aufgaben.", done, total)
@@ -6,33 +6,40 @@ from __future__ import annotations
 import argparse
 import json
 import logging
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 from config_utils import ensure_path
 from logging_center import setup_logging as setup_logging_center
 
 CONFIG_DEFAULT = Path(__file__).resolve().parents[1] / "config" / "todo_config.json"
+ARCHIVE_HEADER = "# Archiv für erledigte To-Dos\n"
+# Zeilenumbrüche wie str.splitlines(); Aufgabenzeile wie parse_status(line.strip()).
+LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+TASK_RE = re.compile(rf"(?:\A|(?<=[{LINE_BREAKS}]))[^\S{LINE_BREAKS}]*\[([ xX])\]")
+_UTC = timezone.utc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TodoConfig:
     todo_path: Path
     archive_path: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Progress:
     total: int
     done: int
+    # Einmal beim Anlegen berechnet (Bericht und Log lesen den Wert mehrfach).
+    percent: float = field(init=False)
 
-    @property
-    def percent(self) -> float:
-        if self.total <= 0:
-            return 0.0
-        return round((self.done / self.total) * 100.0, 2)
+    def __post_init__(self) -> None:
+        percent = round((self.done / self.total) * 100.0, 2) if self.total > 0 else 0.0
+        object.__setattr__(self, "percent", percent)
 
 
 class TodoError(Exception):
@@ -40,7 +47,7 @@ class TodoError(Exception):
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+    return datetime.now(_UTC).isoformat(timespec="seconds")
 
 
 def _format_percent(value: float) -> str:
@@ -50,10 +57,12 @@ def _format_percent(value: float) -> str:
 
 
 def _load_json(path: Path) -> dict:
-    if not path.exists():
-        raise TodoError(f"Konfiguration fehlt: {path}")
+    """Liest binär; der JSON-Parser dekodiert UTF-8 selbst (kein Zwischen-String)."""
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        with path.open("rb") as handle:
+            return json.load(handle)
+    except FileNotFoundError as exc:
+        raise TodoError(f"Konfiguration fehlt: {path}") from exc
     except json.JSONDecodeError as exc:
         raise TodoError(f"Konfiguration ist kein gültiges JSON: {path}") from exc
 
@@ -67,49 +76,89 @@ def load_config(config_path: Path | None = None) -> TodoConfig:
     return TodoConfig(todo_path=todo_path, archive_path=archive_path)
 
 
+def iter_todo_lines(todo_path: Path) -> Iterator[str]:
+    """Liest die To-Do-Datei zeilenweise (für Zählungen; ohne Liste im Speicher)."""
+    if __debug__:
+        ensure_path(todo_path, "todo_path", TodoError)
+    if not todo_path.exists():
+        raise TodoError(f"To-Do-Datei nicht gefunden: {todo_path}")
+    with todo_path.open("r", encoding="utf-8") as handle:
+        yield from handle
+
+
 def read_todo_lines(todo_path: Path) -> List[str]:
-    ensure_path(todo_path, "todo_path", TodoError)
+    if __debug__:
+        ensure_path(todo_path, "todo_path", TodoError)
     if not todo_path.exists():
         raise TodoError(f"To-Do-Datei nicht gefunden: {todo_path}")
     return todo_path.read_text(encoding="utf-8").splitlines(keepends=True)
 
 
+def read_todo_bytes(todo_path: Path) -> bytes:
+    """Liest die To-Do-Datei als Bytes (für progress_from_bytes)."""
+    if __debug__:
+        ensure_path(todo_path, "todo_path", TodoError)
+    try:
+        return todo_path.read_bytes()
+    except FileNotFoundError:
+        raise TodoError(f"To-Do-Datei nicht gefunden: {todo_path}") from None
+
+
 def write_todo_lines(todo_path: Path, lines: Iterable[str]) -> None:
-    ensure_path(todo_path, "todo_path", TodoError)
-    todo_path.write_text("".join(lines), encoding="utf-8")
+    """Schreibt atomar über eine .tmp-Datei, damit todo.txt nie halb geschrieben ist."""
+    if __debug__:
+        ensure_path(todo_path, "todo_path", TodoError)
+    temporary = todo_path.with_suffix(todo_path.suffix + ".tmp")
+    temporary.write_text("".join(lines), encoding="utf-8")
+    temporary.replace(todo_path)
+
+
+# Status nach den ersten drei Zeichen: (ist Aufgabe, ist erledigt).
+_STATUS = {"[x]": (True, True), "[X]": (True, True), "[ ]": (True, False)}
+_NO_TASK = (False, False)
 
 
 def parse_status(line: str) -> Tuple[bool, bool]:
-    if not line.startswith("["):
-        return False, False
-    if line.startswith("[x]") or line.startswith("[X]"):
-        return True, True
-    if line.startswith("[ ]"):
-        return True, False
-    return False, False
+    return _STATUS.get(line[:3], _NO_TASK)
 
 
 def calculate_progress(lines: Iterable[str]) -> Progress:
+    """Zählt Aufgaben; lines darf auch ein Datei-Iterator oder ein einzelner Gesamttext sein."""
     total = 0
     done = 0
-    for line in lines:
-        is_task, is_done = parse_status(line.strip())
-        if not is_task:
-            continue
-        total += 1
-        if is_done:
-            done += 1
+    finditer = TASK_RE.finditer
+    for text in lines:
+        for match in finditer(text):
+            total += 1
+            if match.group(1) != " ":
+                done += 1
     return Progress(total=total, done=done)
 
 
+def progress_from_text(text: str) -> Progress:
+    """Zählt Aufgaben in einem Regex-Durchlauf über den ganzen Text."""
+    return calculate_progress((text,))
+
+
+# Jede Aufgabenzeile enthält einen dieser Marker; fehlen alle, entfällt das Dekodieren.
+_MARKERS = (b"[ ]", b"[x]", b"[X]")
+
+
+def progress_from_bytes(blob: bytes) -> Progress:
+    """Zählt Aufgaben in UTF-8-Bytes: Marker-Suche in C, dann ein Regex-Durchlauf."""
+    if not any(marker in blob for marker in _MARKERS):
+        return Progress(total=0, done=0)
+    return progress_from_text(blob.decode("utf-8"))
+
+
 def build_progress_report(progress: Progress, reference_date: str | None = None) -> str:
     if not isinstance(progress, Progress):
         raise TodoError("progress ist kein Progress-Objekt.")
     if reference_date is None:
-        reference_date = datetime.now(timezone.utc).date().isoformat()
+        reference_date = datetime.now(_UTC).date().isoformat()
     else:
         try:
-            datetime.fromisoformat(reference_date)
+            date.fromisoformat(reference_date)
         except ValueError as exc:
             raise TodoError("Stand-Datum ist ungültig. Erwartet: JJJJ-MM-TT.") from exc
 
@@ -131,36 +180,50 @@ def build_progress_report(progress: Progress, reference_date: str | None = None)
 
 
 def write_progress_report(progress: Progress, progress_path: Path) -> None:
-    ensure_path(progress_path, "progress_path", TodoError)
-    report = build_progress_report(progress)
-    progress_path.write_text(report, encoding="utf-8")
+    if __debug__:
+        ensure_path(progress_path, "progress_path", TodoError)
+    payload = build_progress_report(progress).encode("utf-8")
+    # Gleicher Inhalt: nicht neu schreiben (keine mtime-Änderung, keine Datei-Beobachter).
+    try:
+        if progress_path.read_bytes() == payload:
+            return
+    except FileNotFoundError:
+        pass
+    progress_path.write_bytes(payload)
     if not progress_path.exists():
         raise TodoError("PROGRESS.md konnte nicht geschrieben werden.")
 
 
 def archive_completed_tasks(todo_path: Path, archive_path: Path) -> Tuple[int, int]:
-    ensure_path(todo_path, "todo_path", TodoError)
-    ensure_path(archive_path, "archive_path", TodoError)
+    # todo_path prüft read_todo_bytes; -O entfernt die Typprüfungen.
+    if __debug__:
+        ensure_path(archive_path, "archive_path", TodoError)
 
-    lines = read_todo_lines(todo_path)
+    # Bytes einmal dekodieren: offene Zeilen behalten ihre Zeilenenden unverändert.
+    lines = read_todo_bytes(todo_path).decode("utf-8").splitlines(keepends=True)
     remaining: List[str] = []
     archived: List[str] = []
+    # Ein Zeitstempel für alle Einträge desselben Archivlaufs.
+    archived_suffix = f" | archiviert: {_utc_now_iso()}\n"
 
     for line in lines:
         is_task, is_done = parse_status(line.strip())
         if is_task and is_done:
-            archived.append(f"{line.rstrip()} | archiviert: {_utc_now_iso()}\n")
+            archived.append(line.rstrip() + archived_suffix)
         else:
             remaining.append(line)
 
     if archived:
-        archive_path.parent.mkdir(parents=True, exist_ok=True)
-        if not archive_path.exists():
-            archive_path.write_text("# Archiv für erledigte To-Dos\n", encoding="utf-8")
-        with archive_path.open("a", encoding="utf-8") as handle:
-            handle.writelines(archived)
-
-    write_todo_lines(todo_path, remaining)
+        archived_text = "".join(archived)
+        try:
+            os.stat(archive_path)
+        except FileNotFoundError:
+            archive_path.parent.mkdir(parents=True, exist_ok=True)
+            archived_text = ARCHIVE_HEADER + archived_text
+        with archive_path.open("ab") as handle:
+            handle.write(archived_text.encode("utf-8"))
+        # Ohne erledigte Einträge bleibt todo.txt unangetastet (kein Neuschreiben).
+        write_todo_lines(todo_path, remaining)
     return len(archived), len(remaining)
 
 
@@ -169,8 +232,7 @@ def setup_logging(debug: bool) -> None:
 
 
 def run_progress(config: TodoConfig, progress_path: Path | None = None) -> int:
-    lines = read_todo_lines(config.todo_path)
-    progress = calculate_progress(lines)
+    progress = progress_from_bytes(read_todo_bytes(config.todo_path))
     logging.info(
         "Fortschritt: %s%% (erledigt: %s von %s)",
         f"{progress.percent:.2f}",
@@ -3,8 +3,14 @@
 
 from __future__ import annotations
 
+import functools
+import weakref
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from logging_center import get_logger
 
 
 class UndoRedoError(Exception):
@@ -12,62 +18,252 @@ class UndoRedoError(Exception):
 
 
 ActionCallback = Callable[[], None]
+# Wendet einen Diff auf das Objekt mit anchor_id an; der bool ist True für Undo.
+DiffApplier = Callable[[int, bytes, bool], None]
+# Gemeinsame, schreibgeschützte Metadaten: kein neues dict je Aktion.
+_EMPTY_METADATA: Mapping[str, object] = MappingProxyType({})
+
+
+def _empty_metadata() -> Mapping[str, object]:
+    return _EMPTY_METADATA
+
 
+LOGGER = get_logger("undo_redo")
+# Obergrenze für limit, damit lange Sitzungen den Speicher nicht unbegrenzt füllen.
+MAX_UNDO_STACK_SIZE = 10_000
 
-@dataclass(frozen=True)
+
+@functools.lru_cache(maxsize=256)
+def intern_metadata(items: Tuple[Tuple[str, object], ...]) -> Mapping[str, object]:
+    """Liefert für gleiche (Schlüssel, Wert)-Paare dieselbe schreibgeschützte Metadaten-Map."""
+    return MappingProxyType(dict(items))
+
+
+@dataclass(frozen=True, slots=True)
 class UndoRedoAction:
     name: str
     undo: ActionCallback
     redo: ActionCallback
-    metadata: dict = field(default_factory=dict)
+    metadata: Mapping[str, object] = field(default_factory=_empty_metadata)
+
+    def __post_init__(self) -> None:
+        # Einmal beim Anlegen prüfen; record() vertraut danach der (unveränderlichen) Aktion.
+        if not callable(self.undo) or not callable(self.redo):
+            raise UndoRedoError("Undo/Redo-Funktion fehlt.")
+
+    @classmethod
+    def bind_weak(
+        cls,
+        name: str,
+        target: object,
+        undo_method: str,
+        redo_method: str,
+        *args: object,
+        metadata: Optional[Mapping[str, object]] = None,
+    ) -> UndoRedoAction:
+        """Aktion mit schwacher Referenz auf target: Der Verlauf hält großen Zustand nicht fest."""
+        for method in (undo_method, redo_method):
+            if not callable(getattr(target, method, None)):
+                raise UndoRedoError(f"Methode fehlt am Ziel: {method}")
+        return cls(
+            name=name,
+            undo=_WeakCall(target, undo_method, args),
+            redo=_WeakCall(target, redo_method, args),
+            metadata=_EMPTY_METADATA if metadata is None else metadata,
+        )
+
+
+class _WeakCall:
+    """Ruft target.<method>(*args) auf, solange target noch lebt; sonst nur ein Debug-Log."""
+
+    __slots__ = ("_target", "_method", "_args")
+
+    def __init__(self, target: object, method: str, args: Tuple[object, ...]) -> None:
+        self._target = weakref.ref(target)
+        self._method = method
+        self._args = args
+
+    def __call__(self) -> None:
+        target = self._target()
+        if target is None:
+            LOGGER.debug("Undo/Redo übersprungen, Ziel existiert nicht mehr: %s", self._method)
+            return
+        getattr(target, self._method)(*self._args)
+
+
+@dataclass(frozen=True, slots=True)
+class RestoreOp:
+    """Delta-Eintrag: nur Anker-ID und Diff statt Closures über den ganzen Zustand."""
+
+    name: str
+    kind: str
+    anchor_id: int
+    diff: bytes
+
+
+UndoRedoEntry = Union[UndoRedoAction, RestoreOp]
 
 
 class UndoRedoManager:
+    __slots__ = (
+        "_limit",
+        "_capacity",
+        "_buffer",
+        "_start",
+        "_undo_count",
+        "_redo_count",
+        "_appliers",
+        "_batch",
+    )
+
     def __init__(self, limit: int = 100) -> None:
         if not isinstance(limit, int) or limit < 1:
             raise UndoRedoError("limit ist ungültig.")
+        if limit > MAX_UNDO_STACK_SIZE:
+            LOGGER.warning("Undo-Limit %s ist zu groß, verwende %s.", limit, MAX_UNDO_STACK_SIZE)
+            limit = MAX_UNDO_STACK_SIZE
         self._limit = limit
-        self._undo_stack: List[UndoRedoAction] = []
-        self._redo_stack: List[UndoRedoAction] = []
+        # Ringpuffer: ab _start liegen die Undo-Einträge, direkt dahinter die Redo-Einträge.
+        # Undo/Redo verschiebt nur die Zähler. Ein Platz mehr als limit bleibt immer frei
+        # (None), und freie Plätze werden stets geleert: Die Nachbarn des Bereichs sind damit
+        # None, peek_undo()/peek_redo() brauchen keine Fallunterscheidung.
+        self._capacity = limit + 1
+        self._buffer: List[Optional[UndoRedoEntry]] = [None] * self._capacity
+        self._start = 0
+        self._undo_count = 0
+        self._redo_count = 0
+        self._appliers: Dict[str, DiffApplier] = {}
+        # Offene record_group(): Einträge werden gesammelt statt einzeln abgelegt.
+        self._batch: Optional[List[UndoRedoEntry]] = None
 
     @property
     def limit(self) -> int:
         return self._limit
 
     def can_undo(self) -> bool:
-        return bool(self._undo_stack)
+        return self._undo_count > 0
 
     def can_redo(self) -> bool:
-        return bool(self._redo_stack)
+        return self._redo_count > 0
 
-    def record(self, action: UndoRedoAction) -> None:
-        if not isinstance(action, UndoRedoAction):
-            raise UndoRedoError("action ist keine UndoRedoAction.")
-        if not callable(action.undo) or not callable(action.redo):
-            raise UndoRedoError("Undo/Redo-Funktion fehlt.")
-        self._undo_stack.append(action)
-        self._redo_stack.clear()
-        if len(self._undo_stack) > self._limit:
-            self._undo_stack.pop(0)
+    def trim(self, n: int) -> int:
+        """Kürzt auf je höchstens n Undo- und Redo-Einträge (älteste bzw. fernste zuerst)."""
+        if not isinstance(n, int) or n < 0:
+            raise UndoRedoError("n ist ungültig.")
+        buffer = self._buffer
+        capacity = self._capacity
+        removed = 0
+        while self._undo_count > n:
+            buffer[self._start] = None
+            self._start = (self._start + 1) % capacity
+            self._undo_count -= 1
+            removed += 1
+        while self._redo_count > n:
+            buffer[(self._start + self._undo_count + self._redo_count - 1) % capacity] = None
+            self._redo_count -= 1
+            removed += 1
+        return removed
+
+    def register_applier(self, kind: str, applier: DiffApplier) -> None:
+        """Meldet die Funktion an, die RestoreOp-Diffs dieser Art anwendet (je Modul)."""
+        if not isinstance(kind, str) or not kind.strip():
+            raise UndoRedoError("kind ist leer oder ungültig.")
+        if not callable(applier):
+            raise UndoRedoError("applier ist nicht aufrufbar.")
+        self._appliers[kind.strip()] = applier
+
+    def record_diff(self, name: str, kind: str, anchor_id: int, diff: bytes) -> RestoreOp:
+        if kind not in self._appliers:
+            raise UndoRedoError(f"Kein Applier für {kind!r} registriert.")
+        if not isinstance(anchor_id, int) or not isinstance(diff, bytes):
+            raise UndoRedoError("anchor_id oder diff ist ungültig.")
+        operation = RestoreOp(name=name, kind=kind, anchor_id=anchor_id, diff=diff)
+        self.record(operation)
+        return operation
+
+    def record(self, action: UndoRedoEntry) -> None:
+        if __debug__:
+            if not isinstance(action, (UndoRedoAction, RestoreOp)):
+                raise UndoRedoError("action ist keine UndoRedoAction oder RestoreOp.")
+        if self._batch is not None:
+            self._batch.append(action)
+            return
+        buffer = self._buffer
+        capacity = self._capacity
+        start = self._start
+        undo_count = self._undo_count
+        # Beim normalen Vorwärts-Arbeiten gibt es keine Redo-Einträge.
+        if self._redo_count:
+            # Verworfene Redo-Einträge freigeben, damit ihre Closures nicht weiterleben.
+            for offset in range(undo_count + 1, undo_count + self._redo_count):
+                buffer[(start + offset) % capacity] = None
+            self._redo_count = 0
+        buffer[(start + undo_count) % capacity] = action
+        if undo_count == self._limit:
+            # Voll: ältesten Eintrag verdrängen, sein Platz wird der neue freie Platz.
+            buffer[start] = None
+            self._start = (start + 1) % capacity
+        else:
+            self._undo_count = undo_count + 1
+
+    @contextmanager
+    def record_group(self, name: str) -> Iterator[None]:
+        """Fasst alle record()-Aufrufe im Block zu einem einzigen Undo-Schritt zusammen."""
+        if self._batch is not None:
+            # Verschachtelt: Einträge landen in der äußeren Gruppe.
+            yield
+            return
+        batch: List[UndoRedoEntry] = []
+        self._batch = batch
+        try:
+            yield
+        finally:
+            self._batch = None
+            if batch:
+                entries = tuple(batch)
+                self.record(
+                    UndoRedoAction(
+                        name=name,
+                        undo=functools.partial(self._apply_group, entries, True),
+                        redo=functools.partial(self._apply_group, entries, False),
+                    )
+                )
+
+    def _apply_group(self, entries: Tuple[UndoRedoEntry, ...], undo: bool) -> None:
+        for entry in reversed(entries) if undo else entries:
+            self._apply(entry, undo)
+
+    def _apply(self, action: UndoRedoEntry, undo: bool) -> None:
+        if type(action) is RestoreOp:
+            applier = self._appliers.get(action.kind)
+            if applier is None:
+                raise UndoRedoError(f"Kein Applier für {action.kind!r} registriert.")
+            applier(action.anchor_id, action.diff, undo)
+        elif undo:
+            action.undo()
+        else:
+            action.redo()
 
-    def undo(self) -> UndoRedoAction:
-        if not self._undo_stack:
+    def undo(self) -> UndoRedoEntry:
+        if not self._undo_count:
             raise UndoRedoError("Kein Undo verfügbar.")
-        action = self._undo_stack.pop()
-        action.undo()
-        self._redo_stack.append(action)
+        action = self._buffer[(self._start + self._undo_count - 1) % self._capacity]
+        self._apply(action, undo=True)
+        self._undo_count -= 1
+        self._redo_count += 1
         return action
 
-    def redo(self) -> UndoRedoAction:
-        if not self._redo_stack:
+    def redo(self) -> UndoRedoEntry:
+        if not self._redo_count:
             raise UndoRedoError("Kein Redo verfügbar.")
-        action = self._redo_stack.pop()
-        action.redo()
-        self._undo_stack.append(action)
+        action = self._buffer[(self._start + self._undo_count) % self._capacity]
+        self._apply(action, undo=False)
+        self._undo_count += 1
+        self._redo_count -= 1
         return action
 
-    def peek_undo(self) -> Optional[UndoRedoAction]:
-        return self._undo_stack[-1] if self._undo_stack else None
+    def peek_undo(self) -> Optional[UndoRedoEntry]:
+        return self._buffer[(self._start + self._undo_count - 1) % self._capacity]
 
-    def peek_redo(self) -> Optional[UndoRedoAction]:
-        return self._redo_stack[-1] if self._redo_stack else None
+    def peek_redo(self) -> Optional[UndoRedoEntry]:
+        return self._buffer[(self._start + self._undo_count) % self._capacity]
@@ -137,6 +137,13 @@ def _json_error(message: str, *, code: str = "request_error") -> dict[str, Any]:
     return {"status": "error", "message": message, "code": code, "data": {}}
 
 
+def _json_default(value: Any) -> Any:
+    # Module reichen nur lesbare Konfigurationsteile (MappingProxyType) in ihren Antworten weiter.
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Typ ist nicht JSON-fähig: {type(value).__name__}")
+
+
 def _module_data(response: Mapping[str, Any], *, payload_key: str) -> Any:
     if response.get("status") != "ok":
         raise WebServerError(str(response.get("message") or "Modulaufruf fehlgeschlagen."))
@@ -963,7 +970,8 @@ class ProvowareRequestHandler(BaseHTTPRequestHandler):
         self.wfile.write(content)
 
     def _send_json(self, status: int, payload: Mapping[str, Any]) -> None:
-        content = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+        text = json.dumps(payload, ensure_ascii=False, default=_json_default)
+        content = (text + "\n").encode("utf-8")
         self.send_response(status)
         self._common_headers()
         self.send_header("Content-Type", "application/json; charset=utf-8")
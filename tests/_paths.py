@@ -0,0 +1,15 @@
+"""Suchpfade für Tests: system/ und src/records/, für pytest und unittest gleich."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SYSTEM_DIR = str(REPO_ROOT / "system")
+RECORDS_DIR = str(REPO_ROOT / "src" / "records")
+
+# Angehängt, nicht vorangestellt: die Import-Reihenfolge bleibt wie bisher.
+for import_path in (SYSTEM_DIR, RECORDS_DIR):
+    if import_path not in sys.path:
+        sys.path.append(import_path)
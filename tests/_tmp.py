@@ -0,0 +1,18 @@
+"""Temp-Ordner für Tests; der Basisordner der Sitzung kommt aus conftest.py (tmpfs)."""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Basisklasse: Temp-Ordner je Test, Aufräumen über addCleanup (umgekehrte Reihenfolge)."""
+
+    def make_temp_dir(self) -> Path:
+        # mkdtemp ohne Finalizer-Objekt; rmtree läuft im Cleanup-Stapel des Tests.
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path, ignore_errors=True)
+        return Path(path)
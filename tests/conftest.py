@@ -0,0 +1,29 @@
+"""Gemeinsame Test-Einstellungen: Suchpfade (system/, src/records/) und Temp-Basis je Sitzung."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+
+import _paths  # noqa: F401  (setzt die Suchpfade)
+
+# PYTEST_TMP setzt einen anderen Basisordner; ohne /dev/shm gilt der System-Standard.
+TMP_BASE = os.environ.get("PYTEST_TMP") or ("/dev/shm" if os.path.isdir("/dev/shm") else None)
+TMP_ROOT: str | None = None
+
+# Alle Temp-Ordner der Sitzung (TemporaryDirectory, mkdtemp, tmp_path) landen auf tmpfs;
+# ein gesetztes TMPDIR gilt weiter. mkdtemp legt einen eigenen Ordner (Modus 0700) an,
+# den kein anderer Benutzer vorab anlegen oder umlenken kann.
+if TMP_BASE and "TMPDIR" not in os.environ:
+    TMP_ROOT = tempfile.mkdtemp(prefix="genrearchiv-tests-", dir=TMP_BASE)
+    os.environ["TMPDIR"] = TMP_ROOT
+    tempfile.tempdir = TMP_ROOT
+
+
+def pytest_unconfigure(config) -> None:
+    if TMP_ROOT is None:
+        return
+    os.environ.pop("TMPDIR", None)
+    tempfile.tempdir = None
+    shutil.rmtree(TMP_ROOT, ignore_errors=True)
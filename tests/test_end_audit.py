@@ -1,55 +1,51 @@
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 import end_audit
 
+# Feste Test-Konfigurationen: einmal beim Import serialisiert und kodiert (UTF-8).
+_MODULES_JSON = json.dumps({"modules": []}).encode("utf-8")
+_SELFTESTS_JSON = json.dumps({"testcases": {}}).encode("utf-8")
+_SELECTIVE_EXPORT_JSON = json.dumps(
+    {
+        "default_preset": "logs_only",
+        "output_dir": "data/exports",
+        "base_name": "selective_export",
+        "presets": {"logs_only": {"label": "Nur Logs", "includes": ["logs"], "excludes": []}},
+    }
+).encode("utf-8")
+_TODO_CONFIG_JSON = json.dumps(
+    {"todo_path": "todo.txt", "archive_path": "data/todo_archive.txt"}
+).encode("utf-8")
+# Projekt-Gerüst als Tabelle: erst die Ordner (je ein mkdir, ohne parents-Prüfung),
+# dann relativer Pfad -> Inhalt, in einer Schleife geschrieben.
+_SKELETON_DIRS = ("config", "modules", "scripts", "data")
+_SKELETON = {
+    "config/modules.json": _MODULES_JSON,
+    "config/launcher_gui.json": b"{}",
+    "config/pytest.ini": b"[pytest]\n",
+    "config/ruff.toml": b"[tool.ruff]\n",
+    "config/black.toml": b"[tool.black]\n",
+    "config/module_selftests.json": _SELFTESTS_JSON,
+    "config/selective_export.json": _SELECTIVE_EXPORT_JSON,
+    "config/todo_config.json": _TODO_CONFIG_JSON,
+    "scripts/start.sh": b"#!/usr/bin/env bash\n",
+    "scripts/run_tests.sh": b"#!/usr/bin/env bash\n",
+    "todo.txt": b"[ ] Demo-Aufgabe\n",
+}
+
 
 class EndAuditTests(unittest.TestCase):
     def test_end_audit_reports_open_tasks(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
-            (root / "config").mkdir()
-            (root / "modules").mkdir()
-            (root / "scripts").mkdir()
-            (root / "data").mkdir()
-
-            (root / "config" / "modules.json").write_text(
-                json.dumps({"modules": []}), encoding="utf-8"
-            )
-            (root / "config" / "launcher_gui.json").write_text("{}", encoding="utf-8")
-            (root / "config" / "pytest.ini").write_text("[pytest]\n", encoding="utf-8")
-            (root / "config" / "ruff.toml").write_text("[tool.ruff]\n", encoding="utf-8")
-            (root / "config" / "black.toml").write_text("[tool.black]\n", encoding="utf-8")
-            (root / "config" / "module_selftests.json").write_text(
-                json.dumps({"testcases": {}}), encoding="utf-8"
-            )
-            (root / "config" / "selective_export.json").write_text(
-                json.dumps(
-                    {
-                        "default_preset": "logs_only",
-                        "output_dir": "data/exports",
-                        "base_name": "selective_export",
-                        "presets": {
-                            "logs_only": {"label": "Nur Logs", "includes": ["logs"], "excludes": []}
-                        },
-                    }
-                ),
-                encoding="utf-8",
-            )
-            (root / "config" / "todo_config.json").write_text(
-                json.dumps({"todo_path": "todo.txt", "archive_path": "data/todo_archive.txt"}),
-                encoding="utf-8",
-            )
-            (root / "scripts" / "start.sh").write_text("#!/usr/bin/env bash\n", encoding="utf-8")
-            (root / "scripts" / "run_tests.sh").write_text(
-                "#!/usr/bin/env bash\n", encoding="utf-8"
-            )
-            (root / "todo.txt").write_text("[ ] Demo-Aufgabe\n", encoding="utf-8")
+            for folder in _SKELETON_DIRS:
+                (root / folder).mkdir()
+            for relative, content in _SKELETON.items():
+                (root / relative).write_bytes(content)
 
             report = end_audit.run_end_audit(root)
 
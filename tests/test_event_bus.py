@@ -10,12 +10,9 @@ import event_bus
 class EventBusTests(unittest.TestCase):
     def test_emit_calls_subscribers(self) -> None:
         bus = event_bus.EventBus()
-        received = []
+        received: list[event_bus.Event] = []
 
-        def handler(evt: event_bus.Event) -> None:
-            received.append(evt)
-
-        bus.subscribe("demo_event", handler)
+        bus.subscribe("demo_event", received.append)
         bus.emit("demo_event", {"ok": True}, source="test")
 
         self.assertEqual(len(received), 1)
@@ -25,16 +22,32 @@ class EventBusTests(unittest.TestCase):
 
     def test_wildcard_receives_all_events(self) -> None:
         bus = event_bus.EventBus()
-        received = []
-
-        def handler(evt: event_bus.Event) -> None:
-            received.append(evt.name)
+        received: list[event_bus.Event] = []
 
-        bus.subscribe("*", handler)
+        bus.subscribe("*", received.append)
         bus.emit("one", {})
         bus.emit("two", {})
 
-        self.assertEqual(received, ["one", "two"])
+        self.assertEqual([evt.name for evt in received], ["one", "two"])
+
+    def test_emit_uses_subscribers_from_before_dispatch(self) -> None:
+        bus = event_bus.EventBus()
+        received: list[str] = []
+
+        def once(evt: event_bus.Event) -> None:
+            received.append("once")
+            bus.unsubscribe("demo_event", once)
+            bus.subscribe(event_bus.WILDCARD, late)
+
+        def late(evt: event_bus.Event) -> None:
+            received.append("late")
+
+        bus.subscribe("demo_event", once)
+        bus.subscribe("demo_event", lambda evt: received.append("zweiter"))
+        bus.emit("demo_event")
+        bus.emit("demo_event")
+
+        self.assertEqual(["once", "zweiter", "zweiter", "late"], received)
 
 
 if __name__ == "__main__":
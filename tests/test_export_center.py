@@ -1,11 +1,9 @@
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
-from export_center import ExportConfig, run_export
+import _paths  # noqa: F401  (setzt die Suchpfade)
+from export_center import ExportConfig, _build_simple_pdf, run_export
 
 
 class ExportCenterTests(unittest.TestCase):
@@ -16,8 +14,8 @@ class ExportCenterTests(unittest.TestCase):
             logs_dir = root / "logs"
             data_dir.mkdir()
             logs_dir.mkdir()
-            (data_dir / "sample.json").write_text('{"ok": true}', encoding="utf-8")
-            (logs_dir / "sample.log").write_text("ok", encoding="utf-8")
+            (data_dir / "sample.json").write_bytes(b'{"ok": true}')
+            (logs_dir / "sample.log").write_bytes(b"ok")
             output_dir = root / "exports"
 
             config = ExportConfig(
@@ -36,6 +34,18 @@ class ExportCenterTests(unittest.TestCase):
             self.assertTrue(pdf_files)
             self.assertTrue(pdf_files[0].read_bytes().startswith(b"%PDF"))
 
+    def test_simple_pdf_xref_points_at_objects(self):
+        pdf = _build_simple_pdf("Bericht (Ä)\nZeile 2")
+
+        xref_start = int(pdf.rsplit(b"startxref\n", 1)[1].split(b"\n", 1)[0])
+        self.assertTrue(pdf[xref_start:].startswith(b"xref\n0 6\n"))
+        offsets = pdf[xref_start:].split(b"\n")[3:8]
+        for number, line in enumerate(offsets, start=1):
+            position = int(line.split(b" ", 1)[0])
+            self.assertTrue(pdf[position:].startswith(f"{number} 0 obj".encode()))
+        self.assertIn(b"(Bericht \\(\xc3\x84\\)) Tj", pdf)
+        self.assertTrue(pdf.endswith(b"%%EOF\n"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,14 +1,30 @@
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
-from filename_fixer import normalize_filename, run_fix
+import _paths  # noqa: F401  (setzt die Suchpfade)
+from filename_fixer import collect_targets, normalize_filename, run_fix
 
 
 class FilenameFixerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Ein Temp-Ordner je Klasse; die Suffix-Konfiguration wird nur einmal geschrieben.
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.tmp_root = Path(tmp.name)
+        cls.config_dir = cls.tmp_root / "config"
+        cls.config_dir.mkdir()
+        (cls.config_dir / "filename_suffixes.json").write_bytes(
+            b'{\n  "defaults": {"data": ".json", "logs": ".log"}\n}\n'
+        )
+
+    def _new_root(self) -> Path:
+        """Eigene Projektwurzel je Test; config/ verweist auf die geteilte Konfiguration."""
+        root = Path(tempfile.mkdtemp(dir=self.tmp_root))
+        (root / "config").symlink_to(self.config_dir, target_is_directory=True)
+        return root
+
     def test_normalize_filename_snake_case(self):
         path = Path("Bad Name.TXT")
 
@@ -17,44 +33,55 @@ class FilenameFixerTests(unittest.TestCase):
         self.assertEqual("bad_name.txt", normalized.name)
 
     def test_run_fix_renames_in_data(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            data_dir = root / "data"
-            data_dir.mkdir(parents=True)
-            config_dir = root / "config"
-            config_dir.mkdir(parents=True)
-            (config_dir / "filename_suffixes.json").write_text(
-                '{\n  "defaults": {"data": ".json", "logs": ".log"}\n}\n',
-                encoding="utf-8",
-            )
-            source = data_dir / "Mein Bericht 2026.TXT"
-            source.write_text("ok", encoding="utf-8")
-
-            actions = run_fix(root, dry_run=False)
-
-            self.assertTrue(actions)
-            expected = data_dir / "mein_bericht_2026.txt"
-            self.assertTrue(expected.exists())
+        root = self._new_root()
+        data_dir = root / "data"
+        data_dir.mkdir()
+        source = data_dir / "Mein Bericht 2026.TXT"
+        source.write_bytes(b"ok")
+
+        actions = run_fix(root, dry_run=False)
+
+        self.assertTrue(actions)
+        expected = data_dir / "mein_bericht_2026.txt"
+        self.assertTrue(expected.exists())
 
     def test_run_fix_adds_suffix_rule(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            data_dir = root / "data"
-            data_dir.mkdir(parents=True)
-            config_dir = root / "config"
-            config_dir.mkdir(parents=True)
-            (config_dir / "filename_suffixes.json").write_text(
-                '{\n  "defaults": {"data": ".json", "logs": ".log"}\n}\n',
-                encoding="utf-8",
-            )
-            source = data_dir / "Bericht_2026"
-            source.write_text("ok", encoding="utf-8")
-
-            actions = run_fix(root, dry_run=False)
-
-            self.assertTrue(actions)
-            expected = data_dir / "bericht_2026.json"
-            self.assertTrue(expected.exists())
+        root = self._new_root()
+        data_dir = root / "data"
+        data_dir.mkdir()
+        source = data_dir / "Bericht_2026"
+        source.write_bytes(b"ok")
+
+        actions = run_fix(root, dry_run=False)
+
+        self.assertTrue(actions)
+        expected = data_dir / "bericht_2026.json"
+        self.assertTrue(expected.exists())
+
+    def test_collect_targets_skips_tool_folders(self):
+        root = self._new_root()
+        data_dir = root / "data"
+        (data_dir / "__pycache__").mkdir(parents=True)
+        (data_dir / "b").mkdir()
+        (data_dir / "__pycache__" / "Modul.PYC").write_bytes(b"")
+        (data_dir / "b" / "Z.txt").write_bytes(b"")
+        (data_dir / "a.txt").write_bytes(b"")
+
+        targets = collect_targets(root, [data_dir])
+
+        self.assertEqual([data_dir / "a.txt", data_dir / "b" / "Z.txt"], targets)
+
+    def test_collect_targets_keeps_file_links_but_not_dir_links(self):
+        root = self._new_root()
+        data_dir = root / "data"
+        (data_dir / "echt").mkdir(parents=True)
+        (data_dir / "echt" / "a.txt").write_bytes(b"")
+        (data_dir / "ordner_link").symlink_to(data_dir / "echt", target_is_directory=True)
+        (data_dir / "datei_link.txt").symlink_to(data_dir / "echt" / "a.txt")
+
+        targets = collect_targets(root, [data_dir])
+
+        self.assertEqual([data_dir / "datei_link.txt", data_dir / "echt" / "a.txt"], targets)
 
 
 if __name__ == "__main__":
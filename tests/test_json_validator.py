@@ -1,115 +1,127 @@
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 from json_validator import validate_json_file
 
+# Feste Test-Konfigurationen: einmal beim Import serialisiert und kodiert (UTF-8).
+_GUI_CONFIG_JSON = json.dumps(
+    {
+        "default_theme": "hell",
+        "themes": {
+            "hell": {
+                "label": "Hell",
+                "colors": {
+                    "background": "#ffffff",
+                    "foreground": "#111111",
+                    "accent": "#005ea5",
+                    "button_background": "#e6f0fb",
+                    "button_foreground": "#0b2d4d",
+                    "status_success": "#1b5e20",
+                    "status_error": "#b00020",
+                    "status_busy": "#005ea5",
+                    "status_foreground": "#ffffff",
+                },
+            }
+        },
+        "layout": {
+            "gap_xs": 4,
+            "gap_sm": 8,
+            "gap_md": 12,
+            "gap_lg": 16,
+            "gap_xl": 24,
+            "button_padx": 18,
+            "button_pady": 10,
+            "button_min_width": 18,
+            "button_font_size": 16,
+            "field_padx": 6,
+            "field_pady": 4,
+            "text_spacing": {"before": 4, "line": 2, "after": 4},
+            "focus_thickness": 2,
+        },
+    }
+).encode("utf-8")
+_EMPTY_MODULES_JSON = json.dumps({"version": "1.0", "modules": []}).encode("utf-8")
+_SUFFIXES_JSON = json.dumps({"defaults": {"data": ".json", "logs": ".log"}}).encode("utf-8")
+_PIN_CONFIG_JSON = json.dumps(
+    {
+        "enabled": False,
+        "pin_hint": "Standard-PIN: 0000",
+        "pin_hash": "hash",
+        "salt": "salt",
+        "max_attempts": 3,
+        "lock_min_seconds": 2,
+        "lock_max_seconds": 5,
+    }
+).encode("utf-8")
+
 
 class JsonValidatorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Ein config-Ordner je Klasse: die Tests nutzen verschiedene Dateinamen.
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.config_dir = Path(tmp.name) / "config"
+        cls.config_dir.mkdir()
+
     def test_launcher_gui_config_validates(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir) / "config"
-            config_dir.mkdir(parents=True)
-            config_path = config_dir / "launcher_gui.json"
-            config_path.write_text(
-                json.dumps(
-                    {
-                        "default_theme": "hell",
-                        "themes": {
-                            "hell": {
-                                "label": "Hell",
-                                "colors": {
-                                    "background": "#ffffff",
-                                    "foreground": "#111111",
-                                    "accent": "#005ea5",
-                                    "button_background": "#e6f0fb",
-                                    "button_foreground": "#0b2d4d",
-                                    "status_success": "#1b5e20",
-                                    "status_error": "#b00020",
-                                    "status_busy": "#005ea5",
-                                    "status_foreground": "#ffffff",
-                                },
-                            }
-                        },
-                        "layout": {
-                            "gap_xs": 4,
-                            "gap_sm": 8,
-                            "gap_md": 12,
-                            "gap_lg": 16,
-                            "gap_xl": 24,
-                            "button_padx": 18,
-                            "button_pady": 10,
-                            "button_min_width": 18,
-                            "button_font_size": 16,
-                            "field_padx": 6,
-                            "field_pady": 4,
-                            "text_spacing": {"before": 4, "line": 2, "after": 4},
-                            "focus_thickness": 2,
-                        },
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            result = validate_json_file(config_path)
-
-            self.assertEqual([], result.issues)
+        config_path = self.config_dir / "launcher_gui.json"
+        config_path.write_bytes(_GUI_CONFIG_JSON)
+
+        result = validate_json_file(config_path)
+
+        self.assertEqual([], result.issues)
+
+    def test_launcher_gui_layout_minimum_names_key(self):
+        config_path = self.config_dir / "launcher_gui.json"
+        config_path.write_bytes(
+            _GUI_CONFIG_JSON.replace(b'"button_font_size": 16', b'"button_font_size": 7')
+        )
+
+        result = validate_json_file(config_path)
+
+        self.assertEqual(["layout.button_font_size muss mindestens 8 sein."], result.issues)
+
+    def test_encoding_errors_are_issues_not_crashes(self):
+        config_path = self.config_dir / "filename_suffixes.json"
+        for payload in (
+            b"\xef\xbb\xbf" + _SUFFIXES_JSON,
+            b'{"defaults": "\xff"}',
+            _SUFFIXES_JSON.decode("utf-8").encode("utf-16"),
+        ):
+            with self.subTest(payload=payload[:4]):
+                config_path.write_bytes(payload)
+
+                result = validate_json_file(config_path)
+
+                self.assertEqual([f"JSON ist ungültig: {config_path}"], result.issues)
 
     def test_modules_config_rejects_empty_modules(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir) / "config"
-            config_dir.mkdir(parents=True)
-            config_path = config_dir / "modules.json"
-            config_path.write_text(
-                json.dumps({"version": "1.0", "modules": []}),
-                encoding="utf-8",
-            )
+        config_path = self.config_dir / "modules.json"
+        config_path.write_bytes(_EMPTY_MODULES_JSON)
 
-            result = validate_json_file(config_path)
+        result = validate_json_file(config_path)
 
-            self.assertTrue(result.issues)
+        self.assertTrue(result.issues)
 
     def test_filename_suffixes_validates(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir) / "config"
-            config_dir.mkdir(parents=True)
-            config_path = config_dir / "filename_suffixes.json"
-            config_path.write_text(
-                json.dumps({"defaults": {"data": ".json", "logs": ".log"}}),
-                encoding="utf-8",
-            )
+        config_path = self.config_dir / "filename_suffixes.json"
+        config_path.write_bytes(_SUFFIXES_JSON)
 
-            result = validate_json_file(config_path)
+        result = validate_json_file(config_path)
 
-            self.assertEqual([], result.issues)
+        self.assertEqual([], result.issues)
 
     def test_pin_config_validates(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir) / "config"
-            config_dir.mkdir(parents=True)
-            config_path = config_dir / "pin.json"
-            config_path.write_text(
-                json.dumps(
-                    {
-                        "enabled": False,
-                        "pin_hint": "Standard-PIN: 0000",
-                        "pin_hash": "hash",
-                        "salt": "salt",
-                        "max_attempts": 3,
-                        "lock_min_seconds": 2,
-                        "lock_max_seconds": 5,
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            result = validate_json_file(config_path)
-
-            self.assertEqual([], result.issues)
+        config_path = self.config_dir / "pin.json"
+        config_path.write_bytes(_PIN_CONFIG_JSON)
+
+        result = validate_json_file(config_path)
+
+        self.assertEqual([], result.issues)
 
 
 if __name__ == "__main__":
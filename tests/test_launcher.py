@@ -1,11 +1,9 @@
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 from launcher import (
     LauncherError,
     filter_modules,
@@ -13,94 +11,67 @@ from launcher import (
     render_module_overview,
 )
 
+# Feste Test-Konfigurationen: einmal beim Import serialisiert und kodiert (UTF-8).
+_STATUS_MODULES_JSON = json.dumps(
+    {
+        "modules": [
+            {
+                "id": "status",
+                "name": "Status-Check",
+                "path": "modules/status",
+                "enabled": True,
+                "description": "Testmodul",
+            }
+        ]
+    }
+).encode("utf-8")
+_MISSING_MODULES_JSON = json.dumps(
+    {
+        "modules": [
+            {
+                "id": "fehlend",
+                "name": "Fehlt",
+                "path": "modules/fehlend",
+                "enabled": True,
+                "description": "Fehlerfall",
+            }
+        ]
+    }
+).encode("utf-8")
+
 
 class LauncherTests(unittest.TestCase):
-    def test_load_modules_reads_valid_config(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base = Path(tmpdir)
-            modules_dir = base / "modules" / "status"
-            modules_dir.mkdir(parents=True)
-            module_path = modules_dir / "module.py"
-            module_path.write_text("# test", encoding="utf-8")
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Modulbaum und beide Konfigurationen einmal je Klasse anlegen; die Tests lesen nur.
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.base = Path(tmp.name)
+        modules_dir = cls.base / "modules" / "status"
+        modules_dir.mkdir(parents=True)
+        module_path = modules_dir / "module.py"
+        module_path.write_bytes(b"# test")
 
-            config_path = base / "config" / "modules.json"
-            config_path.parent.mkdir(parents=True)
-            config_path.write_text(
-                json.dumps(
-                    {
-                        "modules": [
-                            {
-                                "id": "status",
-                                "name": "Status-Check",
-                                "path": "modules/status",
-                                "enabled": True,
-                                "description": "Testmodul",
-                            }
-                        ]
-                    }
-                ),
-                encoding="utf-8",
-            )
+        cls.config_path = cls.base / "config" / "modules.json"
+        cls.config_path.parent.mkdir(parents=True)
+        cls.config_path.write_bytes(_STATUS_MODULES_JSON)
+        cls.missing_config_path = cls.base / "config" / "modules_fehlend.json"
+        cls.missing_config_path.write_bytes(_MISSING_MODULES_JSON)
 
-            modules = load_modules(config_path, root=base)
+    def test_load_modules_reads_valid_config(self):
+        modules = load_modules(self.config_path, root=self.base)
 
-            self.assertEqual(1, len(modules))
-            self.assertEqual("status", modules[0].module_id)
+        self.assertEqual(1, len(modules))
+        self.assertEqual("status", modules[0].module_id)
 
     def test_load_modules_raises_when_enabled_module_missing(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base = Path(tmpdir)
-            config_path = base / "modules.json"
-            config_path.write_text(
-                json.dumps(
-                    {
-                        "modules": [
-                            {
-                                "id": "fehlend",
-                                "name": "Fehlt",
-                                "path": "modules/fehlend",
-                                "enabled": True,
-                                "description": "Fehlerfall",
-                            }
-                        ]
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            with self.assertRaises(LauncherError):
-                load_modules(config_path, root=base)
+        with self.assertRaises(LauncherError):
+            load_modules(self.missing_config_path, root=self.base)
 
     def test_render_module_overview_outputs_text(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base = Path(tmpdir)
-            modules_dir = base / "modules" / "status"
-            modules_dir.mkdir(parents=True)
-            module_path = modules_dir / "module.py"
-            module_path.write_text("# test", encoding="utf-8")
-
-            config_path = base / "config" / "modules.json"
-            config_path.parent.mkdir(parents=True)
-            config_path.write_text(
-                json.dumps(
-                    {
-                        "modules": [
-                            {
-                                "id": "status",
-                                "name": "Status-Check",
-                                "path": "modules/status",
-                                "enabled": True,
-                                "description": "Testmodul",
-                            }
-                        ]
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            modules = load_modules(config_path, root=base)
-            filtered = filter_modules(modules, show_all=True)
-            output = render_module_overview(filtered, base)
+        modules = load_modules(self.config_path, root=self.base)
+        filtered = filter_modules(modules, show_all=True)
+        output = render_module_overview(filtered, self.base)
 
-            self.assertIn("Launcher: Module im Überblick", output)
-            self.assertIn("Status-Check", output)
+        self.assertIn("Launcher: Module im Überblick", output)
+        self.assertIn("Status-Check", output)
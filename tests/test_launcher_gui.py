@@ -1,109 +1,79 @@
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 from launcher import ModuleEntry
 from launcher_gui import GuiLauncherError, build_module_lines, load_gui_config
 
+# Feste Test-Konfigurationen: einmal beim Import serialisiert und kodiert (UTF-8).
+_GUI_CONFIG_JSON = json.dumps(
+    {
+        "default_theme": "hell",
+        "themes": {
+            "hell": {
+                "label": "Hell",
+                "colors": {
+                    "background": "#ffffff",
+                    "foreground": "#111111",
+                    "accent": "#005ea5",
+                    "button_background": "#e6f0fb",
+                    "button_foreground": "#0b2d4d",
+                    "status_success": "#1b5e20",
+                    "status_error": "#b00020",
+                    "status_busy": "#005ea5",
+                    "status_foreground": "#ffffff",
+                },
+            }
+        },
+        "layout": {
+            "gap_xs": 4,
+            "gap_sm": 8,
+            "gap_md": 12,
+            "gap_lg": 16,
+            "gap_xl": 24,
+            "button_padx": 18,
+            "button_pady": 10,
+            "button_min_width": 18,
+            "button_font_size": 16,
+            "field_padx": 6,
+            "field_pady": 4,
+            "text_spacing": {"before": 4, "line": 2, "after": 4},
+            "focus_thickness": 2,
+        },
+    }
+).encode("utf-8")
+_INVALID_COLOR_JSON = _GUI_CONFIG_JSON.replace(
+    b'"background": "#ffffff"', b'"background": "white"', 1
+)
+
 
 class LauncherGuiTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Ein Temp-Ordner je Klasse; jeder Test schreibt eine eigene Datei hinein.
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.tmp_root = Path(tmp.name)
+
     def test_load_gui_config_reads_themes(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "launcher_gui.json"
-            config_path.write_text(
-                json.dumps(
-                    {
-                        "default_theme": "hell",
-                        "themes": {
-                            "hell": {
-                                "label": "Hell",
-                                "colors": {
-                                    "background": "#ffffff",
-                                    "foreground": "#111111",
-                                    "accent": "#005ea5",
-                                    "button_background": "#e6f0fb",
-                                    "button_foreground": "#0b2d4d",
-                                    "status_success": "#1b5e20",
-                                    "status_error": "#b00020",
-                                    "status_busy": "#005ea5",
-                                    "status_foreground": "#ffffff",
-                                },
-                            }
-                        },
-                        "layout": {
-                            "gap_xs": 4,
-                            "gap_sm": 8,
-                            "gap_md": 12,
-                            "gap_lg": 16,
-                            "gap_xl": 24,
-                            "button_padx": 18,
-                            "button_pady": 10,
-                            "button_min_width": 18,
-                            "button_font_size": 16,
-                            "field_padx": 6,
-                            "field_pady": 4,
-                            "text_spacing": {"before": 4, "line": 2, "after": 4},
-                            "focus_thickness": 2,
-                        },
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            config = load_gui_config(config_path)
-
-            self.assertEqual("hell", config.default_theme)
-            self.assertIn("hell", config.themes)
+        config_path = self.tmp_root / "launcher_gui.json"
+        config_path.write_bytes(_GUI_CONFIG_JSON)
+
+        config = load_gui_config(config_path)
+
+        self.assertEqual("hell", config.default_theme)
+        self.assertIn("hell", config.themes)
+        for model in (config, config.themes["hell"], config.layout, config.layout.text_spacing):
+            self.assertFalse(hasattr(model, "__dict__"))
 
     def test_load_gui_config_rejects_invalid_color(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "launcher_gui.json"
-            config_path.write_text(
-                json.dumps(
-                    {
-                        "default_theme": "hell",
-                        "themes": {
-                            "hell": {
-                                "label": "Hell",
-                                "colors": {
-                                    "background": "white",
-                                    "foreground": "#111111",
-                                    "accent": "#005ea5",
-                                    "button_background": "#e6f0fb",
-                                    "button_foreground": "#0b2d4d",
-                                    "status_success": "#1b5e20",
-                                    "status_error": "#b00020",
-                                    "status_busy": "#005ea5",
-                                    "status_foreground": "#ffffff",
-                                },
-                            }
-                        },
-                        "layout": {
-                            "gap_xs": 4,
-                            "gap_sm": 8,
-                            "gap_md": 12,
-                            "gap_lg": 16,
-                            "gap_xl": 24,
-                            "button_padx": 18,
-                            "button_pady": 10,
-                            "button_min_width": 18,
-                            "button_font_size": 16,
-                            "field_padx": 6,
-                            "field_pady": 4,
-                            "text_spacing": {"before": 4, "line": 2, "after": 4},
-                            "focus_thickness": 2,
-                        },
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            with self.assertRaises(GuiLauncherError):
-                load_gui_config(config_path)
+        config_path = self.tmp_root / "launcher_gui_ungueltig.json"
+        config_path.write_bytes(_INVALID_COLOR_JSON)
+
+        with self.assertRaises(GuiLauncherError):
+            load_gui_config(config_path)
 
     def test_build_module_lines_includes_debug_path(self):
         module = ModuleEntry(
@@ -119,6 +89,14 @@ class LauncherGuiTests(unittest.TestCase):
 
         self.assertTrue(any("Pfad:" in line for line in lines))
 
+    def test_build_module_lines_checks_root_eagerly_and_falls_back(self):
+        with self.assertRaises(GuiLauncherError):
+            build_module_lines([], "/tmp", debug=False)
+
+        self.assertEqual(
+            ["Keine Module gefunden."], list(build_module_lines([], Path("/tmp"), False))
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
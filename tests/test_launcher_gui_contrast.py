@@ -1,20 +1,16 @@
 import json
-import sys
 import unittest
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
+from _paths import REPO_ROOT
+from color_utils import contrast_ratio, parse_hex_color, relative_luminance
 
-from color_utils import contrast_ratio
+# Einmal pro Interpreter beim Import gelesen (auch bei wiederholten Läufen im selben Prozess).
+_THEMES = json.loads((REPO_ROOT / "config" / "launcher_gui.json").read_bytes()).get("themes", {})
 
 
 class LauncherGuiContrastTests(unittest.TestCase):
     def test_launcher_gui_theme_contrast_is_accessible(self):
-        config_path = Path(__file__).resolve().parents[1] / "config" / "launcher_gui.json"
-        data = json.loads(config_path.read_text(encoding="utf-8"))
-        themes = data.get("themes", {})
-
-        for name, entry in themes.items():
+        for name, entry in _THEMES.items():
             colors = entry.get("colors", {})
             bg = colors.get("background")
             fg = colors.get("foreground")
@@ -26,6 +22,16 @@ class LauncherGuiContrastTests(unittest.TestCase):
                 self.assertGreaterEqual(contrast_ratio(button_bg, button_fg), 4.5)
                 self.assertGreaterEqual(contrast_ratio(accent, bg), 4.5)
 
+    def test_contrast_ratio_matches_direct_luminance(self):
+        for color_a, color_b in (("#005ea5", "#ffffff"), ("#0F0", "#111111"), ("#777", "#000")):
+            lum_a = relative_luminance(parse_hex_color(color_a))
+            lum_b = relative_luminance(parse_hex_color(color_b))
+            expected = (max(lum_a, lum_b) + 0.05) / (min(lum_a, lum_b) + 0.05)
+            with self.subTest(colors=(color_a, color_b)):
+                self.assertEqual(expected, contrast_ratio(color_a, color_b))
+        with self.assertRaisesRegex(ValueError, "kein Text"):
+            contrast_ratio(["#fff"], "#000")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,9 @@
-import sys
 import tempfile
 import unittest
 import zipfile
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 from log_exporter import export_logs
 
 
@@ -17,12 +15,12 @@ class LogExporterTests(unittest.TestCase):
             export_dir = base / "exports"
             logs_dir.mkdir()
 
-            (logs_dir / "app.log").write_text("Testlog", encoding="utf-8")
-            (logs_dir / "error.log").write_text("Fehler", encoding="utf-8")
+            (logs_dir / "app.log").write_bytes(b"Testlog")
+            (logs_dir / "error.log").write_bytes(b"Fehler")
 
             export_path = export_logs(logs_dir, export_dir)
 
             self.assertTrue(export_path.exists())
             with zipfile.ZipFile(export_path, "r") as archive:
-                names = set(archive.namelist())
+                names = {info.filename for info in archive.infolist()}
             self.assertEqual({"app.log", "error.log"}, names)
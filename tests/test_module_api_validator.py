@@ -1,115 +1,116 @@
-import sys
-import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
+import module_api_validator
+from _tmp import TempDirTestCase
 from module_api_validator import validate_module_api
 
+# Modul-Quelltexte der Tests: einmal beim Import als fester Text angelegt.
+_SRC_OK = """\
+def validateInput(input_data):
+    return input_data
+
+def validateOutput(output):
+    return output
+
+def run(input_data):
+    return {'status': 'ok'}
+"""
+_SRC_REEXPORTS = """\
+import backend
+run = backend.run
+validateInput = backend.validateInput
+validateOutput = backend.validateOutput
+"""
+_SRC_MISSING_RUN = """\
+def validateInput(input_data):
+    return input_data
+
+def validateOutput(output):
+    return output
+"""
+_SRC_MISSING_VALIDATION = """\
+def run(input_data):
+    return {'status': 'ok'}
+"""
+_SRC_RUN_NEEDS_ARGS = """\
+def validateInput(input_data):
+    return input_data
+
+def validateOutput(output):
+    return output
 
-class ModuleApiValidatorTests(unittest.TestCase):
-    def _write_module(self, path: Path, content: str) -> None:
-        path.write_text(content, encoding="utf-8")
+def run():
+    return {'status': 'ok'}
+"""
+_SRC_SYNTAX_ERR = "def run(:\n    pass\n"
 
+
+class ModuleApiValidatorTests(TempDirTestCase):
     def test_validate_module_api_ok(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            entry = Path(tmp_dir) / "module.py"
-            self._write_module(
-                entry,
-                "\n".join(
-                    [
-                        "def validateInput(input_data):",
-                        "    return input_data",
-                        "",
-                        "def validateOutput(output):",
-                        "    return output",
-                        "",
-                        "def run(input_data):",
-                        "    return {'status': 'ok'}",
-                        "",
-                    ]
-                ),
-            )
-            self.assertEqual(validate_module_api(entry), [])
+        tmp_dir = self.make_temp_dir()
+        entry = tmp_dir / "module.py"
+        entry.write_text(_SRC_OK, encoding="utf-8")
+        self.assertEqual(validate_module_api(entry), [])
 
     def test_validate_module_api_accepts_explicit_reexports(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            entry = Path(tmp_dir) / "entry.py"
-            self._write_module(
-                entry,
-                "\n".join(
-                    [
-                        "import backend",
-                        "run = backend.run",
-                        "validateInput = backend.validateInput",
-                        "validateOutput = backend.validateOutput",
-                    ]
-                ),
-            )
-            self.assertEqual(validate_module_api(entry), [])
+        entry = Path("entry.py")
+        self.assertEqual(validate_module_api(entry, source=_SRC_REEXPORTS), [])
 
     def test_validate_module_api_missing_run(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            entry = Path(tmp_dir) / "module.py"
-            self._write_module(
-                entry,
-                "\n".join(
-                    [
-                        "def validateInput(input_data):",
-                        "    return input_data",
-                        "",
-                        "def validateOutput(output):",
-                        "    return output",
-                    ]
-                ),
-            )
-            issues = validate_module_api(entry)
-            self.assertTrue(any("run" in issue for issue in issues))
+        entry = Path("module.py")
+        issues = validate_module_api(entry, source=_SRC_MISSING_RUN)
+        self.assertTrue(any("run" in issue for issue in issues))
 
     def test_validate_module_api_missing_validation(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            entry = Path(tmp_dir) / "module.py"
-            self._write_module(
-                entry,
-                "\n".join(
-                    [
-                        "def run(input_data):",
-                        "    return {'status': 'ok'}",
-                    ]
-                ),
-            )
-            issues = validate_module_api(entry)
-            self.assertTrue(any("validateInput" in issue for issue in issues))
-            self.assertTrue(any("validateOutput" in issue for issue in issues))
+        entry = Path("module.py")
+        issues = validate_module_api(entry, source=_SRC_MISSING_VALIDATION)
+        self.assertTrue(any("validateInput" in issue for issue in issues))
+        self.assertTrue(any("validateOutput" in issue for issue in issues))
 
     def test_validate_module_api_run_needs_args(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            entry = Path(tmp_dir) / "module.py"
-            self._write_module(
-                entry,
-                "\n".join(
-                    [
-                        "def validateInput(input_data):",
-                        "    return input_data",
-                        "",
-                        "def validateOutput(output):",
-                        "    return output",
-                        "",
-                        "def run():",
-                        "    return {'status': 'ok'}",
-                    ]
-                ),
-            )
-            issues = validate_module_api(entry)
-            self.assertTrue(any("mindestens ein Argument" in issue for issue in issues))
+        entry = Path("module.py")
+        issues = validate_module_api(entry, source=_SRC_RUN_NEEDS_ARGS)
+        self.assertTrue(any("mindestens ein Argument" in issue for issue in issues))
+
+    def test_validate_module_api_source_skips_file_read(self) -> None:
+        entry = self.make_temp_dir() / "fehlt.py"
+        source = "def validateInput(x):\n    return x\n"
+
+        issues = validate_module_api(entry, source=source)
+
+        self.assertEqual(issues, validate_module_api(entry, source=source.encode("utf-8")))
+        self.assertTrue(any("run" in issue for issue in issues))
+        self.assertFalse(any("fehlt:" in issue for issue in issues))
+        self.assertTrue(any("Syntaxfehler" in i for i in validate_module_api(entry, "def (")))
+        with self.assertRaises(module_api_validator.ModuleApiError):
+            validate_module_api(entry, source=["def run(x): pass"])
 
     def test_validate_module_api_syntax_error(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            entry = Path(tmp_dir) / "module.py"
-            self._write_module(entry, "def run(:\n    pass\n")
-            issues = validate_module_api(entry)
-            self.assertTrue(any("Syntaxfehler" in issue for issue in issues))
+        tmp_dir = self.make_temp_dir()
+        entry = tmp_dir / "module.py"
+        entry.write_text(_SRC_SYNTAX_ERR, encoding="utf-8")
+        issues = validate_module_api(entry)
+        self.assertTrue(any("Syntaxfehler" in issue for issue in issues))
+
+    def test_same_source_is_parsed_once(self) -> None:
+        source = "def validateInput(x):\n    return x\n\ndef run():\n    return 1\n"
+        tmp_dir = self.make_temp_dir()
+        first = tmp_dir / "a.py"
+        second = tmp_dir / "b.py"
+        first.write_text(source, encoding="utf-8")
+        second.write_text(source, encoding="utf-8")
+        module_api_validator._analyze_source.cache_clear()
+        with mock.patch.object(
+            module_api_validator.ast, "parse", wraps=module_api_validator.ast.parse
+        ) as parse:
+            issues = validate_module_api(first)
+            issues.append("lokal geändert")
+            self.assertEqual(issues[:-1], validate_module_api(second))
+        self.assertEqual(1, parse.call_count)
+        self.assertEqual(2, len(issues[:-1]))
 
 
 if __name__ == "__main__":
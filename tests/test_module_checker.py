@@ -1,150 +1,144 @@
 import json
-import sys
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
+import module_api_validator
 import module_checker
+from _tmp import TempDirTestCase
 
+_SRC_OK = """\
+def validateInput(input_data):
+    return input_data
 
-class ModuleCheckerTests(unittest.TestCase):
-    def _write_json(self, path: Path, payload: dict) -> None:
-        path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+def validateOutput(output):
+    return output
 
-    def test_check_modules_ok(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            root = Path(tmp_dir)
-            module_dir = root / "modules" / "demo"
-            module_dir.mkdir(parents=True)
-            (module_dir / "module.py").write_text(
-                "\n".join(
-                    [
-                        "def validateInput(input_data):",
-                        "    return input_data",
-                        "",
-                        "def validateOutput(output):",
-                        "    return output",
-                        "",
-                        "def run(input_data):",
-                        "    return {'status': 'ok'}",
-                        "",
-                    ]
-                ),
-                encoding="utf-8",
-            )
-            self._write_json(
-                module_dir / "manifest.json",
-                {
-                    "id": "demo",
-                    "name": "Demo",
-                    "version": "1.0.0",
-                    "description": "Demo-Modul",
-                    "entry": "module.py",
-                },
-            )
-            config_path = root / "config" / "modules.json"
-            config_path.parent.mkdir(parents=True)
-            self._write_json(
-                config_path,
-                {
-                    "version": "1.0",
-                    "modules": [
-                        {
-                            "id": "demo",
-                            "name": "Demo",
-                            "path": "modules/demo",
-                            "enabled": True,
-                            "description": "Demo",
-                        }
-                    ],
-                },
-            )
+def run(input_data):
+    return {'status': 'ok'}
+"""
 
-            entries = module_checker.load_modules(config_path)
-            issues = module_checker.check_modules(entries)
 
-            self.assertEqual(issues, [])
+def _dump(payload: dict) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+# Feste Test-Dateien: einmal beim Import serialisiert; Tests schreiben nur noch Bytes.
+_MANIFEST_JSON = {
+    entry: _dump(
+        {
+            "id": "demo",
+            "name": "Demo",
+            "version": "1.0.0",
+            "description": "Demo-Modul",
+            "entry": entry,
+        }
+    )
+    for entry in ("module.py", "../outside.py")
+}
+_MODULES_JSON = _dump(
+    {
+        "version": "1.0",
+        "modules": [
+            {
+                "id": "demo",
+                "name": "Demo",
+                "path": "modules/demo",
+                "enabled": True,
+                "description": "Demo",
+            }
+        ],
+    }
+)
 
-    def test_check_modules_missing_manifest_entry_file(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            root = Path(tmp_dir)
-            module_dir = root / "modules" / "demo"
-            module_dir.mkdir(parents=True)
-            self._write_json(
-                module_dir / "manifest.json",
-                {
-                    "id": "demo",
-                    "name": "Demo",
-                    "version": "1.0.0",
-                    "description": "Demo-Modul",
-                    "entry": "module.py",
-                },
-            )
-            config_path = root / "config" / "modules.json"
-            config_path.parent.mkdir(parents=True)
-            self._write_json(
-                config_path,
-                {
-                    "version": "1.0",
-                    "modules": [
-                        {
-                            "id": "demo",
-                            "name": "Demo",
-                            "path": "modules/demo",
-                            "enabled": True,
-                            "description": "Demo",
-                        }
-                    ],
-                },
-            )
 
-            entries = module_checker.load_modules(config_path)
-            issues = module_checker.check_modules(entries)
+class ModuleCheckerTests(TempDirTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Ein Temp-Ordner je Klasse; der gültige Demo-Baum wird nur einmal gebaut.
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.tmp_root = Path(tmp.name)
+        cls.demo_root = cls._build_root(cls.tmp_root / "gueltig", "module.py", with_module=True)
 
-            self.assertGreaterEqual(len(issues), 1)
-            self.assertTrue(any("Modul-Datei fehlt" in issue for issue in issues))
+    @classmethod
+    def _build_root(cls, root: Path, entry: str, with_module: bool) -> Path:
+        module_dir = root / "modules" / "demo"
+        module_dir.mkdir(parents=True)
+        if with_module:
+            (module_dir / "module.py").write_text(_SRC_OK, encoding="utf-8")
+        (module_dir / "manifest.json").write_bytes(_MANIFEST_JSON[entry])
+        config_path = root / "config" / "modules.json"
+        config_path.parent.mkdir(parents=True)
+        config_path.write_bytes(_MODULES_JSON)
+        return root
+
+    def _new_root(self, entry: str, with_module: bool) -> Path:
+        """Eigener Baum für Tests, die vom gültigen Demo-Baum abweichen."""
+        return self._build_root(self.make_temp_dir(), entry, with_module)
+
+    @staticmethod
+    def _check(root: Path) -> list[str]:
+        entries = module_checker.load_modules(root / "config" / "modules.json")
+        return module_checker.check_modules(entries)
+
+    def test_check_modules_ok(self) -> None:
+        self.assertEqual(self._check(self.demo_root), [])
+
+    def test_check_modules_missing_manifest_entry_file(self) -> None:
+        root = self._new_root("module.py", with_module=False)
+        issues = self._check(root)
+
+        self.assertGreaterEqual(len(issues), 1)
+        self.assertTrue(any("Modul-Datei fehlt" in issue for issue in issues))
 
     def test_check_modules_entry_outside_module(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            root = Path(tmp_dir)
-            module_dir = root / "modules" / "demo"
-            module_dir.mkdir(parents=True)
-            self._write_json(
-                module_dir / "manifest.json",
-                {
-                    "id": "demo",
-                    "name": "Demo",
-                    "version": "1.0.0",
-                    "description": "Demo-Modul",
-                    "entry": "../outside.py",
-                },
-            )
-            config_path = root / "config" / "modules.json"
-            config_path.parent.mkdir(parents=True)
-            self._write_json(
-                config_path,
-                {
-                    "version": "1.0",
-                    "modules": [
-                        {
-                            "id": "demo",
-                            "name": "Demo",
-                            "path": "modules/demo",
-                            "enabled": True,
-                            "description": "Demo",
-                        }
-                    ],
-                },
+        root = self._new_root("../outside.py", with_module=False)
+        issues = self._check(root)
+
+        self.assertGreaterEqual(len(issues), 1)
+        self.assertTrue(any("außerhalb des Modulordners" in issue for issue in issues))
+        self.assertTrue(any("Modulstruktur unzulässig" in issue for issue in issues))
+
+    def test_check_modules_parses_identical_sources_once(self) -> None:
+        roots = [self.demo_root, self._new_root("module.py", with_module=True)]
+        module_api_validator._analyze_source.cache_clear()
+
+        with mock.patch.object(
+            module_api_validator.ast, "parse", wraps=module_api_validator.ast.parse
+        ) as parse:
+            for root in roots:
+                self.assertEqual(self._check(root), [])
+
+        self.assertEqual(1, parse.call_count)
+
+    def test_load_modules_reuses_unchanged_config(self) -> None:
+        root = self._new_root("module.py", with_module=True)
+        config_path = root / "config" / "modules.json"
+        module_checker._read_entries_cached.cache_clear()
+
+        with mock.patch.object(
+            module_checker, "load_registry", wraps=module_checker.load_registry
+        ) as load_registry:
+            first = module_checker.load_modules(config_path)
+            first.clear()
+            self.assertEqual(
+                ["demo"], [e.module_id for e in module_checker.load_modules(config_path)]
             )
+            self.assertEqual(1, load_registry.call_count)
 
-            entries = module_checker.load_modules(config_path)
-            issues = module_checker.check_modules(entries)
+            config_path.write_bytes(
+                _MODULES_JSON.replace(b'"name": "Demo"', b'"name": "Demo neu"', 1)
+            )
+            stamp = config_path.stat().st_mtime_ns + 1_000_000_000
+            os.utime(config_path, ns=(stamp, stamp))
+            updated = module_checker.load_modules(config_path)
 
-            self.assertGreaterEqual(len(issues), 1)
-            self.assertTrue(any("außerhalb des Modulordners" in issue for issue in issues))
-            self.assertTrue(any("Modulstruktur unzulässig" in issue for issue in issues))
+        self.assertEqual(2, load_registry.call_count)
+        self.assertEqual("Demo neu", updated[0].name)
 
 
 if __name__ == "__main__":
@@ -1,200 +1,178 @@
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
-from module_integration_checks import run_integration_checks
+from unittest import mock
+
+import _paths  # noqa: F401  (setzt die Suchpfade)
+import module_checker
+import module_selftests
+from module_integration_checks import ModuleIntegrationError, run_integration_checks
+
+# Feste Test-Dateien: einmal beim Import serialisiert; Tests schreiben nur noch Bytes.
+_MODULES_JSON = json.dumps(
+    {
+        "modules": [
+            {
+                "id": "mod_a",
+                "name": "Modul A",
+                "path": "modules/mod_a",
+                "enabled": True,
+                "description": "Test",
+            }
+        ]
+    }
+).encode("utf-8")
+_SELFTESTS_JSON = json.dumps({"testcases": {"mod_a": {"text": "ok"}}}).encode("utf-8")
+_MANIFEST_JSON = json.dumps(
+    {
+        "id": "mod_a",
+        "name": "Modul A",
+        "version": "1.0.0",
+        "description": "Testmodul",
+        "entry": "module.py",
+    }
+).encode("utf-8")
+_SRC_OK = """\
+def validateInput(input_data):
+    return input_data
+
+def validateOutput(output):
+    return output
+
+def run(input_data):
+    return input_data
+"""
+_SRC_RUN_RETURNS_NONE = """\
+def validateInput(input_data):
+    return input_data
+
+def validateOutput(output):
+    return output
+
+def run(input_data):
+    return None
+"""
+_MANIFEST_ID_MISMATCH_JSON = _MANIFEST_JSON.replace(b'"id": "mod_a"', b'"id": "mod_b"', 1)
+_MANIFEST_NAME_MISMATCH_JSON = _MANIFEST_JSON.replace(b'"Modul A"', b'"Anderer Name"', 1)
 
 
 class ModuleIntegrationChecksTests(unittest.TestCase):
-    def _write_module(
-        self,
-        root: Path,
-        module_id: str,
-        manifest_id: str | None = None,
-        manifest_name: str | None = None,
-    ) -> Path:
-        module_dir = root / "modules" / module_id
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Gültiger Baum einmal je Klasse; nur abweichende Fälle bauen einen eigenen Unterordner.
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.tmp_root = Path(tmp.name)
+        cls.shared_root = cls.tmp_root / "gueltig"
+        cls._write_module(cls.shared_root)
+        cls._write_configs(cls.shared_root)
+
+    @staticmethod
+    def _write_module(root: Path, manifest: bytes = _MANIFEST_JSON) -> Path:
+        module_dir = root / "modules" / "mod_a"
         module_dir.mkdir(parents=True, exist_ok=True)
-        manifest = {
-            "id": manifest_id or module_id,
-            "name": manifest_name or f"{module_id}-name",
-            "version": "1.0.0",
-            "description": "Testmodul",
-            "entry": "module.py",
-        }
-        (module_dir / "manifest.json").write_text(
-            json.dumps(manifest),
-            encoding="utf-8",
-        )
-        (module_dir / "module.py").write_text(
-            "\n".join(
-                [
-                    "def validateInput(input_data):",
-                    "    return input_data",
-                    "",
-                    "def validateOutput(output):",
-                    "    return output",
-                    "",
-                    "def run(input_data):",
-                    "    return input_data",
-                    "",
-                ]
-            ),
-            encoding="utf-8",
-        )
+        (module_dir / "manifest.json").write_bytes(manifest)
+        (module_dir / "module.py").write_text(_SRC_OK, encoding="utf-8")
         return module_dir
 
-    def _write_configs(self, root: Path, modules: list[dict], testcases: dict) -> None:
+    @staticmethod
+    def _write_configs(root: Path) -> None:
         config_dir = root / "config"
         config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "modules.json").write_text(
-            json.dumps({"modules": modules}),
-            encoding="utf-8",
-        )
-        (config_dir / "module_selftests.json").write_text(
-            json.dumps({"testcases": testcases}),
-            encoding="utf-8",
-        )
+        (config_dir / "modules.json").write_bytes(_MODULES_JSON)
+        (config_dir / "module_selftests.json").write_bytes(_SELFTESTS_JSON)
+
+    def _new_root(self) -> Path:
+        """Eigener Unterordner für Tests, die Modul oder Manifest verändern."""
+        return Path(tempfile.mkdtemp(dir=self.tmp_root))
 
     def test_integration_checks_ok(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            self._write_module(root, "mod_a", manifest_name="Modul A")
-            modules = [
-                {
-                    "id": "mod_a",
-                    "name": "Modul A",
-                    "path": "modules/mod_a",
-                    "enabled": True,
-                    "description": "Test",
-                }
-            ]
-            testcases = {"mod_a": {"text": "ok"}}
-            self._write_configs(root, modules, testcases)
+        root = self.shared_root
+
+        result = run_integration_checks(
+            root / "config" / "modules.json",
+            root / "config" / "module_selftests.json",
+        )
 
+        self.assertEqual([], result.issues)
+
+    def test_selftests_reuse_loaded_configs(self):
+        root = self.shared_root
+
+        with mock.patch.object(
+            module_selftests, "_load_json", wraps=module_selftests._load_json
+        ) as load_json, mock.patch.object(
+            module_checker, "load_modules", wraps=module_checker.load_modules
+        ) as load_modules:
             result = run_integration_checks(
                 root / "config" / "modules.json",
                 root / "config" / "module_selftests.json",
             )
 
-            self.assertEqual([], result.issues)
+        self.assertEqual([], result.issues)
+        self.assertEqual(1, load_json.call_count)
+        self.assertEqual(1, load_modules.call_count)
 
     def test_reports_missing_selftest(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            self._write_module(root, "mod_a", manifest_name="Modul A")
-            modules = [
-                {
-                    "id": "mod_a",
-                    "name": "Modul A",
-                    "path": "modules/mod_a",
-                    "enabled": True,
-                    "description": "Test",
-                }
-            ]
-            self._write_configs(root, modules, testcases={})
+        root = self.shared_root
 
-            result = run_integration_checks(
-                root / "config" / "modules.json",
-                root / "config" / "module_selftests.json",
-            )
+        result = run_integration_checks(
+            root / "config" / "modules.json",
+            {"testcases": {}},
+        )
+
+        self.assertTrue(any("Kein Selftest" in issue for issue in result.issues))
+
+    def test_rejects_invalid_selftest_data(self):
+        modules_config = self.shared_root / "config" / "modules.json"
 
-            self.assertTrue(any("Kein Selftest" in issue for issue in result.issues))
+        for data in ({}, {"testcases": []}):
+            with self.subTest(data=data), self.assertRaises(ModuleIntegrationError):
+                run_integration_checks(modules_config, data)
 
     def test_reports_manifest_id_mismatch(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            self._write_module(root, "mod_a", manifest_id="mod_b", manifest_name="Modul A")
-            modules = [
-                {
-                    "id": "mod_a",
-                    "name": "Modul A",
-                    "path": "modules/mod_a",
-                    "enabled": True,
-                    "description": "Test",
-                }
-            ]
-            testcases = {"mod_a": {"text": "ok"}}
-            self._write_configs(root, modules, testcases)
+        root = self._new_root()
+        self._write_module(root, _MANIFEST_ID_MISMATCH_JSON)
+        self._write_configs(root)
 
-            result = run_integration_checks(
-                root / "config" / "modules.json",
-                root / "config" / "module_selftests.json",
-            )
+        result = run_integration_checks(
+            root / "config" / "modules.json",
+            root / "config" / "module_selftests.json",
+        )
 
-            self.assertTrue(
-                any(
-                    "Manifest-ID passt nicht" in issue
-                    or "Manifest: id muss dem Modulordner entsprechen" in issue
-                    for issue in result.issues
-                )
+        self.assertTrue(
+            any(
+                "Manifest-ID passt nicht" in issue
+                or "Manifest: id muss dem Modulordner entsprechen" in issue
+                for issue in result.issues
             )
+        )
 
     def test_reports_selftest_failure(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            module_dir = self._write_module(root, "mod_a", manifest_name="Modul A")
-            (module_dir / "module.py").write_text(
-                "\n".join(
-                    [
-                        "def validateInput(input_data):",
-                        "    return input_data",
-                        "",
-                        "def validateOutput(output):",
-                        "    return output",
-                        "",
-                        "def run(input_data):",
-                        "    return None",
-                        "",
-                    ]
-                ),
-                encoding="utf-8",
-            )
-            modules = [
-                {
-                    "id": "mod_a",
-                    "name": "Modul A",
-                    "path": "modules/mod_a",
-                    "enabled": True,
-                    "description": "Test",
-                }
-            ]
-            testcases = {"mod_a": {"text": "ok"}}
-            self._write_configs(root, modules, testcases)
-
-            result = run_integration_checks(
-                root / "config" / "modules.json",
-                root / "config" / "module_selftests.json",
-            )
+        root = self._new_root()
+        module_dir = self._write_module(root)
+        (module_dir / "module.py").write_text(_SRC_RUN_RETURNS_NONE, encoding="utf-8")
+        self._write_configs(root)
+
+        result = run_integration_checks(
+            root / "config" / "modules.json",
+            root / "config" / "module_selftests.json",
+        )
 
-            self.assertTrue(any("Selftest fehlgeschlagen" in issue for issue in result.issues))
+        self.assertTrue(any("Selftest fehlgeschlagen" in issue for issue in result.issues))
 
     def test_reports_manifest_name_mismatch(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            self._write_module(root, "mod_a", manifest_name="Anderer Name")
-            modules = [
-                {
-                    "id": "mod_a",
-                    "name": "Modul A",
-                    "path": "modules/mod_a",
-                    "enabled": True,
-                    "description": "Test",
-                }
-            ]
-            testcases = {"mod_a": {"text": "ok"}}
-            self._write_configs(root, modules, testcases)
+        root = self._new_root()
+        self._write_module(root, _MANIFEST_NAME_MISMATCH_JSON)
+        self._write_configs(root)
 
-            result = run_integration_checks(
-                root / "config" / "modules.json",
-                root / "config" / "module_selftests.json",
-            )
+        result = run_integration_checks(
+            root / "config" / "modules.json",
+            root / "config" / "module_selftests.json",
+        )
 
-            self.assertTrue(any("Manifest-Name passt nicht" in issue for issue in result.issues))
+        self.assertTrue(any("Manifest-Name passt nicht" in issue for issue in result.issues))
 
 
 if __name__ == "__main__":
@@ -1,19 +1,18 @@
-from pathlib import Path
-
+from _paths import REPO_ROOT
 from module_manager import ModuleManager
 
+_CONFIG_PATH = REPO_ROOT / "config" / "modules.json"
+
 
 def test_module_manager_loads_registry() -> None:
-    config_path = Path(__file__).resolve().parents[1] / "config" / "modules.json"
-    manager = ModuleManager(config_path=config_path, debug=False)
+    manager = ModuleManager(config_path=_CONFIG_PATH, debug=False)
     states = manager.list_states()
     assert states
     assert all(state.entry.module_id for state in states)
 
 
 def test_module_manager_activate_deactivate() -> None:
-    config_path = Path(__file__).resolve().parents[1] / "config" / "modules.json"
-    manager = ModuleManager(config_path=config_path, debug=True)
+    manager = ModuleManager(config_path=_CONFIG_PATH, debug=True)
     result = manager.activate_module("status")
     assert result.status in {"ok", "warn"}
     state = manager.get_state("status")
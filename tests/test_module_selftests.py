@@ -1,81 +1,97 @@
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 import module_selftests
+from module_registry import ModuleEntry
+
+# Feste Test-Dateien: einmal beim Import serialisiert; der Test schreibt nur noch Bytes.
+_MANIFEST_JSON = json.dumps(
+    {
+        "id": "demo",
+        "name": "Demo",
+        "version": "1.0.0",
+        "description": "Demo-Modul",
+        "entry": "module.py",
+    }
+).encode("utf-8")
+_MODULES_JSON = json.dumps(
+    {
+        "modules": [
+            {
+                "id": "demo",
+                "name": "Demo",
+                "path": "modules/demo",
+                "enabled": True,
+                "description": "Demo-Modul",
+            }
+        ]
+    }
+).encode("utf-8")
+_SELFTESTS_JSON = json.dumps({"testcases": {"demo": {"ping": "pong"}}}).encode("utf-8")
+_SRC_PING = """\
+def init():
+    return True
+
+def run(input_data):
+    if input_data.get('ping') != 'pong':
+        raise ValueError('ping fehlt')
+    return {'status': 'ok'}
+
+def exit():
+    return True
+"""
 
 
 class ModuleSelftestsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Demo-Baum einmal je Klasse; die Tests lesen ihn nur.
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.root = Path(tmp.name)
+        module_dir = cls.root / "modules" / "demo"
+        module_dir.mkdir(parents=True)
+        (module_dir / "module.py").write_text(_SRC_PING, encoding="utf-8")
+        (module_dir / "manifest.json").write_bytes(_MANIFEST_JSON)
+        (cls.root / "modules" / "kaputt").mkdir()
+
+        config_dir = cls.root / "config"
+        config_dir.mkdir()
+        (config_dir / "modules.json").write_bytes(_MODULES_JSON)
+        (config_dir / "module_selftests.json").write_bytes(_SELFTESTS_JSON)
+
     def test_selftest_runs_module(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            module_dir = root / "modules" / "demo"
-            module_dir.mkdir(parents=True)
-            module_path = module_dir / "module.py"
-            module_path.write_text(
-                "\n".join(
-                    [
-                        "def init():",
-                        "    return True",
-                        "",
-                        "def run(input_data):",
-                        "    if input_data.get('ping') != 'pong':",
-                        "        raise ValueError('ping fehlt')",
-                        "    return {'status': 'ok'}",
-                        "",
-                        "def exit():",
-                        "    return True",
-                    ]
-                ),
-                encoding="utf-8",
-            )
-            manifest_path = module_dir / "manifest.json"
-            manifest_path.write_text(
-                json.dumps(
-                    {
-                        "id": "demo",
-                        "name": "Demo",
-                        "version": "1.0.0",
-                        "description": "Demo-Modul",
-                        "entry": "module.py",
-                    }
-                ),
-                encoding="utf-8",
-            )
+        config_dir = self.root / "config"
+
+        results = module_selftests.run_selftests(
+            config_dir / "modules.json", config_dir / "module_selftests.json"
+        )
+        self.assertEqual(1, len(results))
+        self.assertEqual("ok", results[0].status)
+
+    def test_loaded_selftests_keep_config_order(self):
+        def entry(module_id: str, enabled: bool = True) -> ModuleEntry:
+            path = self.root / "modules" / module_id
+            return ModuleEntry(module_id, module_id.title(), path, enabled, "Test")
 
-            config_dir = root / "config"
-            config_dir.mkdir()
-            modules_config = config_dir / "modules.json"
-            modules_config.write_text(
-                json.dumps(
-                    {
-                        "modules": [
-                            {
-                                "id": "demo",
-                                "name": "Demo",
-                                "path": "modules/demo",
-                                "enabled": True,
-                                "description": "Demo-Modul",
-                            }
-                        ]
-                    }
-                ),
-                encoding="utf-8",
-            )
+        entries = [entry("kaputt"), entry("aus", enabled=False), entry("demo"), entry("ohne")]
+        testcases = {"kaputt": {}, "aus": {}, "demo": {"ping": "pong"}}
 
-            selftests_config = config_dir / "module_selftests.json"
-            selftests_config.write_text(
-                json.dumps({"testcases": {"demo": {"ping": "pong"}}}),
-                encoding="utf-8",
-            )
+        results = module_selftests.run_loaded_selftests(entries, testcases)
 
-            results = module_selftests.run_selftests(modules_config, selftests_config)
-            self.assertEqual(1, len(results))
-            self.assertEqual("ok", results[0].status)
+        self.assertEqual(
+            [
+                ("kaputt", "fehler"),
+                ("aus", "übersprungen"),
+                ("demo", "ok"),
+                ("ohne", "übersprungen"),
+            ],
+            [(result.module_id, result.status) for result in results],
+        )
+        self.assertIn("Manifest fehlt", results[0].message)
 
 
 if __name__ == "__main__":
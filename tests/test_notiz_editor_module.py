@@ -1,6 +1,9 @@
 import json
+import os
 from pathlib import Path
 
+import pytest
+
 from modules.notiz_editor import module as notiz_module
 
 
@@ -59,3 +62,41 @@ def test_notiz_editor_create_and_dashboard(tmp_path: Path) -> None:
         {"action": "dashboard", "context": {"config_path": str(config_path)}}
     )
     assert dashboard["data"]["total_notes"] == 1
+
+
+def test_notiz_editor_reuses_config_until_it_changes(tmp_path: Path) -> None:
+    config_path = _write_config(tmp_path)
+    context = {"config_path": str(config_path)}
+    notiz_module._load_config_cached.cache_clear()
+
+    assert notiz_module.init(context)["status"] == "ok"
+    for _ in range(3):
+        notiz_module.run({"action": "list_templates", "context": context})
+    assert notiz_module._load_config_cached.cache_info().misses == 1
+
+    raw = json.loads(config_path.read_text(encoding="utf-8"))
+    raw["templates"][0]["name"] = "Neu"
+    config_path.write_text(json.dumps(raw), encoding="utf-8")
+    stamp = config_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_path, ns=(stamp, stamp))
+
+    result = notiz_module.run({"action": "list_templates", "context": context})
+    assert result["data"]["templates"][0]["name"] == "Neu"
+    assert notiz_module._load_config_cached.cache_info().misses == 2
+
+
+def test_notiz_editor_responses_cannot_change_cached_config(tmp_path: Path) -> None:
+    context = {"config_path": str(_write_config(tmp_path))}
+    notiz_module._load_config_cached.cache_clear()
+
+    first = notiz_module.run({"action": "list_templates", "context": context})
+    with pytest.raises(TypeError):
+        first["data"]["templates"][0]["name"] = "Geändert"
+    with pytest.raises(AttributeError):
+        first["ui"]["menus"].append("Fremd")
+
+    second = notiz_module.run({"action": "list_templates", "context": context})
+    assert second["data"]["templates"] is first["data"]["templates"]
+    assert second["data"]["templates"][0]["name"] == "Test"
+    assert second["ui"]["menus"] == ()
+    assert notiz_module._load_config_cached.cache_info().hits >= 1
@@ -0,0 +1,68 @@
+import ast
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
+
+from onefile_builder import (
+    OnefileBuildError,
+    OnefileConfig,
+    OnefileDataItem,
+    build_spec_content,
+    write_spec,
+)
+
+
+class OnefileBuilderTests(unittest.TestCase):
+    def _config(self, **overrides) -> OnefileConfig:
+        values = {
+            "name": "demo_onefile",
+            "entry_script": Path("system/entry.py"),
+            "output_dir": Path("dist"),
+            "add_data": [OnefileDataItem(source="config", target="config")],
+            "hidden_imports": ["tkinter"],
+            "icon": None,
+        }
+        values.update(overrides)
+        return OnefileConfig(**values)
+
+    def test_spec_contains_datas_and_hidden_imports(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_root = Path(tmpdir)
+            (repo_root / "system").mkdir()
+            (repo_root / "system" / "entry.py").write_text("print('hi')\n", encoding="utf-8")
+            (repo_root / "config").mkdir()
+
+            content = build_spec_content(repo_root, self._config())
+
+            ast.parse(content)
+            self.assertIn(repr([(str(repo_root / "config"), "config")]), content)
+            self.assertIn("hiddenimports=['tkinter']", content)
+            self.assertIn("name='demo_onefile'", content)
+
+    def test_write_spec_keeps_unchanged_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_root = Path(tmpdir)
+            (repo_root / "system").mkdir()
+            (repo_root / "system" / "entry.py").write_text("print('hi')\n", encoding="utf-8")
+            (repo_root / "config").mkdir()
+            output_dir = repo_root / "dist"
+
+            spec_path = write_spec(repo_root, self._config(), output_dir)
+            first_mtime = spec_path.stat().st_mtime_ns
+            self.assertEqual(spec_path, write_spec(repo_root, self._config(), output_dir))
+            self.assertEqual(first_mtime, spec_path.stat().st_mtime_ns)
+
+    def test_missing_add_data_source_is_reported(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_root = Path(tmpdir)
+            (repo_root / "system").mkdir()
+            (repo_root / "system" / "entry.py").write_text("print('hi')\n", encoding="utf-8")
+            with self.assertRaises(OnefileBuildError):
+                build_spec_content(repo_root, self._config())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,15 @@
 import json
 import os
-import sys
-import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 import permission_guard
+from _tmp import TempDirTestCase
 
 
-class PermissionGuardTests(unittest.TestCase):
+class PermissionGuardTests(TempDirTestCase):
     def _write_manifest(self, module_dir: Path, permissions) -> None:
         payload = {
             "id": module_dir.name,
@@ -19,65 +18,118 @@ class PermissionGuardTests(unittest.TestCase):
             "entry": "module.py",
             "permissions": permissions,
         }
-        (module_dir / "manifest.json").write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
+        (module_dir / "manifest.json").write_bytes(
+            json.dumps(payload, ensure_ascii=False).encode("utf-8")
         )
 
     def test_write_allowed_with_permission(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            (root / "config").mkdir()
-            (root / "modules").mkdir()
-            (root / "data").mkdir()
-            module_dir = root / "modules" / "demo_modul"
-            module_dir.mkdir()
-            module_file = module_dir / "module.py"
-            module_file.write_text("# demo", encoding="utf-8")
-            self._write_manifest(module_dir, ["write:data"])
-
-            target = root / "data" / "demo.json"
+        root = self.make_temp_dir()
+        (root / "config").mkdir()
+        (root / "modules").mkdir()
+        (root / "data").mkdir()
+        module_dir = root / "modules" / "demo_modul"
+        module_dir.mkdir()
+        module_file = module_dir / "module.py"
+        module_file.write_text("# demo", encoding="utf-8")
+        self._write_manifest(module_dir, ["write:data"])
+
+        target = root / "data" / "demo.json"
+        with mock.patch.dict(os.environ, {"GENREARCHIV_WRITE_MODE": "normal"}):
             permission_guard.require_write_access(module_file, target, "Test schreiben")
 
     def test_write_denied_without_permission(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            (root / "config").mkdir()
-            (root / "modules").mkdir()
-            (root / "data").mkdir()
-            module_dir = root / "modules" / "demo_modul"
-            module_dir.mkdir()
-            module_file = module_dir / "module.py"
-            module_file.write_text("# demo", encoding="utf-8")
-            self._write_manifest(module_dir, ["read:data"])
-
-            target = root / "data" / "demo.json"
+        root = self.make_temp_dir()
+        (root / "config").mkdir()
+        (root / "modules").mkdir()
+        (root / "data").mkdir()
+        module_dir = root / "modules" / "demo_modul"
+        module_dir.mkdir()
+        module_file = module_dir / "module.py"
+        module_file.write_text("# demo", encoding="utf-8")
+        self._write_manifest(module_dir, ["read:data"])
+
+        target = root / "data" / "demo.json"
+        with self.assertRaises(permission_guard.PermissionGuardError):
+            permission_guard.require_write_access(module_file, target, "Test schreiben")
+
+    def test_read_only_mode_blocks_writes(self) -> None:
+        root = self.make_temp_dir()
+        (root / "config").mkdir()
+        (root / "modules").mkdir()
+        (root / "data").mkdir()
+        module_dir = root / "modules" / "demo_modul"
+        module_dir.mkdir()
+        module_file = module_dir / "module.py"
+        module_file.write_text("# demo", encoding="utf-8")
+        self._write_manifest(module_dir, ["write:data"])
+
+        target = root / "data" / "demo.json"
+        with mock.patch.dict(os.environ, {"GENREARCHIV_WRITE_MODE": "read-only"}):
             with self.assertRaises(permission_guard.PermissionGuardError):
                 permission_guard.require_write_access(module_file, target, "Test schreiben")
 
-    def test_read_only_mode_blocks_writes(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            (root / "config").mkdir()
-            (root / "modules").mkdir()
-            (root / "data").mkdir()
-            module_dir = root / "modules" / "demo_modul"
-            module_dir.mkdir()
-            module_file = module_dir / "module.py"
-            module_file.write_text("# demo", encoding="utf-8")
-            self._write_manifest(module_dir, ["write:data"])
-
-            target = root / "data" / "demo.json"
-            original = os.environ.get("GENREARCHIV_WRITE_MODE")
-            os.environ["GENREARCHIV_WRITE_MODE"] = "read-only"
-            try:
-                with self.assertRaises(permission_guard.PermissionGuardError):
-                    permission_guard.require_write_access(module_file, target, "Test schreiben")
-            finally:
-                if original is None:
-                    os.environ.pop("GENREARCHIV_WRITE_MODE", None)
-                else:
-                    os.environ["GENREARCHIV_WRITE_MODE"] = original
+    def test_normalize_permissions_rejects_invalid_entries(self) -> None:
+        self.assertEqual(
+            ("write:data", "read"),
+            permission_guard._normalize_permissions(["Write:Data", "read", "write:data"]),
+        )
+        for entry in ["write:", "execute", "write:data:extra", "read-data"]:
+            with self.assertRaises(permission_guard.PermissionGuardError):
+                permission_guard._normalize_permissions([entry])
+
+    def test_permission_context_follows_manifest_changes(self) -> None:
+        root = self.make_temp_dir()
+        module_dir = root / "modules" / "demo_modul"
+        module_dir.mkdir(parents=True)
+        module_file = module_dir / "module.py"
+        module_file.write_text("# demo", encoding="utf-8")
+        self._write_manifest(module_dir, ["read:data"])
+        cached = permission_guard._manifest_permissions_cached
+        cached.cache_clear()
+        first = permission_guard.load_permission_context(module_file)
+        self.assertEqual(("read:data",), first.permissions)
+        self.assertEqual(first, permission_guard.load_permission_context(module_file))
+        self.assertEqual((1, 1), (cached.cache_info().hits, cached.cache_info().misses))
+
+        self._write_manifest(module_dir, ["read:data", "write:logs"])
+        manifest_path = module_dir / "manifest.json"
+        stamp = manifest_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(manifest_path, ns=(stamp, stamp))
+        updated = permission_guard.load_permission_context(module_file)
+        self.assertEqual(("read:data", "write:logs"), updated.permissions)
+
+    def test_write_check_resolves_module_file_once(self) -> None:
+        root = self.make_temp_dir()
+        (root / "config").mkdir()
+        module_dir = root / "modules" / "demo_modul"
+        module_dir.mkdir(parents=True)
+        module_file = module_dir / "module.py"
+        module_file.write_text("# demo", encoding="utf-8")
+        self._write_manifest(module_dir, ["write:data"])
+        target = root / "data" / "demo.json"
+
+        with mock.patch.dict(os.environ, {"GENREARCHIV_WRITE_MODE": "normal"}):
+            permission_guard.require_write_access(module_file, target, "Test schreiben")
+            with mock.patch.object(
+                permission_guard, "load_manifest", side_effect=AssertionError
+            ), mock.patch.object(
+                Path, "resolve", autospec=True, side_effect=Path.resolve
+            ) as resolve:
+                permission_guard.require_write_access(module_file, target, "Test schreiben")
+
+        resolved = [call.args[0] for call in resolve.call_args_list]
+        self.assertEqual(1, resolved.count(module_file))
+
+    def test_path_category_uses_directory_boundaries(self) -> None:
+        root = self.make_temp_dir()
+        category = permission_guard._path_category
+        self.assertEqual("data", category(root, root / "data"))
+        self.assertEqual("data", category(root, root / "data" / "a" / "b.json"))
+        self.assertEqual("logs", category(root, root / "logs" / "app.log"))
+        self.assertIsNone(category(root, root / "data_backup" / "x.json"))
+        self.assertIsNone(category(root, root))
+        self.assertEqual("external", category(root, root.parent / "fremd.json"))
+        self.assertEqual("external", category(root, Path(f"{root}_neben") / "x"))
 
 
 if __name__ == "__main__":
@@ -1,13 +1,26 @@
-import sys
+import hashlib
+import json
 import tempfile
 import unittest
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
+import _paths  # noqa: F401  (setzt die Suchpfade)
+from pin_auth import (
+    PinAuthError,
+    PinConfig,
+    _hash_pin,
+    check_pin,
+    load_pin_config,
+    load_state,
+    save_state,
+)
 
-from pin_auth import PinConfig, check_pin, save_state
+# Test-Hashes einmal beim Import: Alt-Format sha256(Salt + PIN) und das teure scrypt.
+_LEGACY_HASH_0000 = hashlib.sha256(b"provoware_default" + b"0000").hexdigest()
+_SCRYPT_HASH_0000 = _hash_pin("0000", "provoware_default")
+_SCRYPT_HASH_4711 = _hash_pin("4711", "salz")
 
 
 class PinAuthTests(unittest.TestCase):
@@ -30,7 +43,7 @@ class PinAuthTests(unittest.TestCase):
         config = PinConfig(
             enabled=True,
             pin_hint="",
-            pin_hash="51438668b2cd007966b2f9887140fb75e5712fb53b42ae8f80eaed2ed32e2c6c",
+            pin_hash=_LEGACY_HASH_0000,
             salt="provoware_default",
             max_attempts=3,
             lock_min_seconds=1,
@@ -62,6 +75,132 @@ class PinAuthTests(unittest.TestCase):
             result = check_pin(config, state_path)
             self.assertEqual(result, 2)
 
+    def test_check_pin_accepts_scrypt_hash(self):
+        config = PinConfig(
+            enabled=True,
+            pin_hint="",
+            pin_hash=_SCRYPT_HASH_4711,
+            salt="salz",
+            max_attempts=3,
+            lock_min_seconds=1,
+            lock_max_seconds=2,
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "pin_state.json"
+            with patch("builtins.input", return_value="4711"):
+                self.assertEqual(check_pin(config, state_path), 0)
+            with patch("builtins.input", return_value="0815"):
+                self.assertEqual(check_pin(config, state_path), 1)
+
+    def test_check_pin_rejects_non_ascii_hash_without_error(self):
+        for pin_hash in ("häsh", _SCRYPT_HASH_4711[:-1] + "ä"):
+            with self.subTest(pin_hash=pin_hash), tempfile.TemporaryDirectory() as tmpdir:
+                config = PinConfig(
+                    enabled=True,
+                    pin_hint="",
+                    pin_hash=pin_hash,
+                    salt="salz",
+                    max_attempts=3,
+                    lock_min_seconds=1,
+                    lock_max_seconds=2,
+                )
+                state_path = Path(tmpdir) / "pin_state.json"
+                with patch("builtins.input", return_value="4711"):
+                    self.assertEqual(check_pin(config, state_path), 1)
+
+    def test_check_pin_migrates_legacy_hash(self):
+        legacy_hash = _LEGACY_HASH_0000
+        config = PinConfig(
+            enabled=True,
+            pin_hint="",
+            pin_hash=legacy_hash,
+            salt="provoware_default",
+            max_attempts=3,
+            lock_min_seconds=1,
+            lock_max_seconds=2,
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "pin_state.json"
+            config_path = Path(tmpdir) / "pin.json"
+            config_path.write_text(
+                json.dumps({"enabled": True, "pin_hash": legacy_hash}), encoding="utf-8"
+            )
+            with patch("builtins.input", return_value="0000"):
+                self.assertEqual(check_pin(config, state_path, config_path), 0)
+            stored = json.loads(config_path.read_text(encoding="utf-8"))
+            self.assertTrue(stored["pin_hash"].startswith("scrypt$"))
+            self.assertEqual(stored["pin_hash"], _SCRYPT_HASH_0000)
+            self.assertEqual([config_path, state_path], sorted(Path(tmpdir).iterdir()))
+
+    def test_save_state_replaces_file_without_leftovers(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "pin_state.json"
+            save_state(state_path, {"failed_attempts": 1, "locked_until": None})
+            save_state(state_path, {"failed_attempts": 2, "locked_until": None})
+            self.assertEqual(load_state(state_path)["failed_attempts"], 2)
+            self.assertEqual([state_path], list(Path(tmpdir).iterdir()))
+
+    def test_check_pin_locked_with_epoch_and_legacy_migration(self):
+        config = PinConfig(
+            enabled=True,
+            pin_hint="",
+            pin_hash="hash",
+            salt="salt",
+            max_attempts=3,
+            lock_min_seconds=1,
+            lock_max_seconds=2,
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "pin_state.json"
+            locked_until = datetime.now(timezone.utc) + timedelta(seconds=30)
+            save_state(
+                state_path,
+                {"failed_attempts": 2, "locked_until": locked_until.isoformat()},
+            )
+            self.assertEqual(check_pin(config, state_path), 2)
+            state = load_state(state_path)
+            self.assertNotIn("locked_until", state)
+            self.assertEqual(state["locked_until_epoch"], int(locked_until.timestamp()))
+            self.assertEqual(check_pin(config, state_path), 2)
+
+    def test_check_pin_wrong_pin_stores_epoch_lock(self):
+        config = PinConfig(
+            enabled=True,
+            pin_hint="",
+            pin_hash="hash",
+            salt="salt",
+            max_attempts=3,
+            lock_min_seconds=3,
+            lock_max_seconds=3,
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "pin_state.json"
+            with patch("builtins.input", return_value="1234"):
+                self.assertEqual(check_pin(config, state_path), 1)
+            state = load_state(state_path)
+            self.assertEqual(state["failed_attempts"], 1)
+            self.assertIsInstance(state["locked_until_epoch"], int)
+
+    def test_load_pin_config_applies_defaults_and_validates(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "pin.json"
+            payload = {"enabled": True, "pin_hint": "Hinweis", "pin_hash": "abc", "salt": "s"}
+            config_path.write_text(json.dumps(payload), encoding="utf-8")
+            config = load_pin_config(config_path)
+            self.assertEqual((config.max_attempts, config.lock_min_seconds), (3, 2))
+            self.assertEqual(config.scrypt_n, 2**14)
+
+            invalid = [
+                ("max_attempts", True),
+                ("scrypt_n", 1000),
+                ("scrypt_n", 2**15),
+                ("salt", " "),
+            ]
+            for key, value in invalid:
+                config_path.write_text(json.dumps({**payload, key: value}), encoding="utf-8")
+                with self.assertRaises(PinAuthError):
+                    load_pin_config(config_path)
+
 
 if __name__ == "__main__":
     unittest.main()
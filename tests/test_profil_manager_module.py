@@ -1,28 +1,43 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
+import pytest
+
 from modules.profil_manager import module as profil_manager_module
 
+# Einmal beim Import serialisiert; die beiden null-Werte werden zu %s-Platzhaltern für die Pfade.
+_CONFIG_TEMPLATE = (
+    json.dumps(
+        {
+            "base_dir": None,
+            "state_path": None,
+            "default_theme": "dunkel",
+            "themes": {
+                "dunkel": {
+                    "background": "#000",
+                    "foreground": "#fff",
+                    "accent": "#8b5cf6",
+                    "panel": "#111",
+                }
+            },
+            "ui": {"title": "Test", "menus": [{"label": "Profile"}]},
+            "debug": False,
+        }
+    )
+    .encode("utf-8")
+    .replace(b"null", b"%s", 2)
+)
+
 
 def write_config(path: Path, base_dir: Path, state_path: Path) -> None:
-    config = {
-        "base_dir": str(base_dir),
-        "state_path": str(state_path),
-        "default_theme": "dunkel",
-        "themes": {
-            "dunkel": {
-                "background": "#000",
-                "foreground": "#fff",
-                "accent": "#8b5cf6",
-                "panel": "#111",
-            }
-        },
-        "ui": {"title": "Test"},
-        "debug": False,
-    }
-    path.write_text(json.dumps(config), encoding="utf-8")
+    # json.dumps je Pfad hält Anführungszeichen und Escapes korrekt.
+    path.write_bytes(
+        _CONFIG_TEMPLATE
+        % (json.dumps(str(base_dir)).encode("utf-8"), json.dumps(str(state_path)).encode("utf-8"))
+    )
 
 
 def test_profil_manager_lifecycle(tmp_path: Path) -> None:
@@ -63,3 +78,39 @@ def test_profil_manager_lifecycle(tmp_path: Path) -> None:
         }
     )
     assert set_active["status"] == "ok"
+
+
+def test_profil_manager_reuses_config_until_it_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    write_config(config_path, tmp_path / "profiles", tmp_path / "state.json")
+    context = {"config_path": str(config_path)}
+    profil_manager_module._load_config_cached.cache_clear()
+
+    for _ in range(3):
+        profil_manager_module.run({"action": "list_profiles", "context": context})
+    assert profil_manager_module._load_config_cached.cache_info().misses == 1
+
+    write_config(config_path, tmp_path / "andere", tmp_path / "state.json")
+    stamp = config_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_path, ns=(stamp, stamp))
+
+    assert profil_manager_module.load_config(context).base_dir == tmp_path / "andere"
+    assert profil_manager_module._load_config_cached.cache_info().misses == 2
+
+
+def test_profil_manager_responses_cannot_change_cached_config(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    write_config(config_path, tmp_path / "profiles", tmp_path / "state.json")
+    context = {"config_path": str(config_path)}
+    profil_manager_module._load_config_cached.cache_clear()
+
+    first = profil_manager_module.run({"action": "list_profiles", "context": context})
+    with pytest.raises(TypeError):
+        first["ui"]["menus"][0]["label"] = "Geändert"
+    with pytest.raises(AttributeError):
+        first["ui"]["menus"].append({"label": "Fremd"})
+
+    second = profil_manager_module.run({"action": "list_profiles", "context": context})
+    assert second["ui"]["menus"] is first["ui"]["menus"]
+    assert second["ui"]["menus"] == ({"label": "Profile"},)
+    assert profil_manager_module._load_config_cached.cache_info().hits >= 1
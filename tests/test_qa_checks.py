@@ -1,49 +1,84 @@
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 import qa_checks
 
+# Feste Test-Dateien: einmal beim Import serialisiert; die Tests schreiben nur Bytes.
+_MODULES_JSON = json.dumps({"modules": []}).encode("utf-8")
+_SELECTIVE_EXPORT_JSON = json.dumps(
+    {
+        "default_preset": "logs_only",
+        "output_dir": "data/exports",
+        "base_name": "selective_export",
+        "presets": {
+            "logs_only": {
+                "label": "Nur Logs",
+                "includes": ["logs"],
+                "excludes": [],
+            }
+        },
+    }
+).encode("utf-8")
+
 
 class QualityChecksTests(unittest.TestCase):
     def test_classify_issue_detects_severity(self):
         self.assertEqual("schwer", qa_checks.classify_issue("Datei fehlt: config.json"))
         self.assertEqual("leicht", qa_checks.classify_issue("Hinweis: optionaler Eintrag"))
         self.assertEqual("mittel", qa_checks.classify_issue("Unbekanntes Problem"))
+        self.assertEqual("schwer", qa_checks.classify_issue("Eintrag UNGÜLTIG"))
 
     def test_check_release_files_reports_missing(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
             (root / "config").mkdir()
             (root / "scripts").mkdir()
-            (root / "config" / "modules.json").write_text(
-                json.dumps({"modules": []}), encoding="utf-8"
-            )
-            (root / "config" / "selective_export.json").write_text(
-                json.dumps(
-                    {
-                        "default_preset": "logs_only",
-                        "output_dir": "data/exports",
-                        "base_name": "selective_export",
-                        "presets": {
-                            "logs_only": {
-                                "label": "Nur Logs",
-                                "includes": ["logs"],
-                                "excludes": [],
-                            }
-                        },
-                    }
-                ),
-                encoding="utf-8",
-            )
+            (root / "config" / "modules.json").write_bytes(_MODULES_JSON)
+            (root / "config" / "selective_export.json").write_bytes(_SELECTIVE_EXPORT_JSON)
             report = qa_checks.check_release_files(root)
             self.assertEqual("rot", report.traffic_light)
             self.assertTrue(report.issues)
 
+    def test_check_release_files_classifies_each_entry(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for rel_path, _label, _required, check_type in qa_checks.RELEASE_CHECKS:
+                path = root / rel_path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(_MODULES_JSON if check_type == "json" else b"")
+            self.assertEqual("grün", qa_checks.check_release_files(root).traffic_light)
+
+            (root / "config" / "backup.json").unlink()
+            (root / "config" / "backup.json").mkdir()
+            (root / "todo.txt").unlink()
+            (root / "todo.txt").symlink_to(root / "fehlt.txt")
+            (root / "config" / "modules.json").write_bytes(b"{kaputt")
+
+            messages = [issue.message for issue in qa_checks.check_release_files(root).issues]
+            self.assertEqual(
+                [
+                    f"JSON ist ungültig: {root / 'config' / 'modules.json'}",
+                    f"Pfad ist keine Datei: Backup-System ({root / 'config' / 'backup.json'}).",
+                    f"Datei fehlt: Kurzliste (todo.txt) ({root / 'todo.txt'}).",
+                ],
+                messages,
+            )
+
+    def test_read_json_cache_is_invalidated_on_change(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "modules.json"
+            path.write_bytes(_MODULES_JSON)
+            qa_checks._json_is_valid.cache_clear()
+            qa_checks._read_json(path)
+            qa_checks._read_json(path)
+            self.assertEqual(1, qa_checks._json_is_valid.cache_info().hits)
+            path.write_bytes(b"{kaputt")
+            with self.assertRaises(qa_checks.QualityCheckError):
+                qa_checks._read_json(path)
+
 
 if __name__ == "__main__":
     unittest.main()
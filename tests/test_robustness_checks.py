@@ -1,99 +1,119 @@
 import json
-import sys
+import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
+from _tmp import TempDirTestCase
 from health_check import run_health_check
 from json_validator import validate_json_file
 
-
-class RobustnessChecksTests(unittest.TestCase):
-    def _build_health_root(self, root: Path) -> None:
-        for folder in ("config", "system", "scripts", "modules", "data", "logs", "tests", "src"):
-            (root / folder).mkdir(parents=True, exist_ok=True)
-
-        (root / "config" / "modules.json").write_text("{}", encoding="utf-8")
-        (root / "config" / "launcher_gui.json").write_text("{}", encoding="utf-8")
-        (root / "config" / "requirements.txt").write_text("pytest\n", encoding="utf-8")
-        test_gate_payload = {
-            "threshold": 1,
-            "todo_path": "todo.txt",
-            "state_path": "data/test.json",
-            "tests_command": ["echo", "ok"],
-        }
-        (root / "config" / "test_gate.json").write_text(
-            json.dumps(test_gate_payload),
-            encoding="utf-8",
-        )
-        (root / "todo.txt").write_text("# todo\n", encoding="utf-8")
-        (root / "CHANGELOG.md").write_text("# Changelog\n", encoding="utf-8")
-        (root / "DEV_DOKU.md").write_text("# DEV_DOKU\n", encoding="utf-8")
-        (root / "DONE.md").write_text("# DONE\n", encoding="utf-8")
-        (root / "PROGRESS.md").write_text("# PROGRESS\n", encoding="utf-8")
-
-        for script_name in ("start.sh", "run_tests.sh"):
-            script_path = root / "scripts" / script_name
-            script_path.write_text("#!/usr/bin/env bash\n", encoding="utf-8")
-            script_path.chmod(0o755)
-
-        klick_start = root / "klick_start.sh"
-        klick_start.write_text("#!/usr/bin/env bash\n", encoding="utf-8")
-        klick_start.chmod(0o755)
+# Fester Health-Baum: Ordner, Dateien und Skripte mit vorab kodierten Inhalten.
+_DIRS = ("config", "system", "scripts", "modules", "data", "logs", "tests", "src")
+_TEST_GATE_JSON = json.dumps(
+    {
+        "threshold": 1,
+        "todo_path": "todo.txt",
+        "state_path": "data/test.json",
+        "tests_command": ["echo", "ok"],
+    }
+).encode("utf-8")
+_FILES = (
+    ("config/modules.json", b"{}"),
+    ("config/launcher_gui.json", b"{}"),
+    ("config/requirements.txt", b"pytest\n"),
+    ("config/test_gate.json", _TEST_GATE_JSON),
+    ("todo.txt", b"# todo\n"),
+    ("CHANGELOG.md", b"# Changelog\n"),
+    ("DEV_DOKU.md", b"# DEV_DOKU\n"),
+    ("DONE.md", b"# DONE\n"),
+    ("PROGRESS.md", b"# PROGRESS\n"),
+)
+_SCRIPTS = ("scripts/start.sh", "scripts/run_tests.sh", "klick_start.sh")
+_SCRIPT_HEADER = b"#!/usr/bin/env bash\n"
+
+
+class RobustnessChecksTests(TempDirTestCase):
+    def _new_root(self) -> Path:
+        # Direkt aufbauen ist schneller als eine Vorlage zu kopieren (copytree) oder zu entpacken.
+        root = self.make_temp_dir() / "root"
+        self._build_health_root(root)
+        return root
+
+    @staticmethod
+    def _build_health_root(root: Path) -> None:
+        for folder in _DIRS:
+            os.makedirs(root / folder, exist_ok=True)
+        for rel_path, payload in _FILES:
+            (root / rel_path).write_bytes(payload)
+        for rel_path in _SCRIPTS:
+            # Anlegen, Schreiben und Rechte über einen Dateideskriptor; fchmod umgeht die umask.
+            fd = os.open(root / rel_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            try:
+                os.write(fd, _SCRIPT_HEADER)
+                os.fchmod(fd, 0o755)
+            finally:
+                os.close(fd)
 
     def test_health_check_reports_unreadable_file(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            self._build_health_root(root)
-            target = root / "config" / "requirements.txt"
+        root = self._new_root()
+        target = root / "config" / "requirements.txt"
 
-            def fake_access(path, mode):
-                if Path(path) == target:
-                    return False
-                return True
+        def fake_access(path, mode):
+            if Path(path) == target:
+                return False
+            return True
 
-            with patch("os.access", side_effect=fake_access):
-                issues, _ = run_health_check(root, self_repair=False)
+        with patch("os.access", side_effect=fake_access):
+            issues, _ = run_health_check(root, self_repair=False)
 
-            self.assertTrue(any("Datei nicht lesbar" in issue for issue in issues))
+        self.assertTrue(any("Datei nicht lesbar" in issue for issue in issues))
 
     def test_health_check_repairs_unreadable_file(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            self._build_health_root(root)
-            target = root / "config" / "requirements.txt"
-            target.chmod(0o644)
+        root = self._new_root()
+        target = root / "config" / "requirements.txt"
+        target.chmod(0o644)
 
-            def fake_access(path, mode):
-                if Path(path) == target:
-                    return False
-                return True
+        def fake_access(path, mode):
+            if Path(path) == target:
+                return False
+            return True
 
-            with patch("os.access", side_effect=fake_access):
-                issues, repairs = run_health_check(root, self_repair=True)
+        with patch("os.access", side_effect=fake_access):
+            issues, repairs = run_health_check(root, self_repair=True)
 
-            self.assertFalse(any("Datei nicht lesbar" in issue for issue in issues))
-            self.assertTrue(any("Leserechte repariert" in repair for repair in repairs))
+        self.assertFalse(any("Datei nicht lesbar" in issue for issue in issues))
+        self.assertTrue(any("Leserechte repariert" in repair for repair in repairs))
 
     def test_health_check_repairs_unexecutable_script(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            self._build_health_root(root)
-            script_path = root / "scripts" / "run_tests.sh"
-            script_path.chmod(0o644)
+        root = self._new_root()
+        script_path = root / "scripts" / "run_tests.sh"
+        script_path.chmod(0o644)
 
-            issues, repairs = run_health_check(root, self_repair=True)
+        issues, repairs = run_health_check(root, self_repair=True)
+
+        self.assertFalse(any("nicht ausführbar" in issue for issue in issues))
+        self.assertTrue(any("Ausführrechte repariert" in repair for repair in repairs))
+
+    def test_health_check_reports_wrong_path_types(self):
+        root = self._new_root()
+        shutil.rmtree(root / "logs")
+        (root / "logs").write_bytes(b"")
+        (root / "todo.txt").unlink()
+        (root / "todo.txt").mkdir()
+
+        issues, _ = run_health_check(root, self_repair=False)
 
-            self.assertFalse(any("nicht ausführbar" in issue for issue in issues))
-            self.assertTrue(any("Ausführrechte repariert" in repair for repair in repairs))
+        self.assertIn(f"Pfad ist kein Ordner: Logs ({root / 'logs'}).", issues)
+        self.assertIn(f"Pfad ist keine Datei: To-Do-Liste ({root / 'todo.txt'}).", issues)
 
     def test_json_validator_handles_invalid_json(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "broken.json"
-            path.write_text("{ broken", encoding="utf-8")
+            path.write_bytes(b"{ broken")
 
             result = validate_json_file(path)
 
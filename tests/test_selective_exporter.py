@@ -1,11 +1,10 @@
-import sys
 import tempfile
 import unittest
 import zipfile
 from pathlib import Path
+from unittest import mock
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 import selective_exporter
 
 
@@ -18,8 +17,8 @@ class SelectiveExporterTests(unittest.TestCase):
             logs_dir = root / "logs"
             logs_dir.mkdir()
             config_dir = root / "config"
-            (logs_dir / "app.log").write_text("log", encoding="utf-8")
-            (config_dir / "settings.json").write_text("{}", encoding="utf-8")
+            (logs_dir / "app.log").write_bytes(b"log")
+            (config_dir / "settings.json").write_bytes(b"{}")
 
             preset = selective_exporter.ExportPreset(
                 name="logs_only",
@@ -34,11 +33,174 @@ class SelectiveExporterTests(unittest.TestCase):
                 base_name="selective_export",
             )
 
+            # NameToInfo ist das Namensverzeichnis, das ZipFile ohnehin aufbaut (wie im Exporter).
             with zipfile.ZipFile(export_path, "r") as archive:
-                names = set(archive.namelist())
+                self.assertIn("logs/app.log", archive.NameToInfo)
+                self.assertNotIn("config/settings.json", archive.NameToInfo)
+
+    def _export_logs(self, root: Path) -> tuple[dict[str, bytes], list[str], Path]:
+        """Exportiert logs/ mit 20 Dateien (halb in logs/sub); alt.old ist ausgeschlossen."""
+        logs_dir = root / "logs"
+        (logs_dir / "sub").mkdir(parents=True)
+        payloads = {}
+        for index in range(20):
+            name = f"logs/sub/file_{index:02d}.log" if index % 2 else f"logs/file_{index:02d}.log"
+            payloads[name] = f"zeile {index}\n".encode("utf-8") * (index * 50)
+            (root / name).write_bytes(payloads[name])
+        (logs_dir / "alt.old").write_bytes(b"alt")
+
+        preset = selective_exporter.ExportPreset(
+            name="logs_only",
+            label="Nur Logs",
+            includes=["logs"],
+            excludes=["logs/*.old"],
+        )
+        # Erwartete Reihenfolge: dieselbe Verzeichnis-Reihenfolge, die der Exporter durchläuft.
+        order = [
+            rel_posix
+            for _, rel_posix, _ in selective_exporter._iter_entries(
+                root.resolve(), [logs_dir.resolve()], preset._exclude_re
+            )
+        ]
+        export_path = selective_exporter.build_export(
+            root=root,
+            preset=preset,
+            output_dir=Path("data/exports"),
+            base_name="selective_export",
+        )
+        return payloads, order, export_path
+
+    def _assert_archive(
+        self, export_path: Path, payloads: dict[str, bytes], order: list[str], compress_type: int
+    ) -> None:
+        self.assertEqual(sorted(order), sorted(payloads))
+        with zipfile.ZipFile(export_path, "r") as archive:
+            self.assertIsNone(archive.testzip())
+            infos = archive.infolist()
+            self.assertEqual(order, [info.filename for info in infos])
+            self.assertEqual({compress_type}, {info.compress_type for info in infos})
+            for name, payload in payloads.items():
+                self.assertEqual(archive.read(name), payload)
+
+    def test_build_export_writes_valid_archive_in_stable_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            payloads, order, export_path = self._export_logs(Path(tmpdir))
+
+            self._assert_archive(export_path, payloads, order, zipfile.ZIP_STORED)
+
+    def test_build_export_keeps_order_when_streaming_large_files(self) -> None:
+        # Deflate mit Thread-Pool; jede Datei über 1000 Byte läuft gestreamt über ZipFile.open
+        # und leert vorher die wartenden Pool-Ergebnisse.
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            mock.patch.object(selective_exporter, "STORED_MAX_TOTAL_BYTES", 0),
+            mock.patch.object(selective_exporter, "PARALLEL_MAX_BYTES", 1000),
+        ):
+            payloads, order, export_path = self._export_logs(Path(tmpdir))
+
+            self.assertTrue(any(len(payload) > 1000 for payload in payloads.values()))
+            self.assertTrue(any(0 < len(payload) <= 1000 for payload in payloads.values()))
+            self._assert_archive(export_path, payloads, order, zipfile.ZIP_DEFLATED)
+
+    def test_build_export_bounds_bytes_waiting_in_pool(self) -> None:
+        # Pool mit Zähler: eingereichte, noch nicht ins Archiv geschriebene Bytes.
+        in_flight = {"bytes": 0, "peak": 0}
+        write_compressed = selective_exporter._write_compressed
+
+        class RecordingExecutor(selective_exporter.ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):
+                in_flight["bytes"] += args[1].file_size
+                in_flight["peak"] = max(in_flight["peak"], in_flight["bytes"])
+                return super().submit(fn, *args, **kwargs)
+
+        def record_write(archive, info, payload):
+            in_flight["bytes"] -= info.file_size
+            write_compressed(archive, info, payload)
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            mock.patch.object(selective_exporter, "STORED_MAX_TOTAL_BYTES", 0),
+            mock.patch.object(selective_exporter, "PENDING_MAX_BYTES", 10_000),
+            mock.patch.object(selective_exporter, "ThreadPoolExecutor", RecordingExecutor),
+            mock.patch.object(selective_exporter, "_write_compressed", record_write),
+        ):
+            payloads, order, export_path = self._export_logs(Path(tmpdir))
+
+            self.assertLessEqual(in_flight["peak"], 10_000)
+            self.assertEqual(0, in_flight["bytes"])
+            self._assert_archive(export_path, payloads, order, zipfile.ZIP_DEFLATED)
+
+    def test_build_export_stores_small_and_deflates_large_exports(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "logs").mkdir()
+            payload = b"zeile\n" * 2000
+            (root / "logs" / "app.log").write_bytes(payload)
+            preset = selective_exporter.ExportPreset(
+                name="logs_only", label="Nur Logs", includes=["logs"], excludes=[]
+            )
+            small = selective_exporter.build_export(root, preset, Path("data/exports"), "klein")
+            with mock.patch.object(selective_exporter, "STORED_MAX_TOTAL_BYTES", 0):
+                large = selective_exporter.build_export(root, preset, Path("data/exports"), "groß")
+
+            for path, compress_type in (
+                (small, zipfile.ZIP_STORED),
+                (large, zipfile.ZIP_DEFLATED),
+            ):
+                with zipfile.ZipFile(path, "r") as archive:
+                    info = archive.getinfo("logs/app.log")
+                    self.assertEqual(compress_type, info.compress_type)
+                    self.assertIsNone(archive.testzip())
+                    self.assertEqual(payload, archive.read("logs/app.log"))
+
+    def test_build_export_never_overwrites_existing_archives(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "logs").mkdir()
+            (root / "logs" / "app.log").write_bytes(b"log")
+            preset = selective_exporter.ExportPreset(
+                name="logs_only", label="Nur Logs", includes=["logs"], excludes=[]
+            )
+            paths = [
+                selective_exporter.build_export(
+                    root=root,
+                    preset=preset,
+                    output_dir=Path("data/exports"),
+                    base_name="selective_export",
+                )
+                for _ in range(3)
+            ]
+
+            self.assertEqual(3, len(set(paths)))
+            for path in paths:
+                self.assertTrue(zipfile.is_zipfile(path))
+
+    def test_preset_compiles_excludes_once(self) -> None:
+        preset = selective_exporter.ExportPreset(
+            name="ohne_alt", label="Ohne Alt", includes=["logs"], excludes=["logs/*.old", "data"]
+        )
+        pattern = preset._exclude_re
+        self.assertIs(pattern, preset._exclude_re)
+        for rel_posix, excluded in (
+            ("logs/app.old", True),
+            ("logs/app.log", False),
+            ("data", True),
+            ("data/exports/a.zip", True),
+            ("data_backup/a.zip", False),
+        ):
+            with self.subTest(rel_posix=rel_posix):
+                self.assertEqual(excluded, pattern.match(rel_posix) is not None)
+        self.assertIsNone(
+            selective_exporter.ExportPreset(
+                name="x", label="x", includes=[], excludes=[""]
+            )._exclude_re
+        )
 
-            self.assertIn("logs/app.log", names)
-            self.assertNotIn("config/settings.json", names)
+    def test_candidate_names_keep_base_stem(self) -> None:
+        names = selective_exporter._candidate_names("export.zip")
+        self.assertEqual(
+            ["export.zip", "export_1.zip", "export_2.zip"], [next(names) for _ in range(3)]
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,137 @@
+import json
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
+
+import self_repair
+
+
+class SelfRepairTests(unittest.TestCase):
+    def test_dry_run_changes_nothing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _, repairs = self_repair.run_self_repair(root, dry_run=True)
+            self.assertTrue(all(entry.startswith("Geplant:") for entry in repairs))
+            self.assertEqual([], list(root.iterdir()))
+
+    def test_repair_creates_defaults_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self_repair.run_self_repair(root, dry_run=False)
+
+            state = json.loads((root / "data" / "pin_state.json").read_bytes())
+            self.assertIsNone(state["locked_until_epoch"])
+            self.assertTrue((root / "config" / "modules.json").is_file())
+
+            _, repairs = self_repair.run_self_repair(root, dry_run=False)
+            self.assertEqual([], [entry for entry in repairs if "erstellt" in entry])
+
+    def test_broken_json_is_backed_up_and_rewritten(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self_repair.run_self_repair(root, dry_run=False)
+            target = root / "config" / "pin.json"
+            target.write_text("{kaputt", encoding="utf-8")
+
+            _, repairs = self_repair.run_self_repair(root, dry_run=False)
+
+            self.assertIn(f"JSON repariert: PIN-Konfiguration ({target}).", repairs)
+            self.assertEqual(1, len(list(target.parent.glob("pin.json.bak_*"))))
+            json.loads(target.read_bytes())
+
+    def test_directory_in_place_of_file_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self_repair.run_self_repair(root, dry_run=False)
+            (root / "todo.txt").unlink()
+            (root / "todo.txt").mkdir()
+
+            issues, _ = self_repair.run_self_repair(root, dry_run=False)
+
+            self.assertIn(f"Pfad ist keine Datei: To-Do-Liste ({root / 'todo.txt'}).", issues)
+
+    def test_file_in_place_of_scripts_dir_reports_missing_scripts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "scripts").write_bytes(b"")
+
+            issues, _ = self_repair.run_self_repair(root, dry_run=True)
+
+            script = root / "scripts" / "start.sh"
+            self.assertIn(f"Skript fehlt: Start-Routine ({script}).", issues)
+
+    def test_parallel_json_check_keeps_list_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self_repair.run_self_repair(root, dry_run=False)
+            for relative in ("data/pin_state.json", "config/modules.json"):
+                (root / relative).write_text("{kaputt", encoding="utf-8")
+
+            _, repairs = self_repair.run_self_repair(root, dry_run=True)
+
+            planned = [entry for entry in repairs if entry.startswith("Geplant: JSON")]
+            self.assertEqual(2, len(planned))
+            self.assertIn("Modul-Liste", planned[0])
+            self.assertIn("PIN-Status", planned[1])
+
+    def test_clean_run_serializes_no_defaults(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self_repair.run_self_repair(root, dry_run=False)
+            self_repair._serialize_default.cache_clear()
+
+            self_repair.run_self_repair(root, dry_run=False)
+
+            self.assertEqual(0, self_repair._serialize_default.cache_info().currsize)
+            defaults = self_repair.build_default_files(root)
+            self.assertIn(b'"modules"', defaults[root / "config" / "modules.json"])
+            self.assertEqual(1, self_repair._serialize_default.cache_info().currsize)
+            self.assertEqual(
+                {str(path) for path in defaults}, set(self_repair.build_default_files(str(root)))
+            )
+
+    def test_render_output_layout(self) -> None:
+        self.assertEqual(
+            "Self-Repair: Keine Probleme gefunden.", self_repair._render_output([], [], False)
+        )
+        self.assertEqual(
+            "Self-Repair: Probleme gefunden:\n\n- A\n\n"
+            "Hinweis: Reparaturen sind geplant (dry-run).\n- B\n\n"
+            "Bitte die Hinweise prüfen und erneut starten.",
+            self_repair._render_output(["A"], ["B"], True),
+        )
+
+    def test_has_permission_uses_owner_bits_without_access_call(self) -> None:
+        owned = os.stat_result((stat.S_IFREG | 0o600, 0, 0, 1, 1000, 1000, 0, 0, 0, 0))
+        foreign = os.stat_result((stat.S_IFREG | 0o600, 0, 0, 1, 2000, 2000, 0, 0, 0, 0))
+        with mock.patch.object(self_repair, "_EUID", 1000), mock.patch.object(
+            self_repair.os, "access", return_value=False
+        ) as access:
+            self.assertTrue(self_repair._has_permission("x", owned, stat.S_IRUSR, os.R_OK))
+            self.assertFalse(self_repair._has_permission("x", owned, stat.S_IXUSR, os.X_OK))
+            access.assert_not_called()
+            self.assertFalse(self_repair._has_permission("x", foreign, stat.S_IRUSR, os.R_OK))
+            access.assert_called_once_with("x", os.R_OK)
+
+    def test_missing_execute_bit_is_repaired(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self_repair.run_self_repair(root, dry_run=False)
+            script = root / "klick_start.sh"
+            script.write_text("#!/bin/sh\n", encoding="utf-8")
+            script.chmod(0o644)
+
+            _, repairs = self_repair.run_self_repair(root, dry_run=False)
+
+            self.assertIn(f"Ausführrechte repariert: Klick&Start ({script}).", repairs)
+            self.assertTrue(script.stat().st_mode & stat.S_IXUSR)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
+
+import standards_viewer
+
+
+class StandardsViewerTests(unittest.TestCase):
+    def test_load_section_rereads_after_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            sections = standards_viewer._build_sections(root)
+            path = sections[0].path
+            path.write_text("Regel A\n", encoding="utf-8")
+            self.assertEqual("Regel A", standards_viewer._load_section(sections[0]))
+            self.assertEqual("Regel A", standards_viewer._load_section(sections[0]))
+
+            path.write_text("Regel B (neu)\n", encoding="utf-8")
+            stat_result = path.stat()
+            os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+            self.assertEqual("Regel B (neu)", standards_viewer._load_section(sections[0]))
+
+    def test_load_section_reports_missing_and_empty(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sections = standards_viewer._build_sections(Path(tmpdir))
+            with self.assertRaises(standards_viewer.StandardsViewerError):
+                standards_viewer._load_section(sections[1])
+            sections[1].path.write_text("  \n", encoding="utf-8")
+            with self.assertRaises(standards_viewer.StandardsViewerError):
+                standards_viewer._load_section(sections[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
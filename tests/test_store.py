@@ -0,0 +1,44 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
+
+from module_registry import ModuleEntry
+from store import AppStore
+
+
+def _entry(module_id: str, name: str) -> ModuleEntry:
+    return ModuleEntry(
+        module_id=module_id,
+        name=name,
+        path=Path("modules") / module_id,
+        enabled=True,
+        description="",
+    )
+
+
+class AppStoreTests(unittest.TestCase):
+    def test_set_modules_keeps_last_entry_per_id(self) -> None:
+        store = AppStore()
+        self.assertEqual((), store.get_modules())
+        first = _entry("alpha", "Alpha")
+        replaced = _entry("alpha", "Alpha neu")
+        second = _entry("beta", "Beta")
+
+        store.set_modules(iter([first, second, replaced]))
+
+        self.assertEqual((replaced, second), store.get_modules())
+        self.assertIs(store.get_modules(), store.get_modules())
+        self.assertIs(replaced, store.get_module("alpha"))
+
+    def test_set_modules_replaces_cache(self) -> None:
+        store = AppStore()
+        store.set_modules([_entry("alpha", "Alpha")])
+        store.set_modules([])
+        self.assertEqual((), store.get_modules())
+        self.assertIsNone(store.get_module("alpha"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
+
+import structure_checker
+
+
+class StructureCheckerTests(unittest.TestCase):
+    def _build_root(self, root: Path) -> None:
+        for folder in structure_checker.REQUIRED_DIRS:
+            (root / folder).mkdir()
+
+    def test_clean_structure_has_no_issues(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._build_root(root)
+            (root / "config" / "settings.json").write_text("{}", encoding="utf-8")
+            (root / "data" / ".gitkeep").write_text("", encoding="utf-8")
+            (root / "system" / "__pycache__").mkdir()
+            (root / "system" / "__pycache__" / "lauf.log").write_text("", encoding="utf-8")
+
+            self.assertEqual([], list(structure_checker.run_check(root)))
+
+    def test_reports_missing_dirs_and_disallowed_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._build_root(root)
+            (root / "tests").rmdir()
+            (root / "tests").write_text("kein Ordner", encoding="utf-8")
+            (root / "src").rmdir()
+            nested = root / "config" / "tief" / "innen"
+            nested.mkdir(parents=True)
+            (nested / "helfer.PY").write_text("print()", encoding="utf-8")
+            (root / "logs" / "app.log").write_text("ok", encoding="utf-8")
+
+            issues = list(structure_checker.run_check(root))
+            by_path = {issue.path: issue.message for issue in issues}
+
+            self.assertIn("Pflichtordner fehlt", by_path[root / "src"])
+            self.assertIn("kein Ordner", by_path[root / "tests"])
+            self.assertIn("(.PY)", by_path[nested / "helfer.PY"])
+            self.assertEqual(3, len(issues))
+
+    def test_files_in_place_of_scanned_dirs_report_no_folder(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._build_root(root)
+            for name in ("config", "data", "logs", "system", "src"):
+                (root / name).rmdir()
+                (root / name).write_text("kein Ordner", encoding="utf-8")
+
+            issues = list(structure_checker.run_check(root))
+
+            self.assertEqual(
+                {root / name for name in ("config", "data", "logs", "system", "src")},
+                {issue.path for issue in issues},
+            )
+            for issue in issues:
+                self.assertIn("kein Ordner", issue.message)
+
+    def test_suffix_rules_match_pathlib(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            folder = Path(tmpdir)
+            names = [".py", "skript.", "archiv.tar.SH", "..py", "ok.json"]
+            for name in names:
+                (folder / name).write_text("", encoding="utf-8")
+
+            issues = structure_checker._collect_disallowed(
+                folder, structure_checker.CONFIG_DISALLOWED_SUFFIXES, "Config"
+            )
+
+            expected = {
+                folder / name
+                for name in names
+                if Path(name).suffix.lower() in structure_checker.CONFIG_DISALLOWED_SUFFIXES
+            }
+            self.assertEqual(expected, {issue.path for issue in issues})
+            self.assertEqual(2, len(expected))
+
+    def test_run_check_validates_root_eagerly_and_stops_early(self) -> None:
+        with self.assertRaises(structure_checker.StructureCheckError):
+            structure_checker.run_check("kein Pfad")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            issues = structure_checker.run_check(Path(tmpdir))
+            first = next(issues)
+            self.assertEqual(Path(tmpdir) / "src", first.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
+
+import structure_updater
+
+
+def _write_project(root: Path, version: str = "1.0.0") -> Path:
+    module_dir = root / "modules" / "demo_modul"
+    module_dir.mkdir(parents=True, exist_ok=True)
+    (root / "config").mkdir(exist_ok=True)
+    (root / "config" / "modules.json").write_text(
+        json.dumps(
+            {
+                "modules": [
+                    {
+                        "id": "demo_modul",
+                        "name": "Demo",
+                        "path": "modules/demo_modul",
+                        "enabled": True,
+                        "description": "Test-Modul",
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    (module_dir / "module.py").write_text("", encoding="utf-8")
+    manifest = module_dir / "manifest.json"
+    manifest.write_text(
+        json.dumps({"id": "demo_modul", "name": "Demo", "version": version, "entry": "module.py"}),
+        encoding="utf-8",
+    )
+    return manifest
+
+
+class StructureUpdaterTests(unittest.TestCase):
+    def test_build_tree_sorts_dirs_first_and_skips_hidden(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir) / "projekt"
+            (root / "b_ordner" / "innen").mkdir(parents=True)
+            (root / "A_ordner").mkdir()
+            (root / "node_modules").mkdir()
+            (root / ".versteckt").mkdir()
+            (root / ".well-known").mkdir()
+            (root / "b_ordner" / "innen" / "datei.txt").write_text("", encoding="utf-8")
+            (root / "z.md").write_text("", encoding="utf-8")
+            (root / "Readme.md").write_text("", encoding="utf-8")
+
+            tree = structure_updater.build_tree(root, sorted(structure_updater.DEFAULT_SKIP))
+
+            self.assertEqual(
+                [
+                    "Projektstruktur (projekt)",
+                    "",
+                    "├── .well-known/",
+                    "├── A_ordner/",
+                    "├── b_ordner/",
+                    "│   └── innen/",
+                    "│       └── datei.txt",
+                    "├── Readme.md",
+                    "└── z.md",
+                    "",
+                ],
+                tree[:-1],
+            )
+            self.assertTrue(tree[-1].startswith("Stand: "))
+
+    def test_build_tree_requires_existing_root(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(structure_updater.StructureUpdaterError):
+                structure_updater.build_tree(Path(tmpdir) / "fehlt", [])
+
+    def test_run_update_uses_one_timestamp(self) -> None:
+        root = Path(__file__).resolve().parents[1]
+        result = structure_updater.run_update(
+            root,
+            False,
+            sorted(structure_updater.DEFAULT_SKIP),
+            logging.getLogger("test"),
+            need_payloads=True,
+        )
+        stamp = result.manifest_payload["generated_at"]
+        self.assertEqual(stamp, result.register_payload["generated_at"])
+        self.assertEqual(f"Stand: {stamp}", result.tree_lines[-1])
+
+    def test_module_snapshots_are_cached_until_manifest_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            manifest = _write_project(root)
+            structure_updater._load_manifest_cached.cache_clear()
+
+            first = structure_updater._load_module_snapshots(root)
+            structure_updater._load_module_snapshots(root)
+            self.assertEqual(1, structure_updater._load_manifest_cached.cache_info().hits)
+            self.assertEqual("1.0.0", first[0].version)
+
+            _write_project(root, version="1.1.0")
+            stat_result = manifest.stat()
+            os.utime(manifest, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+            self.assertEqual("1.1.0", structure_updater._load_module_snapshots(root)[0].version)
+
+    def test_run_update_writes_tree_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _write_project(root)
+            (root / "data").mkdir()
+
+            result = structure_updater.run_update(root, True, [], logging.getLogger("test"))
+
+            content = (root / "data" / "baumstruktur.txt").read_text(encoding="utf-8")
+            self.assertEqual("\n".join(result.tree_lines) + "\n", content)
+            manifest = json.loads((root / "data" / "manifest.json").read_text(encoding="utf-8"))
+            self.assertEqual("demo_modul", manifest["modules"][0]["id"])
+
+    def test_dry_run_validates_without_payloads(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            manifest = _write_project(root)
+            logger = logging.getLogger("test")
+
+            result = structure_updater.run_update(root, False, [], logger)
+            self.assertEqual(({}, {}), (result.manifest_payload, result.register_payload))
+            self.assertFalse((root / "data").exists())
+
+            (manifest.parent / "module.py").unlink()
+            with self.assertRaisesRegex(structure_updater.StructureUpdaterError, "Entry-Datei"):
+                structure_updater.run_update(root, False, [], logger)
+
+    def test_run_update_skips_unchanged_project(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _write_project(root)
+            (root / "data").mkdir()
+            logger = logging.getLogger("test")
+            first = structure_updater.run_update(root, True, [], logger)
+            tree_path = root / "data" / "baumstruktur.txt"
+            tree_path.write_text("\n".join(first.tree_lines) + "\n", encoding="utf-8")
+            before = tree_path.stat().st_mtime_ns
+            os.utime(tree_path, ns=(before, before - 1_000_000))
+
+            second = structure_updater.run_update(root, True, [], logger)
+            self.assertEqual(first, second)
+            self.assertEqual(before - 1_000_000, tree_path.stat().st_mtime_ns)
+
+            structure_updater.run_update(root, True, [], logger, force=True)
+            self.assertNotEqual(before - 1_000_000, tree_path.stat().st_mtime_ns)
+
+            (root / "neu.txt").write_text("", encoding="utf-8")
+            third = structure_updater.run_update(root, True, [], logger)
+            self.assertIn("└── neu.txt", third.tree_lines)
+            self.assertNotIn(".structure_fingerprint", "\n".join(third.tree_lines))
+
+    def test_write_run_scans_each_directory_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _write_project(root)
+            (root / "data").mkdir()
+            logger = logging.getLogger("test")
+            with mock.patch.object(
+                structure_updater, "_sorted_entries", wraps=structure_updater._sorted_entries
+            ) as scanned:
+                first = structure_updater.run_update(root, True, [], logger)
+            scanned_paths = [call.args[0] for call in scanned.call_args_list]
+            self.assertEqual(len(set(scanned_paths)), len(scanned_paths))
+
+            # Der nach dem Schreiben gespeicherte Fingerabdruck passt zum nächsten Lauf.
+            with mock.patch.object(structure_updater, "build_tree") as build_tree:
+                second = structure_updater.run_update(root, True, [], logger)
+            build_tree.assert_not_called()
+            self.assertEqual(first.tree_lines, second.tree_lines)
+
+    def test_module_snapshots_keep_config_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            names = [f"modul_{index}" for index in (3, 1, 4, 0, 2)]
+            for name in names:
+                module_dir = root / "modules" / name
+                module_dir.mkdir(parents=True)
+                (module_dir / "module.py").write_text("", encoding="utf-8")
+                (module_dir / "manifest.json").write_text(
+                    json.dumps(
+                        {"id": name, "name": name, "version": "1.0.0", "entry": "module.py"}
+                    ),
+                    encoding="utf-8",
+                )
+            (root / "config").mkdir()
+            (root / "config" / "modules.json").write_text(
+                json.dumps(
+                    {
+                        "modules": [
+                            {
+                                "id": name,
+                                "name": name,
+                                "path": f"modules/{name}",
+                                "enabled": True,
+                                "description": "Test-Modul",
+                            }
+                            for name in names
+                        ]
+                    }
+                ),
+                encoding="utf-8",
+            )
+
+            snapshots = structure_updater._load_module_snapshots(root)
+
+            self.assertEqual(names, [snapshot.module_id for snapshot in snapshots])
+
+    def test_module_path_must_be_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            manifest = _write_project(root)
+            module_dir = manifest.parent
+            for child in module_dir.iterdir():
+                child.unlink()
+            module_dir.rmdir()
+            module_dir.write_text("", encoding="utf-8")
+
+            with self.assertRaisesRegex(structure_updater.StructureUpdaterError, "kein Ordner"):
+                structure_updater._load_module_snapshots(root)
+
+    def test_missing_modules_config_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(structure_updater.StructureUpdaterError):
+                structure_updater._load_module_snapshots(Path(tmpdir))
+
+
+if __name__ == "__main__":
+    unittest.main()
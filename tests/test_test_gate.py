@@ -0,0 +1,55 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
+
+import test_gate
+
+
+class TestGateCountTests(unittest.TestCase):
+    def test_count_tasks_requires_text_after_bracket(self):
+        text = "[x] Fertig\n  [X] Eingerückt\n[ ] Offen\n[x]\n[x]ohne Abstand\nNotiz [x] Text\n"
+        self.assertEqual((3, 2), test_gate.count_tasks((text,)))
+        self.assertEqual((3, 2), test_gate.count_tasks(text.splitlines()))
+
+    def test_count_tasks_handles_other_line_breaks(self):
+        self.assertEqual((2, 1), test_gate.count_tasks(("[x] a\x0c[ ] b Text",)))
+
+    def test_save_state_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "data" / "test_state.json"
+
+            test_gate.save_state(state_path, 7, "ok")
+
+            state = test_gate.load_state(state_path)
+            self.assertEqual((7, "ok"), (state.last_done, state.last_result))
+            self.assertEqual("ok", json.loads(state_path.read_bytes())["last_result"])
+            self.assertEqual(["test_state.json"], [p.name for p in state_path.parent.iterdir()])
+
+    def test_run_tests_returns_exit_code(self):
+        self.assertEqual(0, test_gate.run_tests([sys.executable, "-c", "pass"]))
+        self.assertEqual(3, test_gate.run_tests([sys.executable, "-c", "raise SystemExit(3)"]))
+
+    def test_load_config_reads_binary_json(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "test_gate.json"
+            config_path.write_text(
+                json.dumps({"threshold": 2, "todo_path": "aufgaben.txt"}), encoding="utf-8"
+            )
+
+            config = test_gate.load_config(config_path)
+            self.assertEqual(2, config.threshold)
+            self.assertEqual("aufgaben.txt", config.todo_path.name)
+
+            config_path.write_text("{kaputt", encoding="utf-8")
+            with self.assertRaisesRegex(test_gate.TestGateError, "kein gültiges JSON"):
+                test_gate.load_config(config_path)
+            with self.assertRaisesRegex(test_gate.TestGateError, "fehlt"):
+                test_gate.load_config(Path(tmpdir) / "fehlt.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import functools
 import importlib.util
 import json
 import sys
@@ -12,7 +13,9 @@ for import_path in (ROOT, ROOT / "system"):
         sys.path.insert(0, str(import_path))
 
 
+@functools.lru_cache(maxsize=None)
 def load_module():
+    # Einmal je Prozess laden; weitere Aufrufe liefern dasselbe Modulobjekt.
     module_path = ROOT / "modules" / "todo_kalender" / "module.py"
     spec = importlib.util.spec_from_file_location("todo_kalender_module", module_path)
     module = importlib.util.module_from_spec(spec)
@@ -1,14 +1,23 @@
-import sys
+import copy
+import pickle
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 from todo_manager import (
     Progress,
+    TodoError,
     archive_completed_tasks,
+    build_progress_report,
     calculate_progress,
+    iter_todo_lines,
+    load_config,
+    parse_status,
+    progress_from_bytes,
+    progress_from_text,
+    read_todo_bytes,
     write_progress_report,
 )
 
@@ -21,6 +30,65 @@ class TodoManagerTests(unittest.TestCase):
         self.assertEqual(progress.done, 1)
         self.assertEqual(progress.percent, 50.0)
 
+    def test_progress_from_text_matches_line_rules(self):
+        text = "  [X] Eingerückt\n[ ]\nText [x] mitten\n\t[ ] Tab\r\n[x]ohne Abstand\n[y] nein"
+        progress = progress_from_text(text)
+        self.assertEqual((4, 2), (progress.total, progress.done))
+        self.assertEqual(progress, calculate_progress(text.splitlines(keepends=True)))
+
+    def test_progress_from_bytes_matches_text(self):
+        text = "# Kopf\n  [X] Eingerückt\nText [x] mitten\n[ ] Offen\u2028[x] Umbruch\n"
+        self.assertEqual(progress_from_text(text), progress_from_bytes(text.encode("utf-8")))
+        self.assertEqual(Progress(total=0, done=0), progress_from_bytes(b"# nur Text\n"))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(TodoError):
+                read_todo_bytes(Path(tmpdir) / "fehlt.txt")
+
+    def test_iter_todo_lines_streams_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            todo_path = Path(tmpdir) / "todo.txt"
+            todo_path.write_text("# Kopf\n[x] Fertig\n[ ] Offen\n", encoding="utf-8")
+
+            progress = calculate_progress(iter_todo_lines(todo_path))
+
+            self.assertEqual((2, 1), (progress.total, progress.done))
+            with self.assertRaises(TodoError):
+                list(iter_todo_lines(Path(tmpdir) / "fehlt.txt"))
+
+    def test_progress_percent_is_a_field(self):
+        progress = Progress(total=3, done=1)
+
+        self.assertEqual(33.33, progress.percent)
+        self.assertEqual(0.0, Progress(total=0, done=0).percent)
+        self.assertEqual(progress, copy.copy(progress))
+        self.assertEqual(progress, pickle.loads(pickle.dumps(progress)))
+        self.assertFalse(hasattr(progress, "__dict__"))
+
+    def test_progress_report_requires_plain_date(self):
+        progress = Progress(total=2, done=1)
+
+        self.assertIn("Stand: 2026-10-16", build_progress_report(progress, "2026-10-16"))
+        with self.assertRaises(TodoError):
+            build_progress_report(progress, "2026-10-16T00:00:00")
+
+    def test_load_config_reports_missing_and_invalid_json(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "todo_config.json"
+            config_path.write_text('{"todo_path": "ä.txt"}', encoding="utf-8")
+            self.assertEqual(Path("ä.txt"), load_config(config_path).todo_path)
+
+            config_path.write_text("{kaputt", encoding="utf-8")
+            with self.assertRaisesRegex(TodoError, "kein gültiges JSON"):
+                load_config(config_path)
+            with self.assertRaisesRegex(TodoError, "fehlt"):
+                load_config(Path(tmpdir) / "fehlt.json")
+
+    def test_parse_status_uses_prefix(self):
+        self.assertEqual((True, True), parse_status("[X] Fertig"))
+        self.assertEqual((True, False), parse_status("[ ]"))
+        self.assertEqual((False, False), parse_status("[y] nein"))
+        self.assertEqual((False, False), parse_status("[x"))
+
     def test_archive_completed_tasks_moves_done_entries(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             base = Path(tmpdir)
@@ -37,6 +105,74 @@ class TodoManagerTests(unittest.TestCase):
             self.assertIn("Fertig", archive_content)
             self.assertIn("archiviert", archive_content)
 
+    def test_archive_uses_one_timestamp_per_run(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            todo_path = base / "todo.txt"
+            archive_path = base / "archive.txt"
+            todo_path.write_text("[x] Eins\n[X] Zwei\n[x] Drei\n", encoding="utf-8")
+            stamps = iter(["2026-01-01T00:00:00+00:00", "2026-01-01T00:00:01+00:00"])
+
+            with mock.patch("todo_manager._utc_now_iso", side_effect=lambda: next(stamps)):
+                archived, _ = archive_completed_tasks(todo_path, archive_path)
+
+            lines = archive_path.read_text(encoding="utf-8").splitlines()[1:]
+            self.assertEqual(3, archived)
+            self.assertTrue(
+                all(line.endswith("archiviert: 2026-01-01T00:00:00+00:00") for line in lines)
+            )
+
+    def test_archive_still_rejects_text_paths(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            with self.assertRaises(TodoError):
+                archive_completed_tasks(str(base / "todo.txt"), base / "archiv.txt")
+            with self.assertRaises(TodoError):
+                archive_completed_tasks(base / "todo.txt", str(base / "archiv.txt"))
+
+    def test_archive_appends_once_with_single_header(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            todo_path = base / "todo.txt"
+            archive_path = base / "archiv" / "todo_archive.txt"
+            todo_path.write_text("[x] Eins\n[ ] Offen\n", encoding="utf-8")
+            archive_completed_tasks(todo_path, archive_path)
+            todo_path.write_text("[X] Zwei\n[ ] Offen\n", encoding="utf-8")
+
+            archive_completed_tasks(todo_path, archive_path)
+
+            lines = archive_path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual("# Archiv für erledigte To-Dos", lines[0])
+            self.assertEqual(3, len(lines))
+            self.assertTrue(lines[2].startswith("[X] Zwei | archiviert: "))
+            self.assertEqual("[ ] Offen\n", todo_path.read_text(encoding="utf-8"))
+            self.assertEqual({"todo.txt", "archiv"}, {path.name for path in base.iterdir()})
+
+    def test_archive_keeps_line_endings_and_skips_rewrite_without_done(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            todo_path = base / "todo.txt"
+            archive_path = base / "archiv.txt"
+            todo_path.write_bytes(b"[x] Fertig\r\n[ ] Offen\r\n")
+
+            self.assertEqual((1, 1), archive_completed_tasks(todo_path, archive_path))
+            self.assertEqual(b"[ ] Offen\r\n", todo_path.read_bytes())
+            with mock.patch("todo_manager.write_todo_lines") as write_lines:
+                self.assertEqual((0, 1), archive_completed_tasks(todo_path, archive_path))
+            write_lines.assert_not_called()
+
+    def test_write_progress_report_skips_unchanged_content(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            progress_path = Path(tmpdir) / "PROGRESS.md"
+            write_progress_report(Progress(total=4, done=1), progress_path)
+
+            with mock.patch.object(Path, "write_bytes") as write_bytes:
+                write_progress_report(Progress(total=4, done=1), progress_path)
+            write_bytes.assert_not_called()
+
+            write_progress_report(Progress(total=4, done=2), progress_path)
+            self.assertIn("- Erledigt: 2 Tasks", progress_path.read_text(encoding="utf-8"))
+
     def test_write_progress_report_creates_progress_file(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             progress_path = Path(tmpdir) / "PROGRESS.md"
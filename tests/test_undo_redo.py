@@ -1,10 +1,16 @@
-import sys
+import gc
 import unittest
-from pathlib import Path
+from unittest import mock
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "system"))
-
-from undo_redo import UndoRedoAction, UndoRedoManager
+import _paths  # noqa: F401  (setzt die Suchpfade)
+from undo_redo import (
+    MAX_UNDO_STACK_SIZE,
+    RestoreOp,
+    UndoRedoAction,
+    UndoRedoError,
+    UndoRedoManager,
+    intern_metadata,
+)
 
 
 class UndoRedoTests(unittest.TestCase):
@@ -32,6 +38,200 @@ class UndoRedoTests(unittest.TestCase):
         self.assertEqual("Wert auf 1", action.name)
         self.assertEqual(1, state["value"])
 
+    def test_limit_drops_oldest_action(self):
+        manager = UndoRedoManager(limit=2)
+        for index in range(3):
+            manager.record(UndoRedoAction(name=f"A{index}", undo=lambda: None, redo=lambda: None))
+
+        self.assertEqual("A2", manager.undo().name)
+        self.assertEqual("A1", manager.undo().name)
+        self.assertFalse(manager.can_undo())
+        self.assertEqual("A1", manager.peek_redo().name)
+
+    def test_action_validates_callbacks_on_creation(self):
+        with self.assertRaises(UndoRedoError):
+            UndoRedoAction(name="kaputt", undo=None, redo=lambda: None)
+        with self.assertRaises(UndoRedoError):
+            UndoRedoManager().record("keine Aktion")
+        self.assertFalse(hasattr(UndoRedoAction("A", lambda: None, lambda: None), "__dict__"))
+        self.assertFalse(hasattr(RestoreOp("B", "text", 1, b""), "__dict__"))
+
+    def test_record_after_undo_discards_redo(self):
+        manager = UndoRedoManager()
+        manager.record(UndoRedoAction(name="A", undo=lambda: None, redo=lambda: None))
+        manager.undo()
+        self.assertTrue(manager.can_redo())
+
+        manager.record(UndoRedoAction(name="B", undo=lambda: None, redo=lambda: None))
+
+        self.assertFalse(manager.can_redo())
+        self.assertEqual("B", manager.peek_undo().name)
+
+    def test_ring_buffer_wraps_and_releases_discarded_redo(self):
+        manager = UndoRedoManager(limit=3)
+        for index in range(5):
+            manager.record(UndoRedoAction(name=f"A{index}", undo=lambda: None, redo=lambda: None))
+        manager.undo()
+        manager.undo()
+
+        manager.record(UndoRedoAction(name="B", undo=lambda: None, redo=lambda: None))
+
+        names = [action.name for action in manager._buffer if action is not None]
+        self.assertEqual(["A2", "B"], sorted(names))
+        self.assertEqual("B", manager.undo().name)
+        self.assertEqual("A2", manager.undo().name)
+        self.assertFalse(manager.can_undo())
+
+    def test_failed_undo_keeps_action(self):
+        manager = UndoRedoManager()
+
+        def fail() -> None:
+            raise RuntimeError("kaputt")
+
+        manager.record(UndoRedoAction(name="A", undo=fail, redo=lambda: None))
+        with self.assertRaises(RuntimeError):
+            manager.undo()
+
+        self.assertEqual("A", manager.peek_undo().name)
+        self.assertFalse(manager.can_redo())
+
+    def test_restore_op_uses_registered_applier(self):
+        manager = UndoRedoManager()
+        texts = {7: "neu"}
+
+        def apply_text(anchor_id: int, diff: bytes, undo: bool) -> None:
+            old, new = diff.split(b"\0")
+            texts[anchor_id] = (old if undo else new).decode("utf-8")
+
+        with self.assertRaises(UndoRedoError):
+            manager.record_diff("Text", "text", 7, b"alt\0neu")
+        manager.register_applier("text", apply_text)
+        operation = manager.record_diff("Text", "text", 7, b"alt\0neu")
+
+        self.assertIsInstance(operation, RestoreOp)
+        self.assertEqual("Text", manager.undo().name)
+        self.assertEqual("alt", texts[7])
+        manager.redo()
+        self.assertEqual("neu", texts[7])
+
+    def test_metadata_is_shared_and_read_only(self):
+        first = UndoRedoAction(name="A", undo=lambda: None, redo=lambda: None)
+        second = UndoRedoAction(name="B", undo=lambda: None, redo=lambda: None)
+        self.assertIs(first.metadata, second.metadata)
+
+        shared = intern_metadata((("bereich", "UI"),))
+        self.assertIs(shared, intern_metadata((("bereich", "UI"),)))
+        self.assertEqual({"bereich": "UI"}, dict(shared))
+        with self.assertRaises(TypeError):
+            shared["bereich"] = "Daten"
+
+    def test_record_group_undoes_batch_in_one_step(self):
+        manager = UndoRedoManager()
+        calls = []
+
+        def action(label: str) -> UndoRedoAction:
+            return UndoRedoAction(
+                name=label,
+                undo=lambda: calls.append(f"undo {label}"),
+                redo=lambda: calls.append(f"redo {label}"),
+            )
+
+        with manager.record_group("Markieren"):
+            manager.record(action("A"))
+            with manager.record_group("innen"):
+                manager.record(action("B"))
+            manager.record(action("C"))
+        with manager.record_group("leer"):
+            pass
+
+        self.assertEqual("Markieren", manager.undo().name)
+        self.assertFalse(manager.can_undo())
+        self.assertEqual(["undo C", "undo B", "undo A"], calls)
+        manager.redo()
+        self.assertEqual(["redo A", "redo B", "redo C"], calls[3:])
+
+    def test_peek_at_history_edges(self):
+        manager = UndoRedoManager(limit=2)
+        self.assertEqual((None, None), (manager.peek_undo(), manager.peek_redo()))
+        for index in range(3):
+            manager.record(UndoRedoAction(name=f"A{index}", undo=lambda: None, redo=lambda: None))
+        manager.undo()
+        manager.undo()
+
+        self.assertIsNone(manager.peek_undo())
+        self.assertEqual("A1", manager.peek_redo().name)
+        manager.redo()
+        manager.redo()
+        self.assertEqual("A2", manager.peek_undo().name)
+        self.assertIsNone(manager.peek_redo())
+
+    def test_callbacks_are_checked_once_per_action(self):
+        manager = UndoRedoManager()
+        with mock.patch("undo_redo.callable", create=True, side_effect=callable) as checked:
+            action = UndoRedoAction(name="A", undo=lambda: None, redo=lambda: None)
+            self.assertEqual(2, checked.call_count)
+            manager.record(action)
+            manager.undo()
+            manager.redo()
+            self.assertEqual(2, checked.call_count)
+
+    def test_buffer_is_allocated_once(self):
+        manager = UndoRedoManager(limit=4)
+        buffer = manager._buffer
+        self.assertEqual(5, len(buffer))
+
+        for index in range(20):
+            manager.record(UndoRedoAction(name=f"A{index}", undo=lambda: None, redo=lambda: None))
+            if index % 3 == 0:
+                manager.undo()
+
+        self.assertIs(buffer, manager._buffer)
+        self.assertEqual(5, len(buffer))
+
+    def test_bind_weak_does_not_keep_target_alive(self):
+        class Dokument:
+            def __init__(self) -> None:
+                self.text = "neu"
+
+            def set_text(self, text: str) -> None:
+                self.text = text
+
+        manager = UndoRedoManager()
+        document = Dokument()
+        manager.record(UndoRedoAction.bind_weak("Text", document, "set_text", "set_text", "alt"))
+
+        manager.undo()
+        self.assertEqual("alt", document.text)
+        with self.assertRaises(UndoRedoError):
+            UndoRedoAction.bind_weak("Text", document, "fehlt", "set_text")
+
+        del document
+        gc.collect()
+        with self.assertLogs("undo_redo", level="DEBUG"):
+            manager.redo()
+
+    def test_manager_has_no_instance_dict(self):
+        manager = UndoRedoManager()
+        self.assertFalse(hasattr(manager, "__dict__"))
+        with self.assertRaises(AttributeError):
+            manager.tippfehler = 1
+
+    def test_limit_is_clamped_and_trim_drops_edges(self):
+        with self.assertLogs("undo_redo", level="WARNING"):
+            self.assertEqual(MAX_UNDO_STACK_SIZE, UndoRedoManager(limit=10**9).limit)
+
+        manager = UndoRedoManager(limit=5)
+        for index in range(5):
+            manager.record(UndoRedoAction(name=f"A{index}", undo=lambda: None, redo=lambda: None))
+        manager.undo()
+        manager.undo()
+
+        self.assertEqual(3, manager.trim(1))
+        self.assertEqual(("A2", "A3"), (manager.peek_undo().name, manager.peek_redo().name))
+        self.assertEqual(2, sum(action is not None for action in manager._buffer))
+        manager.undo()
+        self.assertFalse(manager.can_undo())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ import threading
 import urllib.request
 from http import HTTPStatus
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -232,6 +233,14 @@ def test_health_endpoint_served_over_real_loopback_socket(tmp_path: Path) -> Non
         thread.join(timeout=5)
 
 
+def test_json_responses_accept_read_only_module_config() -> None:
+    payload = {"ui": MappingProxyType({"menus": (MappingProxyType({"label": "Neu"}),)})}
+    text = json.dumps(payload, default=web_server._json_default)
+    assert json.loads(text) == {"ui": {"menus": [{"label": "Neu"}]}}
+    with pytest.raises(TypeError):
+        json.dumps({"pfad": Path("x")}, default=web_server._json_default)
+
+
 def test_browser_resolution_prefers_google_chrome(monkeypatch, tmp_path: Path) -> None:
     config = _config(tmp_path)
     monkeypatch.setattr(
@@ -1,13 +1,15 @@
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src" / "records"))
-
+import _paths  # noqa: F401  (setzt die Suchpfade)
 from zip_exporter import ZipExportConfig, load_state, run_zip_export
 
+_INITIAL_STATE_JSON = json.dumps(
+    {"pending_steps": 0, "export_index": 0, "last_export": None}
+).encode("utf-8")
+
 
 class ZipExporterTests(unittest.TestCase):
     def test_run_zip_export_creates_archive(self):
@@ -15,12 +17,9 @@ class ZipExporterTests(unittest.TestCase):
             root = Path(tmpdir)
             (root / "data").mkdir()
             (root / "data" / "exports").mkdir(parents=True)
-            (root / "file.txt").write_text("hi", encoding="utf-8")
+            (root / "file.txt").write_bytes(b"hi")
             state_path = root / "data" / "zip_export_state.json"
-            state_path.write_text(
-                json.dumps({"pending_steps": 0, "export_index": 0, "last_export": None}),
-                encoding="utf-8",
-            )
+            state_path.write_bytes(_INITIAL_STATE_JSON)
 
             config = ZipExportConfig(
                 enabled=True,